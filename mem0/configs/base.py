@@ -1,5 +1,5 @@
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -26,6 +26,23 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class ExecutorConfig(BaseModel):
+    max_workers: Optional[int] = Field(
+        description="Number of threads in the pool shared by a Memory instance. Defaults to the ThreadPoolExecutor default",
+        default=None,
+    )
+    thread_name_prefix: str = Field(description="Prefix of the names of the pool's threads", default="mem0")
+
+
+class AddWindowConfig(BaseModel):
+    max_messages: int = Field(
+        description="Number of buffered messages of a session at which its window is extracted", default=10
+    )
+    max_seconds: float = Field(
+        description="Seconds after its first buffered message at which a session's window is extracted", default=5.0
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -59,6 +76,34 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    add_pipeline: Literal["two_pass", "single_pass"] = Field(
+        description=(
+            "How inferred adds call the LLM: 'two_pass' extracts facts, then reconciles them with the memories "
+            "related to each fact in a second call; 'single_pass' retrieves the memories related to the "
+            "conversation first and extracts and reconciles facts in one call"
+        ),
+        default="two_pass",
+    )
+    update_similarity_threshold: Optional[float] = Field(
+        description=(
+            "Similarity score below which a related memory is ignored when deciding whether an extracted fact "
+            "needs the update LLM call; facts with no related memory above it are added directly. Only meaningful "
+            "for vector stores whose scores are similarities (higher is closer). Defaults to sending every fact "
+            "with related memories to the LLM"
+        ),
+        default=None,
+    )
+    executor: ExecutorConfig = Field(
+        description="Configuration for the thread pool running internal fan-out",
+        default_factory=ExecutorConfig,
+    )
+    add_window: Optional[AddWindowConfig] = Field(
+        description=(
+            "Buffer the inferred adds of each (user_id, agent_id, run_id) session and extract them together "
+            "once the window is full or old enough. Defaults to extracting every add immediately"
+        ),
+        default=None,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -40,6 +40,9 @@ class BaseEmbedderConfig(ABC):
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         aws_region: Optional[str] = None,
+        # Batching
+        batch_size: Optional[int] = 100,
+        batch_max_tokens: Optional[int] = None,
     ):
         """
         Initializes a configuration class instance for the Embeddings.
@@ -72,6 +75,10 @@ class BaseEmbedderConfig(ABC):
         :type memory_search_embedding_type: Optional[str], optional
         :param lmstudio_base_url: LM Studio base URL to be use, defaults to "http://localhost:1234/v1"
         :type lmstudio_base_url: Optional[str], optional
+        :param batch_size: Maximum number of texts sent in one embedding request by `embed_batch`, defaults to 100
+        :type batch_size: Optional[int], optional
+        :param batch_max_tokens: Approximate maximum number of tokens sent in one embedding request, defaults to None
+        :type batch_max_tokens: Optional[int], optional
         """
 
         self.model = model
@@ -108,3 +115,6 @@ class BaseEmbedderConfig(ABC):
         self.aws_secret_access_key = aws_secret_access_key
         self.aws_region = aws_region or os.environ.get("AWS_REGION") or "us-west-2"
 
+        # Batching
+        self.batch_size = batch_size
+        self.batch_max_tokens = batch_max_tokens
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
@@ -13,6 +13,42 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    persistence: Literal["immediate", "debounced", "manual"] = Field(
+        "immediate",
+        description=(
+            "When to snapshot the index to disk: after every mutation ('immediate'), every flush_interval_ms or "
+            "flush_every_n_ops mutations ('debounced'), or only on flush() ('manual'). Mutations between snapshots "
+            "are kept in an append-only log"
+        ),
+    )
+    flush_interval_ms: int = Field(1000, description="Maximum age of unsnapshotted mutations in 'debounced' mode")
+    flush_every_n_ops: int = Field(100, description="Maximum number of unsnapshotted mutations in 'debounced' mode")
+    index_type: Literal["flat", "hnsw", "ivf"] = Field(
+        "flat", description="FAISS index structure: exact search ('flat'), or approximate search ('hnsw', 'ivf')"
+    )
+    compression: Optional[Literal["pq", "sq8"]] = Field(
+        None, description="Vector compression: product quantization ('pq'), 8-bit scalar quantization ('sq8') or None"
+    )
+    hnsw_m: int = Field(32, description="Number of neighbours per node in the HNSW graph")
+    hnsw_ef_construction: int = Field(40, description="Candidate list size used while building the HNSW graph")
+    hnsw_ef_search: int = Field(16, description="Candidate list size used while searching the HNSW graph")
+    ivf_nlist: int = Field(100, description="Number of inverted lists (clusters) for the IVF index")
+    ivf_nprobe: int = Field(10, description="Number of inverted lists visited per IVF search")
+    pq_m: int = Field(8, description="Number of PQ sub-quantizers; must divide embedding_model_dims")
+    train_min_vectors: Optional[int] = Field(
+        None,
+        description=(
+            "Number of vectors needed before an index that requires training is built. Until then vectors are "
+            "kept in a flat index. Defaults to a size suited to the index spec"
+        ),
+    )
+    shard_by: Optional[Literal["user_id"]] = Field(
+        None, description="Split the collection into one FAISS index per value of this payload key"
+    )
+    shard_buckets: Optional[int] = Field(
+        None, description="Hash shard_by values into this many shards instead of one shard per value"
+    )
+    max_resident_shards: int = Field(32, description="Maximum number of shards kept loaded in memory")
 
     @model_validator(mode="before")
     @classmethod
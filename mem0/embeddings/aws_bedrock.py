@@ -19,6 +19,9 @@ class AWSBedrockEmbedding(EmbeddingBase):
     This class uses AWS Bedrock's embedding models.
     """
 
+    # Cohere models on Bedrock accept at most 96 texts per request.
+    max_batch_size = 96
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -98,3 +101,33 @@ class AWSBedrockEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         return self._get_embedding(text)
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts using AWS Bedrock.
+
+        Cohere models accept several texts per request; other providers (e.g. Titan)
+        only embed one input per call, so those texts are embedded one by one.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        provider = self.config.model.split(".")[0]
+        if provider != "cohere":
+            return [self._get_embedding(text) for text in texts]
+
+        body = json.dumps({"input_type": "search_document", "texts": texts})
+        try:
+            response = self.client.invoke_model(
+                body=body,
+                modelId=self.config.model,
+                accept="application/json",
+                contentType="application/json",
+            )
+            response_body = json.loads(response.get("body").read())
+            return response_body.get("embeddings")
+        except Exception as e:
+            raise ValueError(f"Error getting embedding from AWS Bedrock: {e}")
@@ -1,7 +1,62 @@
+import asyncio
+import contextvars
+import functools
+import inspect
 from abc import ABC, abstractmethod
 from typing import Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.llms.limiter import estimate_tokens
+
+# Set while a rate limited embedding call runs, so that nested calls (e.g. a provider's `_embed_batch`
+# calling `embed`) are not paced and retried a second time
+_embedding_rate_limited = contextvars.ContextVar("_embedding_rate_limited", default=False)
+
+
+def _wrap_embedding_call(method, batch: bool):
+    """
+    Wrap a provider's `embed`, `_embed_batch`, `aembed` or `_aembed_batch` so that calls are paced
+    and retried by `self.rate_limiter` when one is attached. The call is charged the estimated
+    tokens of its text(s).
+    """
+
+    def rate_limiter_for_call(self):
+        rate_limiter = getattr(self, "rate_limiter", None)
+        return None if _embedding_rate_limited.get() else rate_limiter
+
+    def tokens_for_call(text):
+        return sum(estimate_tokens(str(item)) for item in text) if batch else estimate_tokens(str(text))
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(self, text, *args, **kwargs):
+            rate_limiter = rate_limiter_for_call(self)
+            if rate_limiter is None:
+                return await method(self, text, *args, **kwargs)
+            token = _embedding_rate_limited.set(True)
+            try:
+                return await rate_limiter.arun(
+                    functools.partial(method, self, text, *args, **kwargs), tokens_for_call(text)
+                )
+            finally:
+                _embedding_rate_limited.reset(token)
+
+    else:
+
+        @functools.wraps(method)
+        def wrapper(self, text, *args, **kwargs):
+            rate_limiter = rate_limiter_for_call(self)
+            if rate_limiter is None:
+                return method(self, text, *args, **kwargs)
+            token = _embedding_rate_limited.set(True)
+            try:
+                return rate_limiter.run(functools.partial(method, self, text, *args, **kwargs), tokens_for_call(text))
+            finally:
+                _embedding_rate_limited.reset(token)
+
+    wrapper._embedding_call_wrapped = True
+    return wrapper
 
 
 class EmbeddingBase(ABC):
@@ -11,12 +66,25 @@ class EmbeddingBase(ABC):
     :type config: Optional[BaseEmbedderConfig], optional
     """
 
+    # Upper bound on inputs per request imposed by the provider API, if any.
+    max_batch_size: Optional[int] = None
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         if config is None:
             self.config = BaseEmbedderConfig()
         else:
             self.config = config
 
+        # Optional RateLimiter shared by the provider and model, attached by EmbedderFactory when `embedder.rate_limit` is set
+        self.rate_limiter = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, batch in (("embed", False), ("_embed_batch", True), ("aembed", False), ("_aembed_batch", True)):
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_embedding_call_wrapped", False):
+                setattr(cls, name, _wrap_embedding_call(method, batch))
+
     @abstractmethod
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]]):
         """
@@ -29,3 +97,105 @@ class EmbeddingBase(ABC):
             list: The embedding vector.
         """
         pass
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts.
+
+        The texts are split into requests of at most `batch_size` inputs and roughly
+        `batch_max_tokens` tokens (both taken from the embedder config), and each
+        request is sent through `_embed_batch`.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        embeddings = []
+        for batch in self._split_batches(texts):
+            embeddings.extend(self._embed_batch(batch, memory_action))
+        return embeddings
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Embed a single request-sized batch of texts.
+
+        Providers whose APIs accept several inputs per request override this. The
+        default embeds each text with `embed`.
+        """
+        return [self.embed(text, memory_action) for text in texts]
+
+    def _split_batches(self, texts):
+        """Yield consecutive slices of `texts` that respect the configured batch limits."""
+        batch_size = getattr(self.config, "batch_size", None) or len(texts) or 1
+        if self.max_batch_size:
+            batch_size = min(batch_size, self.max_batch_size)
+        max_tokens = getattr(self.config, "batch_max_tokens", None)
+
+        batch, batch_tokens = [], 0
+        for text in texts:
+            # Rough token estimate (~4 characters per token); avoids a tokenizer dependency.
+            tokens = len(text) // 4 + 1
+            if batch and (len(batch) >= batch_size or (max_tokens and batch_tokens + tokens > max_tokens)):
+                yield batch
+                batch, batch_tokens = [], 0
+            batch.append(text)
+            batch_tokens += tokens
+        if batch:
+            yield batch
+
+
+class AsyncEmbeddingBase(ABC):
+    """
+    Optional native async interface of an embedder.
+
+    Embedders whose provider has an async client mix this into their `EmbeddingBase`
+    subclass; `AsyncMemory` awaits these methods instead of running the sync ones in
+    a worker thread.
+    """
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether the async methods can be used; implementations may depend on their configuration."""
+        return True
+
+    @abstractmethod
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text asynchronously.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        pass
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts asynchronously.
+
+        The texts are split into requests like in `embed_batch`, and each request is
+        sent through `_aembed_batch`.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        embeddings = []
+        for batch in self._split_batches(texts):
+            embeddings.extend(await self._aembed_batch(batch, memory_action))
+        return embeddings
+
+    async def _aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Embed a single request-sized batch of texts asynchronously.
+
+        Providers whose APIs accept several inputs per request override this. The
+        default embeds the texts concurrently with `aembed`.
+        """
+        return list(await asyncio.gather(*(self.aembed(text, memory_action) for text in texts)))
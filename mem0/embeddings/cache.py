@@ -0,0 +1,234 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
+
+from mem0.configs.base import mem0_dir
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store of embedding vectors.
+
+    Lookups go to an in-process LRU first and then, when enabled, to a SQLite
+    file so that embeddings survive restarts. Hit and miss counters are kept
+    for both tiers and exposed through `stats()`.
+    """
+
+    def __init__(self, max_size: int = 10000, persistent: bool = False, path: Optional[str] = None):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.persistent_hits = 0
+
+        self.path = None
+        self.connection = None
+        if persistent:
+            self.path = path or os.path.join(mem0_dir, "embedding_cache.db")
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+            self.connection.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """Return the cached vectors for the given keys; keys that are not cached are left out."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    found[key] = self._entries[key]
+
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if missing and self.connection is not None:
+                placeholders = ", ".join("?" for _ in missing)
+                rows = self.connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", missing
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("d", blob).tolist()
+                    found[key] = vector
+                    self._remember(key, vector)
+                    self.persistent_hits += 1
+
+            for key in keys:
+                if key in found:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]):
+        """Store vectors in every enabled tier."""
+        if not items:
+            return
+        with self._lock:
+            for key, vector in items.items():
+                self._remember(key, list(vector))
+
+            if self.connection is not None:
+                try:
+                    self.connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, array("d", vector).tobytes()) for key, vector in items.items()],
+                    )
+                    self.connection.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist embeddings to cache: {e}")
+
+    def _remember(self, key: str, vector: List[float]):
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters and the current size of the in-process tier."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "persistent_hits": self.persistent_hits,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+            }
+
+    def clear(self):
+        """Drop every cached vector and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.persistent_hits = 0
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM embeddings")
+                self.connection.commit()
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class CachedEmbedding(EmbeddingBase, AsyncEmbeddingBase):
+    """
+    Embedder wrapper that serves repeated texts from an `EmbeddingCache`.
+
+    Entries are keyed on (provider, model, dims, memory_action, sha256(text)), so
+    switching any of those never returns a stale vector. Attributes that are not
+    defined here are forwarded to the wrapped embedder. The async methods are
+    available when the wrapped embedder implements `AsyncEmbeddingBase`.
+    """
+
+    def __init__(self, embedder: EmbeddingBase, provider: str, cache: EmbeddingCache):
+        super().__init__(embedder.config)
+        self.embedder = embedder
+        self.provider = provider
+        self.cache = cache
+
+    def __getattr__(self, name):
+        # Only called when normal lookup fails, e.g. provider-specific attributes such as `client`.
+        if name == "embedder":
+            raise AttributeError(name)
+        return getattr(self.embedder, name)
+
+    @property
+    def supports_async(self) -> bool:
+        return isinstance(self.embedder, AsyncEmbeddingBase) and self.embedder.supports_async
+
+    def _cache_key(self, text: str, memory_action: Optional[str]) -> str:
+        model = self.config.model if isinstance(self.config.model, str) else type(self.config.model).__name__
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.provider}:{model}:{self.config.embedding_dims}:{memory_action}:{digest}"
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, calling the provider only on a cache miss.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        key = self._cache_key(text, memory_action)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
+        embedding = self.embedder.embed(text, memory_action)
+        self.cache.set_many({key: embedding})
+        return embedding
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts, sending only the cache misses to the provider.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        keys = [self._cache_key(text, memory_action) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            embeddings = self.embedder.embed_batch(list(missing.values()), memory_action)
+            fresh = dict(zip(missing.keys(), embeddings))
+            self.cache.set_many(fresh)
+            cached.update(fresh)
+
+        return [cached[key] for key in keys]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text asynchronously, calling the provider only on a cache miss.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        key = self._cache_key(text, memory_action)
+        cached = self.cache.get_many([key])
+        if key in cached:
+            return cached[key]
+
+        embedding = await self.embedder.aembed(text, memory_action)
+        self.cache.set_many({key: embedding})
+        return embedding
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts asynchronously, sending only the cache misses to the provider.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        keys = [self._cache_key(text, memory_action) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if missing:
+            embeddings = await self.embedder.aembed_batch(list(missing.values()), memory_action)
+            fresh = dict(zip(missing.keys(), embeddings))
+            self.cache.set_many(fresh)
+            cached.update(fresh)
+
+        return [cached[key] for key in keys]
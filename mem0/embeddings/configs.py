@@ -2,6 +2,20 @@ from typing import Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+from mem0.llms.configs import RateLimitConfig
+
+
+class EmbeddingCacheConfig(BaseModel):
+    enabled: bool = Field(description="Whether to cache embeddings returned by the provider", default=False)
+    max_size: int = Field(description="Maximum number of embeddings kept in the in-process LRU tier", default=10000)
+    persistent: bool = Field(
+        description="Whether to also keep embeddings in a SQLite file that survives restarts", default=False
+    )
+    path: Optional[str] = Field(
+        description="Path to the SQLite cache file. Defaults to 'embedding_cache.db' under the mem0 directory",
+        default=None,
+    )
+
 
 class EmbedderConfig(BaseModel):
     provider: str = Field(
@@ -9,6 +23,17 @@ class EmbedderConfig(BaseModel):
         default="openai",
     )
     config: Optional[dict] = Field(description="Configuration for the specific embedding model", default={})
+    cache: EmbeddingCacheConfig = Field(
+        description="Configuration for the embedding cache",
+        default_factory=EmbeddingCacheConfig,
+    )
+    rate_limit: Optional[RateLimitConfig] = Field(
+        description=(
+            "Rate limit and retry policy shared by every embedder of the provider and model in the process. "
+            "Defaults to no rate limiting or retries"
+        ),
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -9,6 +9,8 @@ from mem0.embeddings.base import EmbeddingBase
 
 
 class GoogleGenAIEmbedding(EmbeddingBase):
+    max_batch_size = 100
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -37,3 +39,18 @@ class GoogleGenAIEmbedding(EmbeddingBase):
         response = self.client.models.embed_content(model=self.config.model, contents=text, config=config)
 
         return response.embeddings[0].values
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single Google Generative AI request.
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        config = types.EmbedContentConfig(output_dimensionality=self.config.embedding_dims)
+        response = self.client.models.embed_content(model=self.config.model, contents=texts, config=config)
+
+        return [embedding.values for embedding in response.embeddings]
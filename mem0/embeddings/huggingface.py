@@ -39,3 +39,19 @@ class HuggingFaceEmbedding(EmbeddingBase):
             return self.client.embeddings.create(input=text, model="tei").data[0].embedding
         else:
             return self.model.encode(text, convert_to_numpy=True).tolist()
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts using Hugging Face.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if self.config.huggingface_base_url:
+            response = self.client.embeddings.create(input=texts, model="tei")
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        else:
+            return self.model.encode(texts, convert_to_numpy=True).tolist()
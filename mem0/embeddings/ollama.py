@@ -3,16 +3,16 @@ import sys
 from typing import Literal, Optional
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
-from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
 
 try:
-    from ollama import Client
+    from ollama import AsyncClient, Client
 except ImportError:
     user_input = input("The 'ollama' library is required. Install it now? [y/N]: ")
     if user_input.lower() == "y":
         try:
             subprocess.check_call([sys.executable, "-m", "pip", "install", "ollama"])
-            from ollama import Client
+            from ollama import AsyncClient, Client
         except subprocess.CalledProcessError:
             print("Failed to install 'ollama'. Please install it manually using 'pip install ollama'.")
             sys.exit(1)
@@ -21,7 +21,7 @@ except ImportError:
         sys.exit(1)
 
 
-class OllamaEmbedding(EmbeddingBase):
+class OllamaEmbedding(EmbeddingBase, AsyncEmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -29,8 +29,16 @@ class OllamaEmbedding(EmbeddingBase):
         self.config.embedding_dims = self.config.embedding_dims or 512
 
         self.client = Client(host=self.config.ollama_base_url)
+        self._async_client = None
         self._ensure_model_exists()
 
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async (httpx-based) Ollama client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncClient(host=self.config.ollama_base_url)
+        return self._async_client
+
     def _ensure_model_exists(self):
         """
         Ensure the specified model exists locally. If not, pull it from Ollama.
@@ -51,3 +59,42 @@ class OllamaEmbedding(EmbeddingBase):
         """
         response = self.client.embeddings(model=self.config.model, prompt=text)
         return response["embedding"]
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single Ollama request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        response = self.client.embed(model=self.config.model, input=texts)
+        return [list(embedding) for embedding in response["embeddings"]]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using the async Ollama client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        response = await self.async_client.embeddings(model=self.config.model, prompt=text)
+        return response["embedding"]
+
+    async def _aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single async Ollama request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        response = await self.async_client.embed(model=self.config.model, input=texts)
+        return [list(embedding) for embedding in response["embeddings"]]
@@ -2,13 +2,13 @@ import os
 import warnings
 from typing import Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
-from mem0.embeddings.base import EmbeddingBase
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
 
 
-class OpenAIEmbedding(EmbeddingBase):
+class OpenAIEmbedding(EmbeddingBase, AsyncEmbeddingBase):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -30,6 +30,16 @@ class OpenAIEmbedding(EmbeddingBase):
             )
 
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._api_key = api_key
+        self._base_url = base_url
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)
+        return self._async_client
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -47,3 +57,51 @@ class OpenAIEmbedding(EmbeddingBase):
             .data[0]
             .embedding
         )
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        response = self.client.embeddings.create(
+            input=texts, model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text using the async OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(
+            input=[text], model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return response.data[0].embedding
+
+    async def _aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single async OpenAI request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        response = await self.async_client.embeddings.create(
+            input=texts, model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
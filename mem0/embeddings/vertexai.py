@@ -8,6 +8,8 @@ from mem0.embeddings.base import EmbeddingBase
 
 
 class VertexAIEmbedding(EmbeddingBase):
+    max_batch_size = 250
+
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config)
 
@@ -41,6 +43,18 @@ class VertexAIEmbedding(EmbeddingBase):
         Returns:
             list: The embedding vector.
         """
+        return self._embed_batch([text], memory_action)[0]
+
+    def _embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a batch of texts in a single Vertex AI request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
         embedding_type = "SEMANTIC_SIMILARITY"
         if memory_action is not None:
             if memory_action not in self.embedding_types:
@@ -48,7 +62,7 @@ class VertexAIEmbedding(EmbeddingBase):
 
             embedding_type = self.embedding_types[memory_action]
 
-        text_input = TextEmbeddingInput(text=text, task_type=embedding_type)
-        embeddings = self.model.get_embeddings(texts=[text_input], output_dimensionality=self.config.embedding_dims)
+        text_inputs = [TextEmbeddingInput(text=text, task_type=embedding_type) for text in texts]
+        embeddings = self.model.get_embeddings(texts=text_inputs, output_dimensionality=self.config.embedding_dims)
 
-        return embeddings[0].values
+        return [embedding.values for embedding in embeddings]
@@ -37,6 +37,8 @@ class NeptuneBase(ABC):
             config.embedder.provider,
             config.embedder.config,
             {"enable_embeddings": True},
+            cache_config=config.embedder.cache,
+            rate_limit_config=config.embedder.rate_limit,
         )
 
     @staticmethod
@@ -44,7 +46,13 @@ class NeptuneBase(ABC):
         """
         :return: the llm model used for memory store
         """
-        return LlmFactory.create(llm_provider, config.llm.config)
+        return LlmFactory.create(
+            llm_provider,
+            config.llm.config,
+            cache_config=config.llm.cache,
+            max_concurrency=getattr(config.llm, "max_concurrency", None),
+            rate_limit_config=getattr(config.llm, "rate_limit", None),
+        )
 
     def add(self, data, filters):
         """
@@ -210,6 +218,8 @@ class NeptuneBase(ABC):
         """
 
         results = []
+        entity_names = list(dict.fromkeys(n for item in to_be_added for n in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
         for item in to_be_added:
             # entities
             source = item["source"]
@@ -221,8 +231,8 @@ class NeptuneBase(ABC):
             destination_type = entity_type_map.get(destination, "__User__")
 
             # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
+            source_embedding = entity_embeddings[source]
+            dest_embedding = entity_embeddings[destination]
 
             # search for the nodes with the closest embeddings
             source_node_search_result = self._search_source_node(source_embedding, user_id, threshold=0.9)
@@ -377,8 +387,8 @@ class NeptuneBase(ABC):
         """
         result_relations = []
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        node_embeddings = self.embedding_model.embed_batch(node_list)
+        for node, n_embedding in zip(node_list, node_embeddings):
             cypher_query, params = self._search_graph_db_cypher(n_embedding, filters, limit)
             ans = self.graph.query(cypher_query, params=params)
             result_relations.extend(ans)
@@ -39,28 +39,17 @@ class AnthropicLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("ANTHROPIC_API_KEY")
         self.client = anthropic.Anthropic(api_key=api_key)
+        self._api_key = api_key
+        self._async_client = None
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a response based on the given messages using Anthropic.
+    @property
+    def async_client(self) -> "anthropic.AsyncAnthropic":
+        """Async Anthropic client, created on first use."""
+        if self._async_client is None:
+            self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key)
+        return self._async_client
 
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional Anthropic-specific parameters.
-
-        Returns:
-            str: The generated response.
-        """
+    def _request_params(self, messages, tools=None, tool_choice="auto", **kwargs) -> Dict:
         # Separate system message from other messages
         system_message = ""
         filtered_messages = []
@@ -82,6 +71,44 @@ class AnthropicLLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
+        return params
 
-        response = self.client.messages.create(**params)
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using Anthropic.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Anthropic-specific parameters.
+
+        Returns:
+            str: The generated response.
+        """
+        response = self.client.messages.create(**self._request_params(messages, tools, tool_choice, **kwargs))
+        return response.content[0].text
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using the async Anthropic client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        response = await self.async_client.messages.create(**self._request_params(messages, tools, tool_choice, **kwargs))
         return response.content[0].text
@@ -3,7 +3,7 @@ import os
 from typing import Dict, List, Optional, Union
 
 from azure.identity import DefaultAzureCredential, get_bearer_token_provider
-from openai import AzureOpenAI
+from openai import AsyncAzureOpenAI, AzureOpenAI
 
 from mem0.configs.llms.azure import AzureOpenAIConfig
 from mem0.configs.llms.base import BaseLlmConfig
@@ -57,15 +57,23 @@ class AzureOpenAILLM(LLMBase):
         else:
             azure_ad_token_provider = None
 
-        self.client = AzureOpenAI(
+        self._client_kwargs = dict(
             azure_deployment=azure_deployment,
             azure_endpoint=azure_endpoint,
             azure_ad_token_provider=azure_ad_token_provider,
             api_version=api_version,
             api_key=api_key,
-            http_client=self.config.http_client,
             default_headers=default_headers,
         )
+        self.client = AzureOpenAI(http_client=self.config.http_client, **self._client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncAzureOpenAI:
+        """Async Azure OpenAI client with the same settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncAzureOpenAI(**self._client_kwargs)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -97,6 +105,26 @@ class AzureOpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _request_params(self, messages, tools=None, tool_choice="auto", **kwargs) -> Dict:
+        user_prompt = messages[-1]["content"]
+
+        user_prompt = user_prompt.replace("assistant", "ai")
+
+        messages[-1]["content"] = user_prompt
+
+        params = self._get_supported_params(messages=messages, **kwargs)
+        
+        # Add model and messages
+        params.update({
+            "model": self.config.model,
+            "messages": messages,
+        })
+
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -118,24 +146,28 @@ class AzureOpenAILLM(LLMBase):
         Returns:
             str: The generated response.
         """
+        params = self._request_params(messages, tools, tool_choice, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
 
-        user_prompt = messages[-1]["content"]
-
-        user_prompt = user_prompt.replace("assistant", "ai")
-
-        messages[-1]["content"] = user_prompt
-
-        params = self._get_supported_params(messages=messages, **kwargs)
-        
-        # Add model and messages
-        params.update({
-            "model": self.config.model,
-            "messages": messages,
-        })
-
-        if tools:
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using the async Azure OpenAI client.
 
-        response = self.client.chat.completions.create(**params)
+        Takes the same arguments as `generate_response`. With `http_client_proxies` set, the
+        sync client (which carries the proxies) is run in a worker thread instead.
+        """
+        if self.config.http_client is not None:
+            return await super().agenerate_response(
+                messages, response_format=response_format, tools=tools, tool_choice=tool_choice, **kwargs
+            )
+        params = self._request_params(messages, tools, tool_choice, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
         return self._parse_response(response, tools)
@@ -1,7 +1,156 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import hashlib
+import inspect
+import json
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.limiter import estimate_tokens
+
+
+# Set while a wrapped LLM call runs, so that nested calls (e.g. the default `agenerate_response`
+# running `generate_response` in a thread) neither look up the cache twice, take a second slot nor retry twice
+_llm_cache_checked = contextvars.ContextVar("_llm_cache_checked", default=False)
+_llm_slot_held = contextvars.ContextVar("_llm_slot_held", default=False)
+_llm_rate_limited = contextvars.ContextVar("_llm_rate_limited", default=False)
+
+
+@contextlib.contextmanager
+def _flag(var: contextvars.ContextVar):
+    token = var.set(True)
+    try:
+        yield
+    finally:
+        var.reset(token)
+
+
+def _cache_key_for_call(self, signature, args, kwargs):
+    """Return the response cache key of a call, or None when it must not be cached."""
+    cache = getattr(self, "response_cache", None)
+    if cache is None or _llm_cache_checked.get():
+        return None
+
+    bound = signature.bind(self, *args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    extra = arguments.pop("kwargs", {})
+    arguments.update(extra)
+
+    temperature = arguments.get("temperature", getattr(self.config, "temperature", None))
+    if temperature != 0:
+        cache.record_bypass()
+        return None
+    return self._response_cache_key(arguments, temperature)
+
+
+def _limiter_for_call(self):
+    """Return the concurrency limiter the call must take a slot of, or None."""
+    limiter = getattr(self, "concurrency_limiter", None)
+    return None if _llm_slot_held.get() else limiter
+
+
+def _slotted_call(self, call, is_async: bool):
+    """
+    Return `call` holding a slot of `self.concurrency_limiter`, when one is attached, while it runs.
+
+    The slot is taken per attempt, so a call waiting for rate limit budget or backing off before a
+    retry does not keep other callers of the provider waiting.
+    """
+    limiter = _limiter_for_call(self)
+    if limiter is None:
+        return call
+
+    if is_async:
+
+        async def slotted():
+            async with limiter.async_slot():
+                with _flag(_llm_slot_held):
+                    return await call()
+
+    else:
+
+        def slotted():
+            with limiter.slot(), _flag(_llm_slot_held):
+                return call()
+
+    return slotted
+
+
+def _rate_limited_call(self, generate_response, signature, args, kwargs):
+    """
+    Return a no-argument callable making the call, through `self.rate_limiter` when one is
+    attached. The call is charged the estimated tokens of its messages plus `max_tokens`, and
+    takes a concurrency slot for each attempt.
+    """
+    is_async = inspect.iscoroutinefunction(generate_response)
+    call = _slotted_call(self, functools.partial(generate_response, self, *args, **kwargs), is_async)
+    rate_limiter = getattr(self, "rate_limiter", None)
+    if rate_limiter is None or _llm_rate_limited.get():
+        return call
+
+    bound = signature.bind(self, *args, **kwargs)
+    messages = bound.arguments.get("messages") or []
+    tokens = sum(
+        estimate_tokens(str(message.get("content", "") if isinstance(message, dict) else message))
+        for message in messages
+    )
+    tokens += getattr(self.config, "max_tokens", None) or 0
+    run = rate_limiter.arun if is_async else rate_limiter.run
+    return functools.partial(run, call, tokens)
+
+
+def _wrap_llm_call(generate_response):
+    """
+    Wrap a provider's `generate_response` or `agenerate_response` so that deterministic calls
+    are served from `self.response_cache` when one is attached, calls are paced and retried by
+    `self.rate_limiter` when one is attached, and each attempt that reaches the provider holds a
+    slot of `self.concurrency_limiter` when one is attached.
+    """
+    signature = inspect.signature(generate_response)
+
+    if inspect.iscoroutinefunction(generate_response):
+
+        @functools.wraps(generate_response)
+        async def wrapper(self, *args, **kwargs):
+            key = _cache_key_for_call(self, signature, args, kwargs)
+            if key is not None:
+                found, response = self.response_cache.get(key)
+                if found:
+                    return response
+
+            call = _rate_limited_call(self, generate_response, signature, args, kwargs)
+            with _flag(_llm_cache_checked), _flag(_llm_rate_limited):
+                response = await call()
+
+            if key is not None:
+                self.response_cache.set(key, response)
+            return response
+
+    else:
+
+        @functools.wraps(generate_response)
+        def wrapper(self, *args, **kwargs):
+            key = _cache_key_for_call(self, signature, args, kwargs)
+            if key is not None:
+                found, response = self.response_cache.get(key)
+                if found:
+                    return response
+
+            call = _rate_limited_call(self, generate_response, signature, args, kwargs)
+            with _flag(_llm_cache_checked), _flag(_llm_rate_limited):
+                response = call()
+
+            if key is not None:
+                self.response_cache.set(key, response)
+            return response
+
+    wrapper._llm_call_wrapped = True
+    return wrapper
 
 
 class LLMBase(ABC):
@@ -24,9 +173,37 @@ class LLMBase(ABC):
         else:
             self.config = config
 
+        # Optional LlmResponseCache, attached by LlmFactory when `llm.cache.enabled` is set
+        self.response_cache = None
+        # Optional ConcurrencyLimiter shared by the provider, attached by LlmFactory when `llm.max_concurrency` is set
+        self.concurrency_limiter = None
+        # Optional RateLimiter shared by the provider and model, attached by LlmFactory when `llm.rate_limit` is set
+        self.rate_limiter = None
+
         # Validate configuration
         self._validate_config()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ("generate_response", "agenerate_response"):
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "_llm_call_wrapped", False):
+                setattr(cls, name, _wrap_llm_call(method))
+
+    def _response_cache_key(self, arguments: Dict, temperature: float) -> str:
+        """
+        Hash of everything that determines a deterministic response: provider, model,
+        temperature and the call arguments (messages, tools, response_format, ...).
+        """
+        payload = {
+            "provider": type(self).__name__,
+            "model": getattr(self.config, "model", None),
+            "temperature": temperature,
+            "arguments": arguments,
+        }
+        serialized = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
     def _validate_config(self):
         """
         Validate the configuration.
@@ -112,6 +289,37 @@ class LLMBase(ABC):
         """
         pass
 
+    async def agenerate_response(
+        self, messages: List[Dict[str, str]], tools: Optional[List[Dict]] = None, tool_choice: str = "auto", **kwargs
+    ):
+        """
+        Generate a response based on the given messages asynchronously.
+
+        Providers with an async SDK override this. The default runs `generate_response`
+        in a worker thread, after taking a slot of the provider's concurrency limiter so
+        that waiting requests do not hold threads.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional provider-specific parameters, e.g. `response_format`.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        if tools is not None:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = tool_choice
+        call = functools.partial(self.generate_response, messages, **kwargs)
+
+        limiter = _limiter_for_call(self)
+        if limiter is None:
+            return await asyncio.to_thread(call)
+        async with limiter.async_slot():
+            with _flag(_llm_slot_held):
+                return await asyncio.to_thread(call)
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
@@ -0,0 +1,185 @@
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Literal, Optional, Tuple
+
+from mem0.configs.base import mem0_dir
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class LlmResponseCache:
+    """
+    Cache of LLM responses keyed on a hash of the request.
+
+    The "memory" backend is an in-process LRU; the "disk" backend keeps responses in a
+    SQLite file so replayed conversations are served across restarts, evicting the least
+    recently used rows through an index on their last use. Both honour an optional TTL in
+    seconds, counted from when the response was stored. Hit, miss and bypass counters are exposed through `stats()`.
+    """
+
+    def __init__(
+        self,
+        backend: Literal["memory", "disk"] = "memory",
+        max_size: int = 1000,
+        ttl: Optional[float] = None,
+        path: Optional[str] = None,
+    ):
+        if backend not in ("memory", "disk"):
+            raise ValueError(f"Unsupported LLM cache backend: {backend}")
+
+        self.backend = backend
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+        self.path = None
+        self.connection = None
+        self._disk_size = 0
+        if backend == "disk":
+            self.path = path or os.path.join(mem0_dir, "llm_cache.db")
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self.connection = sqlite3.connect(self.path, check_same_thread=False)
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses "
+                "(key TEXT PRIMARY KEY, response TEXT, created_at REAL, last_used REAL)"
+            )
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(llm_responses)")]
+            if "last_used" not in columns:
+                # Caches written before eviction was by last use
+                self.connection.execute("ALTER TABLE llm_responses ADD COLUMN last_used REAL")
+                self.connection.execute("UPDATE llm_responses SET last_used = created_at")
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS llm_responses_last_used ON llm_responses (last_used)"
+            )
+            self.connection.commit()
+            self._disk_size = self.connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return `(found, response)` for `key`; expired entries count as misses."""
+        with self._lock:
+            value = self._get(key)
+            if value is _MISSING:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, value
+
+    def _get(self, key: str) -> Any:
+        if self.connection is not None:
+            row = self.connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return _MISSING
+            if self._expired(row[1]):
+                self.connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self.connection.commit()
+                self._disk_size -= 1
+                return _MISSING
+            self.connection.execute("UPDATE llm_responses SET last_used = ? WHERE key = ?", (time.time(), key))
+            self.connection.commit()
+            return json.loads(row[0])
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        created_at, value = entry
+        if self._expired(created_at):
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any):
+        """Store a response, evicting the least recently used entries once `max_size` is exceeded."""
+        now = time.time()
+        with self._lock:
+            if self.connection is not None:
+                try:
+                    serialized = json.dumps(value)
+                except (TypeError, ValueError):
+                    logger.debug("Skipping LLM cache write for a response that is not JSON serializable")
+                    return
+                try:
+                    exists = self.connection.execute(
+                        "SELECT 1 FROM llm_responses WHERE key = ?", (key,)
+                    ).fetchone()
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO llm_responses (key, response, created_at, last_used) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, serialized, now, now),
+                    )
+                    size = self._disk_size + (exists is None)
+                    if size > self.max_size:
+                        # Walks the last_used index, so only the evicted rows are visited
+                        evicted = self.connection.execute(
+                            "DELETE FROM llm_responses WHERE key IN "
+                            "(SELECT key FROM llm_responses ORDER BY last_used LIMIT ?)",
+                            (size - self.max_size,),
+                        ).rowcount
+                        size -= evicted
+                    self.connection.commit()
+                    self._disk_size = size
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to persist LLM response to cache: {e}")
+                return
+
+            self._entries[key] = (now, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def record_bypass(self):
+        """Count a call that was not eligible for caching (non-zero temperature)."""
+        with self._lock:
+            self.bypassed += 1
+
+    def _size(self) -> int:
+        with self._lock:
+            if self.connection is not None:
+                return self._disk_size
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss/bypass counters and the number of cached responses."""
+        size = self._size()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": size,
+            }
+
+    def clear(self):
+        """Drop every cached response and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.bypassed = 0
+            if self.connection is not None:
+                self.connection.execute("DELETE FROM llm_responses")
+                self.connection.commit()
+                self._disk_size = 0
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -1,11 +1,70 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
 
+class LlmCacheConfig(BaseModel):
+    enabled: bool = Field(
+        description="Whether to cache responses of deterministic (temperature 0) LLM calls", default=False
+    )
+    backend: Literal["memory", "disk"] = Field(
+        description="Where cached responses are kept: an in-process LRU ('memory') or a SQLite file ('disk')",
+        default="memory",
+    )
+    max_size: int = Field(description="Maximum number of cached responses", default=1000)
+    ttl: Optional[float] = Field(
+        description="Seconds after which a cached response expires. Defaults to no expiry", default=None
+    )
+    path: Optional[str] = Field(
+        description=(
+            "Path to the SQLite cache file for the 'disk' backend. Defaults to 'llm_cache.db' under the mem0 directory"
+        ),
+        default=None,
+    )
+
+
+class RateLimitConfig(BaseModel):
+    requests_per_minute: Optional[float] = Field(
+        description="Requests per minute allowed to the provider and model. Defaults to no limit", default=None, gt=0
+    )
+    tokens_per_minute: Optional[float] = Field(
+        description=(
+            "Tokens per minute allowed to the provider and model, estimated at ~4 characters per token. "
+            "Defaults to no limit"
+        ),
+        default=None,
+        gt=0,
+    )
+    max_retries: int = Field(
+        description="Retries of a call that failed with a rate limit (429) or transient (5xx, connection) error",
+        default=3,
+        ge=0,
+    )
+    initial_backoff: float = Field(description="Upper bound in seconds of the first jittered backoff", default=1.0, gt=0)
+    max_backoff: float = Field(
+        description="Upper bound in seconds of any backoff, including delays requested with Retry-After", default=60.0, gt=0
+    )
+
+
 class LlmConfig(BaseModel):
     provider: str = Field(description="Provider of the LLM (e.g., 'ollama', 'openai')", default="openai")
     config: Optional[dict] = Field(description="Configuration for the specific LLM", default={})
+    cache: LlmCacheConfig = Field(description="Configuration for the LLM response cache", default_factory=LlmCacheConfig)
+    max_concurrency: Optional[int] = Field(
+        description=(
+            "Maximum number of requests in flight to this provider, shared by every LLM instance of the provider "
+            "in the process. Defaults to no limit"
+        ),
+        default=None,
+        ge=1,
+    )
+    rate_limit: Optional[RateLimitConfig] = Field(
+        description=(
+            "Rate limit and retry policy shared by every LLM instance of the provider and model in the process. "
+            "Defaults to no rate limiting or retries"
+        ),
+        default=None,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
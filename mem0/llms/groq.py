@@ -3,7 +3,7 @@ import os
 from typing import Dict, List, Optional
 
 try:
-    from groq import Groq
+    from groq import AsyncGroq, Groq
 except ImportError:
     raise ImportError("The 'groq' library is required. Please install it using 'pip install groq'.")
 
@@ -21,6 +21,15 @@ class GroqLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("GROQ_API_KEY")
         self.client = Groq(api_key=api_key)
+        self._api_key = api_key
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncGroq:
+        """Async Groq client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncGroq(api_key=self._api_key)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -52,6 +61,21 @@ class GroqLLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _request_params(self, messages, response_format=None, tools=None, tool_choice="auto") -> Dict:
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+        if response_format:
+            params["response_format"] = response_format
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -71,18 +95,22 @@ class GroqLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-        if response_format:
-            params["response_format"] = response_format
-        if tools:
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
-
+        params = self._request_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using the async Groq client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
@@ -0,0 +1,467 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from mem0.llms.configs import RateLimitConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimiter:
+    """
+    Bound on the number of requests in flight to one LLM provider.
+
+    Threads (`slot`) and asyncio tasks (`async_slot`) draw from the same pool of slots, so
+    sync `Memory`, `AsyncMemory` and graph stores that share a provider share its limit too.
+    Waiters are served in arrival order; async waiters wait on a future instead of a thread.
+    """
+
+    def __init__(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        # threading.Event for threads, (loop, future) for tasks
+        self._waiters = deque()
+        self.waited = 0
+
+    def _acquire_or_enqueue(self, waiter) -> bool:
+        with self._lock:
+            if self._in_flight < self.max_concurrency and not self._waiters:
+                self._in_flight += 1
+                return True
+            self._waiters.append(waiter)
+            self.waited += 1
+            return False
+
+    def acquire(self):
+        event = threading.Event()
+        if not self._acquire_or_enqueue(event):
+            event.wait()
+
+    async def acquire_async(self):
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+        if self._acquire_or_enqueue(waiter):
+            return
+        try:
+            await waiter[1]
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(waiter)
+                    owned = False
+                except ValueError:
+                    # Already handed a slot; `_wake` releases it if the future was cancelled first
+                    owned = waiter[1].done() and not waiter[1].cancelled()
+            if owned:
+                self.release()
+            raise
+
+    def release(self):
+        """Hand the slot to the oldest waiter, or return it to the pool when nobody waits."""
+        with self._lock:
+            # After the limit was lowered, slots are retired until the new limit is met
+            if self._in_flight > self.max_concurrency or not self._hand_off():
+                self._in_flight -= 1
+
+    def set_max_concurrency(self, max_concurrency: int):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        with self._lock:
+            self.max_concurrency = max_concurrency
+            while self._in_flight < max_concurrency and self._hand_off():
+                self._in_flight += 1
+
+    def _hand_off(self) -> bool:
+        """Give a slot to the oldest live waiter; called with the lock held. Returns False if nobody waits."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+                return True
+            loop, future = waiter
+            try:
+                loop.call_soon_threadsafe(self._wake, future)
+                return True
+            except RuntimeError:
+                # The waiter's event loop is closed
+                continue
+        return False
+
+    def _wake(self, future: asyncio.Future):
+        if future.done():
+            self.release()
+        else:
+            future.set_result(None)
+
+    @contextmanager
+    def slot(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def async_slot(self):
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, int]:
+        """Return the configured limit, the requests in flight, the current waiters and the total waits."""
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "waiting": len(self._waiters),
+                "waited": self.waited,
+            }
+
+
+_limiters: Dict[str, ConcurrencyLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_concurrency_limiter(provider: str, max_concurrency: Optional[int]) -> Optional[ConcurrencyLimiter]:
+    """
+    Return the process-wide limiter of `provider`, or None when `max_concurrency` is not set.
+
+    Every LLM instance of a provider shares one limiter; when instances are configured with
+    different limits, the most recently configured limit applies.
+    """
+    if max_concurrency is None:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = ConcurrencyLimiter(max_concurrency)
+        elif limiter.max_concurrency != max_concurrency:
+            limiter.set_max_concurrency(max_concurrency)
+        return limiter
+
+
+# Status codes worth retrying; 429 and 529 (Anthropic "overloaded") also mean the provider is throttling us
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+THROTTLE_STATUS_CODES = {429, 529}
+# Matched against the names of the exception's classes, for SDK errors raised before a response exists
+RETRYABLE_ERROR_NAMES = ("RateLimitError", "APIConnectionError", "APITimeoutError", "Timeout", "ConnectionError")
+
+# Multiplicative decrease on a throttled response, additive increase on a success, as fractions of the configured rates
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE_FACTOR = 0.1
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token); avoids a tokenizer dependency."""
+    return len(text) // 4 + 1
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    for source in (error, getattr(error, "response", None)):
+        code = getattr(source, "status_code", None)
+        if isinstance(code, int):
+            return code
+    return None
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Return the delay in seconds requested by the provider with `retry-after-ms` or `retry-after`, if any."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or getattr(error, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms") is not None:
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(error: Exception) -> Tuple[bool, bool]:
+    """Return whether `error` is worth retrying and whether it means the provider is throttling."""
+    status = _status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES, status in THROTTLE_STATUS_CODES
+    names = [cls.__name__ for cls in type(error).__mro__]
+    throttled = "RateLimitError" in names
+    retryable = isinstance(error, (ConnectionError, TimeoutError)) or any(
+        name.endswith(RETRYABLE_ERROR_NAMES) for name in names
+    )
+    return retryable, throttled
+
+
+class _TokenBucket:
+    """Bucket refilled at `per_minute` that holds up to one second of budget and may go into debt."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.per_minute / 60)
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.per_minute / 60)
+        self.updated = now
+
+    def set_rate(self, per_minute: float, now: float):
+        self._refill(now)
+        self.per_minute = per_minute
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take `amount` from the bucket and return how long the caller must wait before using it."""
+        self._refill(now)
+        self.level -= amount
+        return 0.0 if self.level >= 0 else -self.level * 60 / self.per_minute
+
+
+class RateLimiter:
+    """
+    Request and token rate limits with retries for one provider and model.
+
+    Calls reserve budget from a request bucket and a token bucket before they are sent and
+    wait until the reservation is covered, so callers are paced in arrival order. Calls that
+    fail with a rate limit or transient error are retried with jittered exponential backoff,
+    or after the delay the provider asked for with Retry-After, which also pauses every other
+    caller. Throttled responses halve the rates (AIMD) and each success restores 5% of the
+    configured rates. Threads (`run`) and asyncio tasks (`arun`) share the same budget.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        self._lock = threading.Lock()
+        self.requests_per_minute = None
+        self.tokens_per_minute = None
+        self._requests = None
+        self._tokens = None
+        self._rate_factor = 1.0
+        self._paused_until = 0.0
+        self.configure(requests_per_minute, tokens_per_minute, max_retries, initial_backoff, max_backoff)
+
+        self.requests = 0
+        self.waiting = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.throttled = 0
+        self.retries = 0
+        self.failures = 0
+
+    @classmethod
+    def from_config(cls, config: RateLimitConfig) -> "RateLimiter":
+        return cls(**config.model_dump())
+
+    def configure(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        with self._lock:
+            # Buckets are only rebuilt when their rate changes, so reconfiguring does not grant a new burst
+            if requests_per_minute != self.requests_per_minute:
+                self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+            if tokens_per_minute != self.tokens_per_minute:
+                self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+            self.requests_per_minute = requests_per_minute
+            self.tokens_per_minute = tokens_per_minute
+            self.max_retries = max_retries
+            self.initial_backoff = initial_backoff
+            self.max_backoff = max_backoff
+            self._apply_rate_factor(self._rate_factor)
+
+    def _apply_rate_factor(self, factor: float):
+        """Scale the bucket rates to `factor` of the configured rates; called with the lock held."""
+        self._rate_factor = factor
+        now = time.monotonic()
+        if self._requests is not None:
+            self._requests.set_rate(self.requests_per_minute * factor, now)
+        if self._tokens is not None:
+            self._tokens.set_rate(self.tokens_per_minute * factor, now)
+
+    def _reserve(self, tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self._paused_until - now)
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1, now))
+            if self._tokens is not None and tokens:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+            self.requests += 1
+            if delay > 0:
+                self.waited += 1
+                self.wait_seconds += delay
+            return delay
+
+    def _on_success(self):
+        if self._rate_factor < 1.0:
+            with self._lock:
+                self._apply_rate_factor(min(1.0, self._rate_factor + RECOVERY_STEP))
+
+    def _on_error(self, error: Exception, attempt: int) -> Optional[float]:
+        """Record a failed attempt and return the delay before the next one, or None when it must not be retried."""
+        retryable, throttled = classify_error(error)
+        retry_after = _retry_after(error) if retryable else None
+        with self._lock:
+            if throttled:
+                self.throttled += 1
+                self._apply_rate_factor(max(MIN_RATE_FACTOR, self._rate_factor * BACKOFF_FACTOR))
+            if not retryable:
+                return None
+            if attempt >= self.max_retries:
+                self.failures += 1
+                return None
+            self.retries += 1
+            if retry_after is not None:
+                delay = min(self.max_backoff, retry_after) + random.uniform(0, self.initial_backoff)
+                self._paused_until = max(self._paused_until, time.monotonic() + min(self.max_backoff, retry_after))
+            else:
+                delay = random.uniform(0, min(self.max_backoff, self.initial_backoff * 2**attempt))
+        logger.warning(f"Retrying provider call in {delay:.1f}s after {type(error).__name__}: {error}")
+        return delay
+
+    def run(self, call: Callable[[], T], tokens: int = 0) -> T:
+        """Run `call` once its request and `tokens` fit in the budget, retrying rate limit and transient errors."""
+        attempt = 0
+        while True:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                with self._lock:
+                    self.waiting += 1
+                try:
+                    time.sleep(delay)
+                finally:
+                    with self._lock:
+                        self.waiting -= 1
+            try:
+                result = call()
+            except Exception as e:
+                delay = self._on_error(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                time.sleep(delay)
+                continue
+            self._on_success()
+            return result
+
+    async def arun(self, call: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """Await `call()` once its request and `tokens` fit in the budget, retrying rate limit and transient errors."""
+        attempt = 0
+        while True:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                with self._lock:
+                    self.waiting += 1
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    with self._lock:
+                        self.waiting -= 1
+            try:
+                result = await call()
+            except Exception as e:
+                delay = self._on_error(e, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+            self._on_success()
+            return result
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the current (adaptive) rates, the calls waiting for budget and the throttling counters:
+        requests, waited (calls that had to wait), wait_seconds, throttled (429 responses), retries
+        and failures (retryable errors raised after the last retry).
+        """
+        with self._lock:
+            return {
+                "requests_per_minute": self._requests.per_minute if self._requests else None,
+                "tokens_per_minute": self._tokens.per_minute if self._tokens else None,
+                "waiting": self.waiting,
+                "requests": self.requests,
+                "waited": self.waited,
+                "wait_seconds": self.wait_seconds,
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "failures": self.failures,
+            }
+
+
+def disable_sdk_retries(component):
+    """
+    Turn off the retries of the SDK client of an LLM or embedder whose calls `RateLimiter` retries,
+    so a throttled call is not retried, and backed off, by both.
+
+    Clients with `with_options` (OpenAI, Anthropic and compatible SDKs) are replaced by a copy with
+    `max_retries=0`; providers that create their async client lazily get it without retries too.
+    """
+    client = getattr(component, "client", None)
+    if hasattr(client, "with_options"):
+        component.client = client.with_options(max_retries=0)
+    client_kwargs = getattr(component, "_client_kwargs", None)
+    if isinstance(client_kwargs, dict):
+        client_kwargs["max_retries"] = 0
+
+
+_rate_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model, config: Optional[RateLimitConfig]) -> Optional[RateLimiter]:
+    """
+    Return the process-wide rate limiter of `provider` and `model`, or None when `config` is not set.
+
+    LLMs and embedders of the same provider and model share one limiter; when they are configured
+    with different policies, the most recently configured policy applies.
+    """
+    if config is None:
+        return None
+    if isinstance(config, dict):
+        config = RateLimitConfig(**config)
+    key = (provider, model if model is None or isinstance(model, str) else type(model).__name__)
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = RateLimiter.from_config(config)
+        else:
+            limiter.configure(**config.model_dump())
+        return limiter
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, float]]:
+    """Return the stats of every rate limiter in the process, keyed by "provider/model"."""
+    with _rate_limiters_lock:
+        limiters = dict(_rate_limiters)
+    return {f"{provider}/{model}": limiter.stats() for (provider, model), limiter in limiters.items()}
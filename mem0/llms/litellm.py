@@ -48,6 +48,24 @@ class LiteLLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _request_params(self, messages, response_format=None, tools=None, tool_choice="auto") -> Dict:
+        if not litellm.supports_function_calling(self.config.model):
+            raise ValueError(f"Model '{self.config.model}' in litellm does not support function calling.")
+
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+        if response_format:
+            params["response_format"] = response_format
+        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -67,21 +85,21 @@ class LiteLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        if not litellm.supports_function_calling(self.config.model):
-            raise ValueError(f"Model '{self.config.model}' in litellm does not support function calling.")
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = litellm.completion(**params)
+        return self._parse_response(response, tools)
 
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-        if response_format:
-            params["response_format"] = response_format
-        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using Litellm's async completion API.
 
-        response = litellm.completion(**params)
+        Takes the same arguments as `generate_response`.
+        """
+        response = await litellm.acompletion(**self._request_params(messages, response_format, tools, tool_choice))
         return self._parse_response(response, tools)
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, Union
 
 try:
-    from ollama import Client
+    from ollama import AsyncClient, Client
 except ImportError:
     raise ImportError("The 'ollama' library is required. Please install it using 'pip install ollama'.")
 
@@ -37,6 +37,14 @@ class OllamaLLM(LLMBase):
             self.config.model = "llama3.1:70b"
 
         self.client = Client(host=self.config.ollama_base_url)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncClient:
+        """Async (httpx-based) Ollama client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncClient(host=self.config.ollama_base_url)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -64,27 +72,7 @@ class OllamaLLM(LLMBase):
             else:
                 return response.message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a response based on the given messages using Ollama.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional Ollama-specific parameters.
-
-        Returns:
-            str: The generated response.
-        """
+    def _request_params(self, messages, response_format=None) -> Dict:
         # Build parameters for Ollama
         params = {
             "model": self.config.model,
@@ -109,6 +97,45 @@ class OllamaLLM(LLMBase):
 
         # Remove OpenAI-specific parameters that Ollama doesn't support
         params.pop("max_tokens", None)  # Ollama uses different parameter names
+        return params
 
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using Ollama.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional Ollama-specific parameters.
+
+        Returns:
+            str: The generated response.
+        """
+        params = self._request_params(messages, response_format)
         response = self.client.chat(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using the async Ollama client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        response = await self.async_client.chat(**self._request_params(messages, response_format))
+        return self._parse_response(response, tools)
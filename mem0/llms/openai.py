@@ -3,7 +3,7 @@ import logging
 import os
 from typing import Dict, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.configs.llms.openai import OpenAIConfig
@@ -38,7 +38,7 @@ class OpenAILLM(LLMBase):
             self.config.model = "gpt-4o-mini"
 
         if os.environ.get("OPENROUTER_API_KEY"):  # Use OpenRouter
-            self.client = OpenAI(
+            self._client_kwargs = dict(
                 api_key=os.environ.get("OPENROUTER_API_KEY"),
                 base_url=self.config.openrouter_base_url
                 or os.getenv("OPENROUTER_API_BASE")
@@ -47,8 +47,17 @@ class OpenAILLM(LLMBase):
         else:
             api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
             base_url = self.config.openai_base_url or os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1"
+            self._client_kwargs = dict(api_key=api_key, base_url=base_url)
 
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(**self._client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client with the same settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -80,27 +89,7 @@ class OpenAILLM(LLMBase):
         else:
             return response.choices[0].message.content
 
-    def generate_response(
-        self,
-        messages: List[Dict[str, str]],
-        response_format=None,
-        tools: Optional[List[Dict]] = None,
-        tool_choice: str = "auto",
-        **kwargs,
-    ):
-        """
-        Generate a JSON response based on the given messages using OpenAI.
-
-        Args:
-            messages (list): List of message dicts containing 'role' and 'content'.
-            response_format (str or object, optional): Format of the response. Defaults to "text".
-            tools (list, optional): List of tools that the model can call. Defaults to None.
-            tool_choice (str, optional): Tool choice method. Defaults to "auto".
-            **kwargs: Additional OpenAI-specific parameters.
-
-        Returns:
-            json: The generated response.
-        """
+    def _request_params(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs) -> Dict:
         params = self._get_supported_params(messages=messages, **kwargs)
         
         params.update({
@@ -135,7 +124,9 @@ class OpenAILLM(LLMBase):
         if tools:  # TODO: Remove tools if no issues found with new memory addition logic
             params["tools"] = tools
             params["tool_choice"] = tool_choice
-        response = self.client.chat.completions.create(**params)
+        return params
+
+    def _handle_response(self, response, params, tools):
         parsed_response = self._parse_response(response, tools)
         if self.config.response_callback:
             try:
@@ -145,3 +136,45 @@ class OpenAILLM(LLMBase):
                 logging.error(f"Error due to callback: {e}")
                 pass
         return parsed_response
+
+    def generate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a JSON response based on the given messages using OpenAI.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Returns:
+            json: The generated response.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._handle_response(response, params, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a JSON response based on the given messages using the async OpenAI client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._handle_response(response, params, tools)
@@ -3,7 +3,7 @@ import os
 from typing import Dict, List, Optional
 
 try:
-    from together import Together
+    from together import AsyncTogether, Together
 except ImportError:
     raise ImportError("The 'together' library is required. Please install it using 'pip install together'.")
 
@@ -21,6 +21,15 @@ class TogetherLLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("TOGETHER_API_KEY")
         self.client = Together(api_key=api_key)
+        self._api_key = api_key
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncTogether:
+        """Async TogetherAI client, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncTogether(api_key=self._api_key)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -52,6 +61,21 @@ class TogetherLLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _request_params(self, messages, response_format=None, tools=None, tool_choice="auto") -> Dict:
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+        if response_format:
+            params["response_format"] = response_format
+        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -71,18 +95,22 @@ class TogetherLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
-        if response_format:
-            params["response_format"] = response_format
-        if tools:  # TODO: Remove tools if no issues found with new memory addition logic
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
-
+        params = self._request_params(messages, response_format, tools, tool_choice)
         response = self.client.chat.completions.create(**params)
         return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using the async TogetherAI client.
+
+        Takes the same arguments as `generate_response`.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
@@ -2,7 +2,7 @@ import json
 import os
 from typing import Dict, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.configs.llms.vllm import VllmConfig
@@ -38,7 +38,16 @@ class VllmLLM(LLMBase):
 
         self.config.api_key = self.config.api_key or os.getenv("VLLM_API_KEY") or "vllm-api-key"
         base_url = self.config.vllm_base_url or os.getenv("VLLM_BASE_URL")
-        self.client = OpenAI(api_key=self.config.api_key, base_url=base_url)
+        self._client_kwargs = dict(api_key=self.config.api_key, base_url=base_url)
+        self.client = OpenAI(**self._client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI-compatible client with the same settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
 
     def _parse_response(self, response, tools):
         """
@@ -70,6 +79,20 @@ class VllmLLM(LLMBase):
         else:
             return response.choices[0].message.content
 
+    def _request_params(self, messages, tools=None, tool_choice="auto", **kwargs) -> Dict:
+        params = self._get_supported_params(messages=messages, **kwargs)
+        params.update(
+            {
+                "model": self.config.model,
+                "messages": messages,
+            }
+        )
+
+        if tools:
+            params["tools"] = tools
+            params["tool_choice"] = tool_choice
+        return params
+
     def generate_response(
         self,
         messages: List[Dict[str, str]],
@@ -91,17 +114,23 @@ class VllmLLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = self._get_supported_params(messages=messages, **kwargs)
-        params.update(
-            {
-                "model": self.config.model,
-                "messages": messages,
-            }
-        )
+        params = self._request_params(messages, tools, tool_choice, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
 
-        if tools:
-            params["tools"] = tools
-            params["tool_choice"] = tool_choice
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Generate a response based on the given messages using the async vLLM client.
 
-        response = self.client.chat.completions.create(**params)
+        Takes the same arguments as `generate_response`.
+        """
+        params = self._request_params(messages, tools, tool_choice, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
         return self._parse_response(response, tools)
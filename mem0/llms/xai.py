@@ -1,7 +1,7 @@
 import os
 from typing import Dict, List, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.llms.base import LLMBase
@@ -16,7 +16,29 @@ class XAILLM(LLMBase):
 
         api_key = self.config.api_key or os.getenv("XAI_API_KEY")
         base_url = self.config.xai_base_url or os.getenv("XAI_API_BASE") or "https://api.x.ai/v1"
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self._client_kwargs = dict(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(**self._client_kwargs)
+        self._async_client = None
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI-compatible client with the same settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(**self._client_kwargs)
+        return self._async_client
+
+    def _request_params(self, messages, response_format=None) -> Dict:
+        params = {
+            "model": self.config.model,
+            "messages": messages,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+            "top_p": self.config.top_p,
+        }
+
+        if response_format:
+            params["response_format"] = response_format
+        return params
 
     def generate_response(
         self,
@@ -37,16 +59,21 @@ class XAILLM(LLMBase):
         Returns:
             str: The generated response.
         """
-        params = {
-            "model": self.config.model,
-            "messages": messages,
-            "temperature": self.config.temperature,
-            "max_tokens": self.config.max_tokens,
-            "top_p": self.config.top_p,
-        }
+        params = self._request_params(messages, response_format)
+        response = self.client.chat.completions.create(**params)
+        return response.choices[0].message.content
 
-        if response_format:
-            params["response_format"] = response_format
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+    ):
+        """
+        Generate a response based on the given messages using the async XAI client.
 
-        response = self.client.chat.completions.create(**params)
+        Takes the same arguments as `generate_response`.
+        """
+        response = await self.async_client.chat.completions.create(**self._request_params(messages, response_format))
         return response.choices[0].message.content
@@ -0,0 +1,55 @@
+import json
+import logging
+import os
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def checkpoint_key(index: int, request: Dict[str, Any]) -> str:
+    """Return the checkpoint key of an `add_many` request: its "id" if given, else its position."""
+    key = request.get("id")
+    return str(key) if key is not None else str(index)
+
+
+class AddCheckpoint:
+    """
+    Record of the `add_many` requests that completed, kept in a JSON-lines file.
+
+    Each completed request appends one line with its key, so an interrupted backfill
+    run with the same file skips the requests that were already stored. Failed requests
+    are not recorded and are retried on the next run.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self.completed = set()
+        self._file = None
+        if not path:
+            return
+
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    try:
+                        self.completed.add(json.loads(line)["key"])
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        # A torn final write from an interrupted run
+                        logger.warning(f"Ignoring invalid entry in add_many checkpoint {path}")
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._file = open(path, "a")
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.completed
+
+    def record(self, key: str):
+        self.completed.add(key)
+        if self._file is not None:
+            self._file.write(json.dumps({"key": key}) + "\n")
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,39 @@
+import concurrent.futures
+from typing import Callable, Iterable, List, Optional
+
+
+class SharedExecutor:
+    """
+    Long-lived thread pool for the internal fan-out of a `Memory` instance.
+
+    Running the vector store and graph branches of a call, the per-fact vector searches and the
+    graph node lookups all go through one pool instead of a new `ThreadPoolExecutor` per call.
+    A caller waiting on work that has not started yet runs it itself, so tasks that fan out again
+    from inside the pool cannot deadlock it when every thread is busy.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, thread_name_prefix: str = "mem0"):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+
+    def submit(self, fn: Callable, *args, **kwargs) -> concurrent.futures.Future:
+        return self._executor.submit(fn, *args, **kwargs)
+
+    @staticmethod
+    def result(future: concurrent.futures.Future, fn: Callable, *args, **kwargs):
+        """Return the result of `future`, which runs `fn(*args, **kwargs)`, running it inline if it has not started."""
+        if future.cancel():
+            return fn(*args, **kwargs)
+        return future.result()
+
+    def map(self, fn: Callable, *iterables: Iterable) -> List:
+        """Apply `fn` to the items of `iterables` concurrently and return the results in order."""
+        calls = list(zip(*iterables))
+        futures = [self.submit(fn, *args) for args in calls]
+        return [self.result(future, fn, *args) for future, args in zip(futures, calls)]
+
+    def shutdown(self, wait: bool = True):
+        self._executor.shutdown(wait=wait)
@@ -38,7 +38,11 @@ class MemoryGraph:
             driver_config={"notifications_min_severity": "OFF"},
         )
         self.embedding_model = EmbedderFactory.create(
-            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+            self.config.embedder.provider,
+            self.config.embedder.config,
+            self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
+            rate_limit_config=self.config.embedder.rate_limit,
         )
         self.node_label = ":`__Entity__`" if self.config.graph_store.config.base_label else ""
 
@@ -64,13 +68,30 @@ class MemoryGraph:
 
         # Get LLM config with proper null checks
         llm_config = None
+        llm_cache_config = None
+        llm_max_concurrency = None
+        llm_rate_limit_config = None
         if self.config.graph_store and self.config.graph_store.llm and hasattr(self.config.graph_store.llm, "config"):
             llm_config = self.config.graph_store.llm.config
+            llm_cache_config = getattr(self.config.graph_store.llm, "cache", None)
+            llm_max_concurrency = getattr(self.config.graph_store.llm, "max_concurrency", None)
+            llm_rate_limit_config = getattr(self.config.graph_store.llm, "rate_limit", None)
         elif hasattr(self.config.llm, "config"):
             llm_config = self.config.llm.config
-        self.llm = LlmFactory.create(self.llm_provider, llm_config)
+            llm_cache_config = getattr(self.config.llm, "cache", None)
+            llm_max_concurrency = getattr(self.config.llm, "max_concurrency", None)
+            llm_rate_limit_config = getattr(self.config.llm, "rate_limit", None)
+        self.llm = LlmFactory.create(
+            self.llm_provider,
+            llm_config,
+            cache_config=llm_cache_config,
+            max_concurrency=llm_max_concurrency,
+            rate_limit_config=llm_rate_limit_config,
+        )
         self.user_id = None
         self.threshold = 0.7
+        # Set by Memory to its shared executor so node lookups run concurrently
+        self.executor = None
 
     def add(self, data, filters):
         """
@@ -279,29 +300,28 @@ class MemoryGraph:
             node_props.append("run_id: $run_id")
         node_props_str = ", ".join(node_props)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            cypher_query = f"""
-            MATCH (n {self.node_label} {{{node_props_str}}})
-            WHERE n.embedding IS NOT NULL
-            WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
-            WHERE similarity >= $threshold
-            CALL {{
-                WITH n
-                MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
-                RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
-                UNION
-                WITH n  
-                MATCH (n)<-[r]-(m {self.node_label} {{{node_props_str}}})
-                RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
-            }}
-            WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
-            RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
-            ORDER BY similarity DESC
-            LIMIT $limit
-            """
+        node_embeddings = self.embedding_model.embed_batch(node_list)
+        cypher_query = f"""
+        MATCH (n {self.node_label} {{{node_props_str}}})
+        WHERE n.embedding IS NOT NULL
+        WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
+        WHERE similarity >= $threshold
+        CALL {{
+            WITH n
+            MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
+            RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
+            UNION
+            WITH n  
+            MATCH (n)<-[r]-(m {self.node_label} {{{node_props_str}}})
+            RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
+        }}
+        WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
+        RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
+        ORDER BY similarity DESC
+        LIMIT $limit
+        """
 
+        def query_node(n_embedding):
             params = {
                 "n_embedding": n_embedding,
                 "threshold": self.threshold,
@@ -312,8 +332,13 @@ class MemoryGraph:
                 params["agent_id"] = filters["agent_id"]
             if filters.get("run_id"):
                 params["run_id"] = filters["run_id"]
+            return self.graph.query(cypher_query, params=params)
 
-            ans = self.graph.query(cypher_query, params=params)
+        if self.executor is not None:
+            answers = self.executor.map(query_node, node_embeddings)
+        else:
+            answers = [query_node(n_embedding) for n_embedding in node_embeddings]
+        for ans in answers:
             result_relations.extend(ans)
 
         return result_relations
@@ -415,6 +440,8 @@ class MemoryGraph:
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
         results = []
+        entity_names = list(dict.fromkeys(n for item in to_be_added for n in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
         for item in to_be_added:
             # entities
             source = item["source"]
@@ -430,8 +457,8 @@ class MemoryGraph:
             destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
 
             # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
+            source_embedding = entity_embeddings[source]
+            dest_embedding = entity_embeddings[destination]
 
             # search for the nodes with the closest embeddings
             source_node_search_result = self._search_source_node(source_embedding, filters, threshold=0.9)
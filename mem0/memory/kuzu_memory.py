@@ -34,6 +34,8 @@ class MemoryGraph:
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
+            rate_limit_config=self.config.embedder.rate_limit,
         )
         self.embedding_dims = self.embedding_model.config.embedding_dims
 
@@ -52,11 +54,26 @@ class MemoryGraph:
             self.llm_provider = self.config.graph_store.llm.provider
         # Get LLM config with proper null checks
         llm_config = None
+        llm_cache_config = None
+        llm_max_concurrency = None
+        llm_rate_limit_config = None
         if self.config.graph_store and self.config.graph_store.llm and hasattr(self.config.graph_store.llm, "config"):
             llm_config = self.config.graph_store.llm.config
+            llm_cache_config = getattr(self.config.graph_store.llm, "cache", None)
+            llm_max_concurrency = getattr(self.config.graph_store.llm, "max_concurrency", None)
+            llm_rate_limit_config = getattr(self.config.graph_store.llm, "rate_limit", None)
         elif hasattr(self.config.llm, "config"):
             llm_config = self.config.llm.config
-        self.llm = LlmFactory.create(self.llm_provider, llm_config)
+            llm_cache_config = getattr(self.config.llm, "cache", None)
+            llm_max_concurrency = getattr(self.config.llm, "max_concurrency", None)
+            llm_rate_limit_config = getattr(self.config.llm, "rate_limit", None)
+        self.llm = LlmFactory.create(
+            self.llm_provider,
+            llm_config,
+            cache_config=llm_cache_config,
+            max_concurrency=llm_max_concurrency,
+            rate_limit_config=llm_rate_limit_config,
+        )
 
         self.user_id = None
         self.threshold = 0.7
@@ -309,8 +326,8 @@ class MemoryGraph:
             params["run_id"] = filters["run_id"]
         node_props_str = ", ".join(node_props)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        node_embeddings = self.embedding_model.embed_batch(node_list)
+        for node, n_embedding in zip(node_list, node_embeddings):
             params["n_embedding"] = n_embedding
 
             results = []
@@ -433,6 +450,8 @@ class MemoryGraph:
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
         results = []
+        entity_names = list(dict.fromkeys(n for item in to_be_added for n in (item["source"], item["destination"])))
+        entity_embeddings = dict(zip(entity_names, self.embedding_model.embed_batch(entity_names)))
         for item in to_be_added:
             # entities
             source = item["source"]
@@ -445,8 +464,8 @@ class MemoryGraph:
             relationship_label = self.rel_label
 
             # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
+            source_embedding = entity_embeddings[source]
+            dest_embedding = entity_embeddings[destination]
 
             # search for the nodes with the closest embeddings
             source_node_search_result = self._search_source_node(source_embedding, filters, threshold=0.9)
@@ -1,16 +1,23 @@
 import asyncio
+import atexit
 import concurrent
+import contextvars
+import functools
 import gc
 import hashlib
 import json
 import logging
 import os
+import queue
+import threading
+import time
 import uuid
 import warnings
+import weakref
 
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional
 
 import pytz
 from pydantic import ValidationError
@@ -19,9 +26,14 @@ from mem0.configs.base import MemoryConfig, MemoryItem
 from mem0.configs.enums import MemoryType
 from mem0.configs.prompts import (
     PROCEDURAL_MEMORY_SYSTEM_PROMPT,
+    get_single_pass_memory_messages,
     get_update_memory_messages,
 )
+from mem0.embeddings.base import AsyncEmbeddingBase
+from mem0.llms.base import LLMBase
 from mem0.memory.base import MemoryBase
+from mem0.memory.checkpoint import AddCheckpoint, checkpoint_key
+from mem0.memory.executor import SharedExecutor
 from mem0.memory.setup import mem0_dir, setup_config
 from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
@@ -32,12 +44,14 @@ from mem0.memory.utils import (
     process_telemetry_filters,
     remove_code_blocks,
 )
+from mem0.memory.window import AddWindows, WindowTimer
 from mem0.utils.factory import (
     EmbedderFactory,
     GraphStoreFactory,
     LlmFactory,
     VectorStoreFactory,
 )
+from mem0.vector_stores.base import AsyncVectorStoreBase
 
 # Suppress SWIG deprecation warnings globally
 warnings.filterwarnings("ignore", category=DeprecationWarning, message=".*SwigPy.*")
@@ -119,10 +133,370 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _normalize_add_request(
+    messages,
+    *,
+    user_id: Optional[str] = None,
+    agent_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    memory_type: Optional[str] = None,
+):
+    """
+    Validate the arguments of `add` and return `(messages, metadata, filters)`.
+
+    `messages` is normalized to a list of message dicts; `metadata` and `filters` are built by
+    `_build_filters_and_metadata` from the session ids.
+    """
+    processed_metadata, effective_filters = _build_filters_and_metadata(
+        user_id=user_id,
+        agent_id=agent_id,
+        run_id=run_id,
+        input_metadata=metadata,
+    )
+
+    if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
+        raise ValueError(
+            f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
+        )
+
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+
+    elif isinstance(messages, dict):
+        messages = [messages]
+
+    elif not isinstance(messages, list):
+        raise ValueError("messages must be str, dict, or list[dict]")
+
+    return messages, processed_metadata, effective_filters
+
+
+def _raw_memory_entries(messages, metadata):
+    """
+    Return the `(content, payload, result)` of each message stored verbatim by `add(..., infer=False)`.
+
+    Invalid messages are logged and skipped, and system messages are ignored.
+    """
+    entries = []
+    for message_dict in messages:
+        if (
+            not isinstance(message_dict, dict)
+            or message_dict.get("role") is None
+            or message_dict.get("content") is None
+        ):
+            logger.warning(f"Skipping invalid message format: {message_dict}")
+            continue
+
+        if message_dict["role"] == "system":
+            continue
+
+        per_msg_meta = deepcopy(metadata)
+        per_msg_meta["role"] = message_dict["role"]
+
+        actor_name = message_dict.get("name")
+        if actor_name:
+            per_msg_meta["actor_id"] = actor_name
+
+        msg_content = message_dict["content"]
+        result = {
+            "id": str(uuid.uuid4()),
+            "memory": msg_content,
+            "event": "ADD",
+            "actor_id": actor_name if actor_name else None,
+            "role": message_dict["role"],
+        }
+        entries.append((msg_content, _new_memory_payload(msg_content, per_msg_meta), result))
+    return entries
+
+
+def _raw_memory_history(entries):
+    return [
+        {
+            "memory_id": result["id"],
+            "old_memory": None,
+            "new_memory": content,
+            "event": "ADD",
+            "created_at": payload.get("created_at"),
+            "actor_id": payload.get("actor_id"),
+            "role": payload.get("role"),
+        }
+        for content, payload, result in entries
+    ]
+
+
+def _record_add_many_result(item: Dict[str, Any], checkpoint: AddCheckpoint) -> Dict[str, Any]:
+    if "error" not in item:
+        checkpoint.record(item["id"])
+    return item
+
+
+# Providers whose config accepts an existing `client`, so the telemetry store can reuse the main connection.
+_SHARED_CLIENT_PROVIDERS = ("qdrant", "chroma", "pinecone")
+
+
+def _create_telemetry_vector_store(config: MemoryConfig, vector_store):
+    """
+    Create the `mem0migrations` vector store that holds the anonymous telemetry id.
+
+    The main store's client is reused where the provider supports it; otherwise a separate
+    store is created, under `mem0_dir` for the file-based FAISS and Qdrant backends.
+    """
+    provider = config.vector_store.provider
+    telemetry_config = config.vector_store.config.model_copy()
+    telemetry_config.collection_name = "mem0migrations"
+    if provider in _SHARED_CLIENT_PROVIDERS and getattr(vector_store, "client", None) is not None:
+        telemetry_config.client = vector_store.client
+    elif provider in ["faiss", "qdrant"]:
+        provider_path = f"migrations_{provider}"
+        telemetry_config.path = os.path.join(mem0_dir, provider_path)
+        os.makedirs(telemetry_config.path, exist_ok=True)
+    return VectorStoreFactory.create(provider, telemetry_config)
+
+
+def _new_memory_payload(data: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Return the stored payload of a new memory: `metadata` plus its text, hash and creation time."""
+    payload = metadata or {}
+    payload["data"] = data
+    payload["hash"] = hashlib.md5(data.encode()).hexdigest()
+    payload["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    return payload
+
+
+def _updated_memory_payload(
+    data: str, existing_payload: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Return the payload replacing `existing_payload`, keeping its creation time and session/actor ids."""
+    payload = deepcopy(metadata) if metadata is not None else {}
+    payload["data"] = data
+    payload["hash"] = hashlib.md5(data.encode()).hexdigest()
+    payload["created_at"] = existing_payload.get("created_at")
+    payload["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+    for key in ("user_id", "agent_id", "run_id", "actor_id", "role"):
+        if key in existing_payload:
+            payload[key] = existing_payload[key]
+    return payload
+
+
+_SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def _hash_record(memory_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the hash index entry of a stored memory."""
+    record = {key: payload.get(key) for key in _SCOPE_KEYS}
+    record["memory_id"] = memory_id
+    record["hash"] = payload.get("hash")
+    return record
+
+
+def _search_hash_records(search_results) -> list:
+    """Return the hash index entries of the memories found by a search that have a content hash."""
+    found = {mem.id: mem.payload for memories in search_results for mem in memories if mem.payload.get("hash")}
+    return [_hash_record(memory_id, payload) for memory_id, payload in found.items()]
+
+
+def _unindexed(records, indexed: Dict[str, str]) -> list:
+    """Return the hash index entries that are missing from, or differ from, the `indexed` hashes."""
+    return [record for record in records if indexed.get(record["memory_id"]) != record["hash"]]
+
+
+def _hash_scope(filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Return the session ids of `filters` for a hash index lookup, or None when the filters use
+    operators or lists that a stored payload cannot be checked against with plain equality.
+    """
+    if any(isinstance(value, (dict, list, tuple, set)) for value in filters.values()):
+        return None
+    scope = {key: filters[key] for key in _SCOPE_KEYS if key in filters}
+    return scope or None
+
+
+def _is_duplicate(memory, fact_hash: str, filters: Dict[str, Any]) -> bool:
+    """Whether the stored `memory` still has `fact_hash` and matches every filter."""
+    if memory is None or memory.payload.get("hash") != fact_hash:
+        return False
+    return all(memory.payload.get(key) == value for key, value in filters.items())
+
+
+def _confirm_duplicates(candidates, memories, fact_hashes: Dict[str, str], filters: Dict[str, Any]):
+    """
+    Check hash index candidates against the stored memories.
+
+    Returns:
+        tuple: The facts that match a stored memory, and the ids of index entries whose memory
+        was deleted or changed since it was recorded.
+    """
+    duplicates, stale = set(), []
+    for candidate, memory in zip(candidates, memories):
+        if _is_duplicate(memory, candidate["hash"], filters):
+            duplicates.add(fact_hashes[candidate["hash"]])
+        elif memory is None or memory.payload.get("hash") != candidate["hash"]:
+            stale.append(candidate["memory_id"])
+    return duplicates, stale
+
+
+class _AddStats:
+    """Counters of inferred adds and the work they avoided, shared by the threads and tasks of one memory instance."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(
+            (
+                "inferred_adds",
+                "llm_calls",
+                "add_seconds",
+                "duplicate_facts",
+                "embeddings_avoided",
+                "update_calls_avoided",
+            ),
+            0,
+        )
+
+    def record(self, **increments: float):
+        with self._lock:
+            for name, increment in increments.items():
+                self._counts[name] += increment
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counts)
+
+
+def _conversation_queries(messages) -> list:
+    """Return the texts of the user and assistant messages, used to find the memories related to a conversation."""
+    return [
+        message["content"]
+        for message in messages
+        if message.get("role") in ("user", "assistant") and isinstance(message.get("content"), str)
+        and message["content"].strip()
+    ]
+
+
+def _related_memories(search_results) -> list:
+    """Return the memories of several searches as `{"id", "text"}` dicts, without duplicates."""
+    related = {mem.id: {"id": mem.id, "text": mem.payload["data"]} for memories in search_results for mem in memories}
+    return list(related.values())
+
+
+# Receives the stage events of the `add` running in this context; set by `add_stream`.
+_add_progress = contextvars.ContextVar("_add_progress", default=None)
+
+
+class _AddCancelled(BaseException):
+    """Raised at the next stage of an `add_stream` whose consumer stopped iterating; like `CancelledError`, not an `Exception`."""
+
+
+def _report_progress(event: str, **fields):
+    """Send a stage event to the `add_stream` consuming the current `add`, if any."""
+    progress = _add_progress.get()
+    if progress is not None:
+        progress({"event": event, **fields})
+
+
+def _parse_memory_actions(response) -> list:
+    """Return the actions of an update LLM response, or an empty list when it is empty or not valid JSON."""
+    try:
+        if not response or not response.strip():
+            logger.warning("Empty response from LLM, no memories to extract")
+            return []
+        return json.loads(remove_code_blocks(response)).get("memory", [])
+    except Exception as e:
+        logger.error(f"Invalid JSON response: {e}")
+        return []
+
+
+def _triage_facts(
+    facts, search_results, reconcile_all: bool = False, similarity_threshold: Optional[float] = None
+):
+    """
+    Split extracted facts into those whose action is known without the update LLM call and
+    those the LLM has to reconcile with existing memories.
+
+    A fact without related memories is added. A fact whose related memories include one with
+    the same hash is already stored (NONE). With `similarity_threshold`, a fact whose related
+    memories all score below it is added too. Repeated facts are only considered once.
+
+    Args:
+        facts (list): The extracted facts.
+        search_results (list): For each fact, the related memories found in the vector store.
+        reconcile_all (bool): Send every fact to the LLM, e.g. when a custom update prompt may drop facts.
+        similarity_threshold (float, optional): Similarity below which a related memory is ignored.
+
+    Returns:
+        tuple: The direct ADD/NONE actions, the facts that need the LLM and the related memories
+        of those facts as `{"id", "text"}` dicts, without duplicates.
+    """
+    direct_actions, ambiguous_facts, related = [], [], {}
+    seen = set()
+    for fact, memories in zip(facts, search_results):
+        if fact in seen:
+            continue
+        seen.add(fact)
+
+        if not reconcile_all:
+            fact_hash = hashlib.md5(fact.encode()).hexdigest()
+            if any(mem.payload.get("hash") == fact_hash for mem in memories):
+                direct_actions.append({"text": fact, "event": "NONE"})
+                continue
+            if not memories or (
+                similarity_threshold is not None
+                and all(mem.score is not None and mem.score < similarity_threshold for mem in memories)
+            ):
+                direct_actions.append({"text": fact, "event": "ADD"})
+                continue
+
+        ambiguous_facts.append(fact)
+        for mem in memories:
+            related[mem.id] = {"id": mem.id, "text": mem.payload["data"]}
+    return direct_actions, ambiguous_facts, list(related.values())
+
+
+async def _call_async(component, method: str, *args, **kwargs):
+    """
+    Call `method` of an LLM, embedder or vector store from async code.
+
+    LLMs and components implementing `AsyncEmbeddingBase` or `AsyncVectorStoreBase` are awaited
+    through their `a<method>` counterpart; everything else runs the sync method in a worker thread.
+    """
+    if isinstance(component, LLMBase) or (
+        isinstance(component, (AsyncEmbeddingBase, AsyncVectorStoreBase)) and component.supports_async
+    ):
+        async_method = getattr(component, f"a{method}", None)
+        if async_method is not None:
+            return await async_method(*args, **kwargs)
+    return await asyncio.to_thread(getattr(component, method), *args, **kwargs)
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
 
+def _flush_adds_at_exit(memory_ref):
+    memory = memory_ref()
+    if memory is None:
+        return
+    try:
+        memory.flush_adds()
+    except Exception as e:
+        logger.error(f"Error adding buffered messages at exit: {e}")
+
+
+def _extract_expired_window(memory_ref, window):
+    memory = memory_ref()
+    if memory is not None:
+        memory._extract_expired_window(window)
+
+
+def _warn_buffered_adds_at_exit(memory_ref):
+    # Windows of an AsyncMemory can only be extracted on its event loop, which is gone by now
+    memory = memory_ref()
+    if memory is not None and len(memory._add_windows):
+        logger.warning(
+            f"{len(memory._add_windows)} buffered messages were not added; "
+            "await AsyncMemory.flush_adds() before the event loop closes"
+        )
+
+
 class Memory(MemoryBase):
     def __init__(self, config: MemoryConfig = MemoryConfig()):
         self.config = config
@@ -133,35 +507,80 @@ class Memory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
+            rate_limit_config=self.config.embedder.rate_limit,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider,
+            self.config.llm.config,
+            cache_config=self.config.llm.cache,
+            max_concurrency=self.config.llm.max_concurrency,
+            rate_limit_config=self.config.llm.rate_limit,
+        )
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
 
+        self.executor = SharedExecutor(
+            max_workers=self.config.executor.max_workers,
+            thread_name_prefix=self.config.executor.thread_name_prefix,
+        )
+        self._finalizer = weakref.finalize(self, self.executor.shutdown, wait=False)
+        self.vector_store.executor = self.executor
+        self._add_stats = _AddStats()
+        window_config = self.config.add_window
+        self._add_windows = (
+            AddWindows(window_config.max_messages, window_config.max_seconds) if window_config is not None else None
+        )
+        self._window_timer = WindowTimer(functools.partial(_extract_expired_window, weakref.ref(self)))
+        weakref.finalize(self, self._window_timer.close)
+        if self._add_windows is not None:
+            atexit.register(_flush_adds_at_exit, weakref.ref(self))
+
         self.enable_graph = False
 
         if self.config.graph_store.config:
             provider = self.config.graph_store.provider
             self.graph = GraphStoreFactory.create(provider, self.config)
+            self.graph.executor = self.executor
             self.enable_graph = True
         else:
             self.graph = None
 
-        telemetry_config = deepcopy(self.config.vector_store.config)
-        telemetry_config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
-            provider_path = f"migrations_{self.config.vector_store.provider}"
-            telemetry_config.path = os.path.join(mem0_dir, provider_path)
-            os.makedirs(telemetry_config.path, exist_ok=True)
-        self._telemetry_vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, telemetry_config
-        )
         capture_event("mem0.init", self, {"sync_type": "sync"})
 
+    def close(self):
+        """Extract the buffered add windows, then shut down the shared thread pool, waiting for running work to finish."""
+        self._window_timer.close()
+        self.flush_adds()
+        self._finalizer.detach()
+        self.executor.shutdown(wait=True)
+
+    def _run_with_graph(self, vector_call, graph_call):
+        """
+        Run `vector_call` inline and `graph_call` on the shared executor.
+
+        When graph memory is disabled nothing is submitted to the executor: `graph_call`, if
+        given, is cheap and runs inline after `vector_call`.
+
+        Returns:
+            tuple: The vector store result and the graph result (None when `graph_call` is None).
+        """
+        if not self.enable_graph:
+            return vector_call(), graph_call() if graph_call is not None else None
+
+        graph_future = self.executor.submit(contextvars.copy_context().run, graph_call)
+        vector_result = vector_call()
+        return vector_result, self.executor.result(graph_future, graph_call)
+
+    @functools.cached_property
+    def _telemetry_vector_store(self):
+        """Telemetry id store, created on first use; never created while telemetry is disabled."""
+        return _create_telemetry_vector_store(self.config, self.vector_store)
+
     @classmethod
     def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -229,44 +648,150 @@ class Memory(MemoryBase):
                   Example for v1.1+: `{"results": [{"id": "...", "memory": "...", "event": "ADD"}]}`
         """
 
-        processed_metadata, effective_filters = _build_filters_and_metadata(
-            user_id=user_id,
-            agent_id=agent_id,
-            run_id=run_id,
-            input_metadata=metadata,
+        messages, processed_metadata, effective_filters = _normalize_add_request(
+            messages, user_id=user_id, agent_id=agent_id, run_id=run_id, metadata=metadata, memory_type=memory_type
         )
 
-        if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
-            raise ValueError(
-                f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
-            )
+        if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
+            results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
+            return results
 
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
+        if infer and self._add_windows is not None:
+            return self._buffer_add(messages, processed_metadata, effective_filters)
 
-        elif isinstance(messages, dict):
-            messages = [messages]
+        return self._run_add_stages(messages, processed_metadata, effective_filters, infer)
 
-        elif not isinstance(messages, list):
-            raise ValueError("messages must be str, dict, or list[dict]")
+    def _buffer_add(self, messages, metadata, filters):
+        """
+        Buffer an inferred add in its session's window (see `MemoryConfig.add_window`).
 
-        if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
-            results = self._create_procedural_memory(messages, metadata=processed_metadata, prompt=prompt)
-            return results
+        Returns the result of the window's `add` if these messages filled it, else an empty result:
+        the window is extracted on the shared executor `max_seconds` after it was started, or by `flush_adds`.
+
+        Raises the error of extracting the session's previous window when this add closed it by
+        changing the metadata; the messages of this add stay buffered.
+        """
+        closed, full, started = self._add_windows.add(messages, metadata, filters)
+        if started is not None and full is None:
+            self._window_timer.schedule(started, self._add_windows.max_seconds)
+        if closed is not None:
+            try:
+                self._extract_window(closed, raise_errors=True)
+            except Exception:
+                if full is not None:
+                    self._extract_window(full)
+                raise
+        if full is not None:
+            return self._extract_window(full, raise_errors=True)
+        return {"results": [], "relations": []} if self.enable_graph else {"results": []}
+
+    def _extract_window(self, window, raise_errors: bool = False):
+        try:
+            return self._run_add_stages(window.messages, window.metadata, window.filters, True)
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"Error adding {len(window.messages)} buffered messages: {e}")
+        finally:
+            self._add_windows.finish(window)
+
+    def _extract_expired_window(self, window):
+        # Called on the window timer's thread, which must stay free for the next deadlines
+        if self._add_windows.pop(window):
+            self.executor.submit(self._extract_window, window)
+
+    def flush_adds(self) -> list:
+        """
+        Extract every buffered add window now, e.g. before shutting down.
+
+        Returns:
+            list: The `add` result of each window.
+        """
+        if self._add_windows is None:
+            return []
+        return [self._extract_window(window, raise_errors=True) for window in self._add_windows.drain()]
 
+    def add_stream(
+        self,
+        messages,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        memory_type: Optional[str] = None,
+        prompt: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Create a new memory like `add`, yielding an event as each stage of the pipeline finishes.
+
+        Events are dicts with an "event" key:
+
+        - `{"event": "facts_extracted", "facts": [...]}`: facts extracted from the messages (two-pass pipeline only).
+        - `{"event": "candidates_retrieved", "memories": [{"id": ..., "text": ...}]}`: stored memories
+          the new facts are reconciled with.
+        - `{"event": "memory_applied", "memory": {"id": ..., "memory": ..., "event": "ADD"}}`: one
+          ADD/UPDATE/DELETE written to the vector store.
+        - `{"event": "relations_added", "relations": {...}}`: graph relations added, when graph memory is enabled.
+        - `{"event": "done", "result": {...}}`: last event, with the return value of `add`.
+
+        The pipeline runs in a background thread. Closing the generator early (e.g. `break`) stops
+        it before its next stage; writes already started are completed. Takes the arguments of `add`.
+
+        Yields:
+            dict: Stage events, ending with the "done" event. Errors of `add` are raised.
+        """
+        events = queue.Queue()
+        cancelled = threading.Event()
+
+        def progress(event):
+            if cancelled.is_set():
+                raise _AddCancelled()
+            events.put(event)
+
+        def run():
+            _add_progress.set(progress)
+            try:
+                result = self.add(
+                    messages,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    infer=infer,
+                    memory_type=memory_type,
+                    prompt=prompt,
+                )
+                events.put({"event": "done", "result": result})
+            except _AddCancelled:
+                logger.info("add_stream closed by its consumer, remaining stages skipped")
+            except Exception as e:
+                events.put(e)
+
+        threading.Thread(target=run, name="mem0-add-stream", daemon=True).start()
+        try:
+            while True:
+                event = events.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+                if event["event"] == "done":
+                    return
+        finally:
+            cancelled.set()
+
+    def _run_add_stages(self, messages, metadata, filters, infer):
+        """Run the vector store and graph stages of `add` for normalized messages and format the result."""
         if self.config.llm.config.get("enable_vision"):
             messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
         else:
             messages = parse_vision_messages(messages)
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future1 = executor.submit(self._add_to_vector_store, messages, processed_metadata, effective_filters, infer)
-            future2 = executor.submit(self._add_to_graph, messages, effective_filters)
-
-            concurrent.futures.wait([future1, future2])
-
-            vector_store_result = future1.result()
-            graph_result = future2.result()
+        vector_store_result, graph_result = self._run_with_graph(
+            functools.partial(self._add_to_vector_store, messages, metadata, filters, infer),
+            functools.partial(self._add_to_graph, messages, filters),
+        )
 
         if self.api_version == "v1.0":
             warnings.warn(
@@ -274,7 +799,7 @@ class Memory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return vector_store_result
 
@@ -286,43 +811,77 @@ class Memory(MemoryBase):
 
         return {"results": vector_store_result}
 
-    def _add_to_vector_store(self, messages, metadata, filters, infer):
-        if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format: {message_dict}")
-                    continue
+    def add_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = 4,
+        infer: bool = True,
+        checkpoint_path: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Add memories for many requests, e.g. to backfill historical conversations.
 
-                if message_dict["role"] == "system":
-                    continue
+        Requests are processed by up to `concurrency` worker threads, so fact extraction, embedding
+        and vector writes of different requests overlap. `requests` is consumed lazily and at most
+        `concurrency` requests are in flight, which bounds memory use for large or generated inputs.
+        Results are yielded as requests finish, not in input order.
 
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+        Args:
+            requests (Iterable[dict]): Keyword arguments of `add`, e.g.
+                `{"messages": [...], "user_id": "alice"}`. An optional "id" key identifies the
+                request in the checkpoint; otherwise its position in `requests` is used.
+            concurrency (int, optional): Number of requests processed at once. Defaults to 4.
+            infer (bool, optional): Default for requests that do not set "infer". Defaults to True.
+            checkpoint_path (str, optional): JSON-lines file recording completed requests. Requests
+                already recorded in it are skipped, so an interrupted run can be resumed. Defaults to None.
+
+        Yields:
+            dict: `{"index": ..., "id": ..., "result": ...}` for each completed request, or
+                `{"index": ..., "id": ..., "error": ...}` for a request that failed.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        checkpoint = AddCheckpoint(checkpoint_path)
+        pending = set()
+        try:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="mem0-add-many"
+            ) as executor:
+                for index, request in enumerate(requests):
+                    key = checkpoint_key(index, request)
+                    if key in checkpoint:
+                        continue
+                    if len(pending) >= concurrency:
+                        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                        for future in done:
+                            yield _record_add_many_result(future.result(), checkpoint)
+                    pending.add(executor.submit(self._add_many_item, index, key, request, infer))
+
+                for future in concurrent.futures.as_completed(pending):
+                    yield _record_add_many_result(future.result(), checkpoint)
+        finally:
+            checkpoint.close()
+
+    def _add_many_item(self, index, key, request, infer):
+        try:
+            request = dict(request)
+            request.pop("id", None)
+            request.setdefault("infer", infer)
+            result = self.add(**request)
+            return {"index": index, "id": key, "result": result}
+        except Exception as e:
+            logger.error(f"Error adding memories for request {key}: {e}")
+            return {"index": index, "id": key, "error": str(e)}
+
+    def _add_to_vector_store(self, messages, metadata, filters, infer):
+        if not infer:
+            return self._add_raw_messages(messages, metadata, filters)
+        if self.config.add_pipeline == "single_pass":
+            return self._add_single_pass(messages, metadata, filters)
 
+        started = time.perf_counter()
         parsed_messages = parse_messages(messages)
 
         if self.config.custom_fact_extraction_prompt:
@@ -338,6 +897,7 @@ class Memory(MemoryBase):
             ],
             response_format={"type": "json_object"},
         )
+        self._add_stats.record(llm_calls=1)
 
         try:
             response = remove_code_blocks(response)
@@ -345,29 +905,42 @@ class Memory(MemoryBase):
         except Exception as e:
             logger.error(f"Error in new_retrieved_facts: {e}")
             new_retrieved_facts = []
+        _report_progress("facts_extracted", facts=list(new_retrieved_facts))
+
+        extracted_facts = len(new_retrieved_facts)
+        duplicate_facts = self._find_duplicate_facts(new_retrieved_facts, filters)
+        if duplicate_facts:
+            logger.info(f"Skipping {len(duplicate_facts)} facts that are already stored")
+            new_retrieved_facts = [fact for fact in new_retrieved_facts if fact not in duplicate_facts]
+            skipped = extracted_facts - len(new_retrieved_facts)
+            self._add_stats.record(duplicate_facts=skipped, embeddings_avoided=skipped)
 
         if not new_retrieved_facts:
             logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
 
-        retrieved_old_memory = []
+        direct_actions, update_facts, retrieved_old_memory = [], [], []
         new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
+        if new_retrieved_facts:
+            # Embed all facts in one request and look up their neighbours in one multi-query search.
+            fact_embeddings = self.embedding_model.embed_batch(new_retrieved_facts, "add")
+            new_message_embeddings = dict(zip(new_retrieved_facts, fact_embeddings))
+            search_results = self.vector_store.search_batch(
+                queries=new_retrieved_facts,
+                vectors=fact_embeddings,
                 limit=5,
                 filters=filters,
             )
-            for mem in existing_memories:
-                retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
+            self._record_hashes(search_results)
+            direct_actions, update_facts, retrieved_old_memory = _triage_facts(
+                new_retrieved_facts,
+                search_results,
+                reconcile_all=bool(self.config.custom_update_memory_prompt),
+                similarity_threshold=self.config.update_similarity_threshold,
+            )
+        if extracted_facts and not update_facts:
+            self._add_stats.record(update_calls_avoided=1)
         logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        _report_progress("candidates_retrieved", memories=deepcopy(retrieved_old_memory))
 
         # mapping UUIDs with integers for handling UUID hallucinations
         temp_uuid_mapping = {}
@@ -375,9 +948,9 @@ class Memory(MemoryBase):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
+        if update_facts:
             function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+                retrieved_old_memory, update_facts, self.config.custom_update_memory_prompt
             )
 
             try:
@@ -388,68 +961,22 @@ class Memory(MemoryBase):
             except Exception as e:
                 logger.error(f"Error in new memory actions response: {e}")
                 response = ""
-
-            try:
-                if not response or not response.strip():
-                    logger.warning("Empty response from LLM, no memories to extract")
-                    new_memories_with_actions = {}
-                else:
-                    response = remove_code_blocks(response)
-                    new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+            self._add_stats.record(llm_calls=1)
+            new_memories_with_actions = _parse_memory_actions(response)
         else:
-            new_memories_with_actions = {}
+            new_memories_with_actions = []
 
-        returned_memories = []
         try:
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(resp)
-                try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        logger.info("Skipping memory entry because of empty `text` field.")
-                        continue
-
-                    event_type = resp.get("event")
-                    if event_type == "ADD":
-                        memory_id = self._create_memory(
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
-                    elif event_type == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                            }
-                        )
-                    elif event_type == "NONE":
-                        logger.info("NOOP for Memory.")
-                except Exception as e:
-                    logger.error(f"Error processing memory action: {resp}, Error: {e}")
+            returned_memories = self._apply_memory_actions(
+                direct_actions + new_memories_with_actions,
+                temp_uuid_mapping,
+                new_message_embeddings,
+                metadata,
+            )
         except Exception as e:
             logger.error(f"Error iterating new_memories_with_actions: {e}")
+            returned_memories = []
+        self._add_stats.record(inferred_adds=1, add_seconds=time.perf_counter() - started)
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event(
@@ -459,6 +986,290 @@ class Memory(MemoryBase):
         )
         return returned_memories
 
+    def _add_single_pass(self, messages, metadata, filters):
+        """
+        Extract facts and decide their ADD/UPDATE/DELETE/NONE actions in one LLM call.
+
+        The related memories are found before the call, from the user and assistant messages of the
+        conversation with one `embed_batch` and one `search_batch`, instead of from the extracted facts
+        after a first LLM call. Enabled with `add_pipeline="single_pass"`.
+        """
+        started = time.perf_counter()
+        queries = _conversation_queries(messages)
+        retrieved_old_memory = []
+        if queries:
+            query_embeddings = self.embedding_model.embed_batch(queries, "search")
+            search_results = self.vector_store.search_batch(
+                queries=queries, vectors=query_embeddings, limit=5, filters=filters
+            )
+            self._record_hashes(search_results)
+            retrieved_old_memory = _related_memories(search_results)
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        _report_progress("candidates_retrieved", memories=deepcopy(retrieved_old_memory))
+
+        # mapping UUIDs with integers for handling UUID hallucinations
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        system_prompt, user_prompt = get_single_pass_memory_messages(
+            parse_messages(messages),
+            retrieved_old_memory,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
+        )
+        try:
+            response = self.llm.generate_response(
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in single-pass memory actions response: {e}")
+            response = ""
+        self._add_stats.record(llm_calls=1)
+
+        try:
+            returned_memories = self._apply_memory_actions(
+                _parse_memory_actions(response), temp_uuid_mapping, {}, metadata
+            )
+        except Exception as e:
+            logger.error(f"Error applying single-pass memory actions: {e}")
+            returned_memories = []
+        self._add_stats.record(inferred_adds=1, add_seconds=time.perf_counter() - started)
+
+        keys, encoded_ids = process_telemetry_filters(filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {
+                "version": self.api_version,
+                "keys": keys,
+                "encoded_ids": encoded_ids,
+                "sync_type": "sync",
+                "pipeline": "single_pass",
+            },
+        )
+        return returned_memories
+
+    def _find_duplicate_facts(self, facts, filters):
+        """
+        Return the facts that exactly match a stored memory in the scope of `filters`.
+
+        Candidates are looked up by content hash in the hash index of the history database and
+        confirmed with one `bulk_get`. Entries of memories deleted or changed since are dropped.
+        """
+        scope = _hash_scope(filters)
+        if scope is None or not facts:
+            return set()
+        fact_hashes = {hashlib.md5(fact.encode()).hexdigest(): fact for fact in facts}
+        candidates = self.db.find_memory_hashes(list(fact_hashes), scope)
+        if not candidates:
+            return set()
+        memories = self.vector_store.bulk_get([candidate["memory_id"] for candidate in candidates])
+        duplicates, stale = _confirm_duplicates(candidates, memories, fact_hashes, filters)
+        self.db.delete_memory_hashes(stale)
+        return duplicates
+
+    def _record_hashes(self, search_results):
+        """
+        Add the memories found by a fact search to the hash index, covering memories stored before it existed.
+
+        The index is only written when a found memory is missing from it, which is rare once it is
+        populated, so most adds only read it.
+        """
+        records = _search_hash_records(search_results)
+        indexed = self.db.get_memory_hashes([record["memory_id"] for record in records])
+        self.db.set_memory_hashes(_unindexed(records, indexed))
+
+    def add_stats(self) -> Dict[str, float]:
+        """
+        Return the counters of inferred adds: how many ran, their LLM calls and total seconds (to compare
+        the two `add_pipeline` modes), and the work they avoided: extracted facts that matched a stored
+        memory (and so were not embedded) and update LLM calls skipped because no fact needed reconciliation.
+        """
+        return self._add_stats.snapshot()
+
+    def _add_raw_messages(self, messages, metadata, filters):
+        """
+        Store messages verbatim, without fact extraction.
+
+        All messages are embedded with one `embed_batch` and written with one vector store
+        `insert` and one history transaction; a single telemetry event is sent per call.
+        """
+        entries = _raw_memory_entries(messages, metadata)
+        if entries:
+            embeddings = self.embedding_model.embed_batch([content for content, _, _ in entries], "add")
+            self.vector_store.insert(
+                vectors=embeddings,
+                ids=[result["id"] for _, _, result in entries],
+                payloads=[payload for _, payload, _ in entries],
+            )
+            self.db.add_history_batch(_raw_memory_history(entries))
+            self.db.set_memory_hashes([_hash_record(result["id"], payload) for _, payload, result in entries])
+            for _, _, result in entries:
+                _report_progress("memory_applied", memory=result)
+
+        keys, encoded_ids = process_telemetry_filters(filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {
+                "version": self.api_version,
+                "keys": keys,
+                "encoded_ids": encoded_ids,
+                "sync_type": "sync",
+                "infer": False,
+                "memory_count": len(entries),
+            },
+        )
+        return [result for _, _, result in entries]
+
+    def _apply_memory_actions(self, actions, temp_uuid_mapping, existing_embeddings, metadata):
+        """
+        Apply the ADD/UPDATE/DELETE actions returned by the update LLM call as one plan.
+
+        The memories targeted by updates and deletes are fetched with one `bulk_get`, missing
+        embeddings are computed with one `embed_batch` per action type, and the plan is written
+        with one `insert`, one `bulk_update`, one `bulk_delete` and one history transaction.
+        When several actions target the same memory, only the last one is applied.
+
+        Args:
+            actions (list): Actions from the update LLM response.
+            temp_uuid_mapping (dict): Maps the integer ids shown to the LLM back to memory ids.
+            existing_embeddings (dict): Embeddings already computed for the extracted facts, keyed by text.
+            metadata (dict): Metadata template for new and updated memories.
+
+        Returns:
+            list: The applied actions, in the order the LLM returned them. An action superseded by a
+                later one for the same memory is left out, so the later one keeps its own position.
+        """
+        plan = {}
+        for resp in actions:
+            logger.info(resp)
+            try:
+                action_text = resp.get("text")
+                if not action_text:
+                    logger.info("Skipping memory entry because of empty `text` field.")
+                    continue
+
+                event_type = resp.get("event")
+                if event_type == "ADD":
+                    memory_id = str(uuid.uuid4())
+                elif event_type in ("UPDATE", "DELETE"):
+                    memory_id = temp_uuid_mapping[resp.get("id")]
+                    plan.pop(memory_id, None)
+                elif event_type == "NONE":
+                    logger.info("NOOP for Memory.")
+                    continue
+                else:
+                    continue
+                plan[memory_id] = (event_type, action_text, resp)
+            except Exception as e:
+                logger.error(f"Error processing memory action: {resp}, Error: {e}")
+
+        targets = [memory_id for memory_id, (event_type, _, _) in plan.items() if event_type != "ADD"]
+        existing = dict(zip(targets, self.vector_store.bulk_get(targets))) if targets else {}
+
+        embeddings = dict(existing_embeddings)
+        for event_type, memory_action in (("ADD", "add"), ("UPDATE", "update")):
+            pending = (text for event, text, _ in plan.values() if event == event_type and text not in embeddings)
+            texts = list(dict.fromkeys(pending))
+            if texts:
+                embeddings.update(zip(texts, self.embedding_model.embed_batch(texts, memory_action)))
+
+        writes = {"ADD": [], "UPDATE": [], "DELETE": []}
+        results = {}
+        for memory_id, (event_type, action_text, resp) in plan.items():
+            if event_type == "ADD":
+                payload = _new_memory_payload(action_text, deepcopy(metadata))
+                history = {
+                    "memory_id": memory_id,
+                    "old_memory": None,
+                    "new_memory": action_text,
+                    "event": "ADD",
+                    "created_at": payload.get("created_at"),
+                    "actor_id": payload.get("actor_id"),
+                    "role": payload.get("role"),
+                }
+                results[memory_id] = {"id": memory_id, "memory": action_text, "event": event_type}
+                writes["ADD"].append((memory_id, embeddings[action_text], payload, history))
+                continue
+
+            existing_memory = existing.get(memory_id)
+            if existing_memory is None:
+                logger.error(f"Error getting memory with ID {memory_id} during {event_type.lower()}.")
+                continue
+
+            if event_type == "UPDATE":
+                payload = _updated_memory_payload(action_text, existing_memory.payload, metadata)
+                history = {
+                    "memory_id": memory_id,
+                    "old_memory": existing_memory.payload.get("data"),
+                    "new_memory": action_text,
+                    "event": "UPDATE",
+                    "created_at": payload["created_at"],
+                    "updated_at": payload["updated_at"],
+                    "actor_id": payload.get("actor_id"),
+                    "role": payload.get("role"),
+                }
+                results[memory_id] = {
+                    "id": memory_id,
+                    "memory": action_text,
+                    "event": event_type,
+                    "previous_memory": resp.get("old_memory"),
+                }
+                writes["UPDATE"].append((memory_id, embeddings[action_text], payload, history))
+            else:
+                history = {
+                    "memory_id": memory_id,
+                    "old_memory": existing_memory.payload.get("data"),
+                    "new_memory": None,
+                    "event": "DELETE",
+                    "actor_id": existing_memory.payload.get("actor_id"),
+                    "role": existing_memory.payload.get("role"),
+                    "is_deleted": 1,
+                }
+                results[memory_id] = {"id": memory_id, "memory": action_text, "event": event_type}
+                writes["DELETE"].append((memory_id, None, None, history))
+
+        applied = []
+        for event_type, entries in writes.items():
+            if not entries:
+                continue
+            try:
+                if event_type == "ADD":
+                    self.vector_store.insert(
+                        vectors=[entry[1] for entry in entries],
+                        ids=[entry[0] for entry in entries],
+                        payloads=[entry[2] for entry in entries],
+                    )
+                elif event_type == "UPDATE":
+                    self.vector_store.bulk_update(
+                        [{"vector_id": entry[0], "vector": entry[1], "payload": entry[2]} for entry in entries]
+                    )
+                else:
+                    self.vector_store.bulk_delete([entry[0] for entry in entries])
+            except Exception as e:
+                logger.error(f"Error applying {len(entries)} {event_type} memory actions: {e}")
+                continue
+            applied.extend(entries)
+
+        self.db.add_history_batch([history for _, _, _, history in applied])
+        self.db.set_memory_hashes(
+            [_hash_record(memory_id, payload) for memory_id, _, payload, _ in applied if payload is not None]
+        )
+        self.db.delete_memory_hashes([memory_id for memory_id, _, payload, _ in applied if payload is None])
+        event_names = {"ADD": "mem0._create_memory", "UPDATE": "mem0._update_memory", "DELETE": "mem0._delete_memory"}
+        for memory_id, _, _, history in applied:
+            capture_event(event_names[history["event"]], self, {"memory_id": memory_id, "sync_type": "sync"})
+
+        applied_ids = {memory_id for memory_id, _, _, _ in applied}
+        returned_memories = [result for memory_id, result in results.items() if memory_id in applied_ids]
+        for result in returned_memories:
+            _report_progress("memory_applied", memory=result)
+        return returned_memories
+
     def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -467,6 +1278,7 @@ class Memory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = self.graph.add(data, filters)
+            _report_progress("relations_added", relations=added_entities)
 
         return added_entities
 
@@ -553,18 +1365,10 @@ class Memory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "sync"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
-
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+        all_memories_result, graph_entities_result = self._run_with_graph(
+            functools.partial(self._get_all_from_vector_store, effective_filters, limit),
+            functools.partial(self.graph.get_all, effective_filters, limit) if self.enable_graph else None,
+        )
 
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
@@ -668,18 +1472,14 @@ class Memory(MemoryBase):
             },
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._search_vector_store, query, effective_filters, limit, threshold)
-            future_graph_entities = (
-                executor.submit(self.graph.search, query, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
-            )
+        original_memories, graph_entities = self._run_with_graph(
+            functools.partial(self._search_vector_store, query, effective_filters, limit, threshold),
+            functools.partial(self.graph.search, query, effective_filters, limit) if self.enable_graph else None,
+        )
 
-            original_memories = future_memories.result()
-            graph_entities = future_graph_entities.result() if future_graph_entities else None
+        if self._add_windows is not None and threshold is None:
+            # Read-your-writes: messages of add windows not stored yet. They have no score, so none pass a threshold.
+            original_memories = self._add_windows.with_overlay(original_memories, effective_filters, limit)
 
         if self.enable_graph:
             return {"results": original_memories, "relations": graph_entities}
@@ -822,10 +1622,7 @@ class Memory(MemoryBase):
         else:
             embeddings = self.embedding_model.embed(data, memory_action="add")
         memory_id = str(uuid.uuid4())
-        metadata = metadata or {}
-        metadata["data"] = data
-        metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        metadata = _new_memory_payload(data, metadata)
 
         self.vector_store.insert(
             vectors=[embeddings],
@@ -841,6 +1638,7 @@ class Memory(MemoryBase):
             actor_id=metadata.get("actor_id"),
             role=metadata.get("role"),
         )
+        self.db.set_memory_hashes([_hash_record(memory_id, metadata)])
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -892,24 +1690,7 @@ class Memory(MemoryBase):
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
-
-        new_metadata = deepcopy(metadata) if metadata is not None else {}
-
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-        if "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        new_metadata = _updated_memory_payload(data, existing_memory.payload, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
@@ -933,6 +1714,7 @@ class Memory(MemoryBase):
             actor_id=new_metadata.get("actor_id"),
             role=new_metadata.get("role"),
         )
+        self.db.set_memory_hashes([_hash_record(memory_id, new_metadata)])
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -950,6 +1732,7 @@ class Memory(MemoryBase):
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
+        self.db.delete_memory_hashes([memory_id])
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "sync"})
         return memory_id
 
@@ -964,6 +1747,7 @@ class Memory(MemoryBase):
 
         if hasattr(self.db, "connection") and self.db.connection:
             self.db.connection.execute("DROP TABLE IF EXISTS history")
+            self.db.connection.execute("DROP TABLE IF EXISTS memory_hashes")
             self.db.connection.close()
 
         self.db = SQLiteManager(self.config.history_db_path)
@@ -976,6 +1760,7 @@ class Memory(MemoryBase):
             self.vector_store = VectorStoreFactory.create(
                 self.config.vector_store.provider, self.config.vector_store.config
             )
+        self.vector_store.executor = self.executor
         capture_event("mem0.reset", self, {"sync_type": "sync"})
 
     def chat(self, query):
@@ -990,11 +1775,19 @@ class AsyncMemory(MemoryBase):
             self.config.embedder.provider,
             self.config.embedder.config,
             self.config.vector_store.config,
+            cache_config=self.config.embedder.cache,
+            rate_limit_config=self.config.embedder.rate_limit,
         )
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
         )
-        self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
+        self.llm = LlmFactory.create(
+            self.config.llm.provider,
+            self.config.llm.config,
+            cache_config=self.config.llm.cache,
+            max_concurrency=self.config.llm.max_concurrency,
+            rate_limit_config=self.config.llm.rate_limit,
+        )
         self.db = SQLiteManager(self.config.history_db_path)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
@@ -1008,17 +1801,22 @@ class AsyncMemory(MemoryBase):
         else:
             self.graph = None
 
-        self.config.vector_store.config.collection_name = "mem0migrations"
-        if self.config.vector_store.provider in ["faiss", "qdrant"]:
-            provider_path = f"migrations_{self.config.vector_store.provider}"
-            self.config.vector_store.config.path = os.path.join(mem0_dir, provider_path)
-            os.makedirs(self.config.vector_store.config.path, exist_ok=True)
-        self._telemetry_vector_store = VectorStoreFactory.create(
-            self.config.vector_store.provider, self.config.vector_store.config
+        self._add_stats = _AddStats()
+        window_config = self.config.add_window
+        self._add_windows = (
+            AddWindows(window_config.max_messages, window_config.max_seconds) if window_config is not None else None
         )
+        self._window_tasks = set()
+        if self._add_windows is not None:
+            atexit.register(_warn_buffered_adds_at_exit, weakref.ref(self))
 
         capture_event("mem0.init", self, {"sync_type": "async"})
 
+    @functools.cached_property
+    def _telemetry_vector_store(self):
+        """Telemetry id store, created on first use; never created while telemetry is disabled."""
+        return _create_telemetry_vector_store(self.config, self.vector_store)
+
     @classmethod
     async def from_config(cls, config_dict: Dict[str, Any]):
         try:
@@ -1074,39 +1872,123 @@ class AsyncMemory(MemoryBase):
         Returns:
             dict: A dictionary containing the result of the memory addition operation.
         """
-        processed_metadata, effective_filters = _build_filters_and_metadata(
-            user_id=user_id, agent_id=agent_id, run_id=run_id, input_metadata=metadata
+        messages, processed_metadata, effective_filters = _normalize_add_request(
+            messages, user_id=user_id, agent_id=agent_id, run_id=run_id, metadata=metadata, memory_type=memory_type
         )
 
-        if memory_type is not None and memory_type != MemoryType.PROCEDURAL.value:
-            raise ValueError(
-                f"Invalid 'memory_type'. Please pass {MemoryType.PROCEDURAL.value} to create procedural memories."
-            )
-
-        if isinstance(messages, str):
-            messages = [{"role": "user", "content": messages}]
-
-        elif isinstance(messages, dict):
-            messages = [messages]
-
-        elif not isinstance(messages, list):
-            raise ValueError("messages must be str, dict, or list[dict]")
-
         if agent_id is not None and memory_type == MemoryType.PROCEDURAL.value:
             results = await self._create_procedural_memory(
                 messages, metadata=processed_metadata, prompt=prompt, llm=llm
             )
             return results
 
+        if infer and self._add_windows is not None:
+            return await self._buffer_add(messages, processed_metadata, effective_filters)
+
+        return await self._run_add_stages(messages, processed_metadata, effective_filters, infer)
+
+    async def _buffer_add(self, messages, metadata, filters):
+        """Buffer an inferred add in its session's window, like `Memory._buffer_add`; timers run on the event loop."""
+        closed, full, started = self._add_windows.add(messages, metadata, filters)
+        if started is not None and full is None:
+            asyncio.get_running_loop().call_later(
+                self._add_windows.max_seconds, self._schedule_expired_window, started
+            )
+        if closed is not None:
+            try:
+                await self._extract_window(closed, raise_errors=True)
+            except Exception:
+                if full is not None:
+                    await self._extract_window(full)
+                raise
+        if full is not None:
+            return await self._extract_window(full, raise_errors=True)
+        return {"results": [], "relations": []} if self.enable_graph else {"results": []}
+
+    async def _extract_window(self, window, raise_errors: bool = False):
+        try:
+            return await self._run_add_stages(window.messages, window.metadata, window.filters, True)
+        except Exception as e:
+            if raise_errors:
+                raise
+            logger.error(f"Error adding {len(window.messages)} buffered messages: {e}")
+        finally:
+            self._add_windows.finish(window)
+
+    def _schedule_expired_window(self, window):
+        if self._add_windows.pop(window):
+            task = asyncio.create_task(self._extract_window(window))
+            self._window_tasks.add(task)
+            task.add_done_callback(self._window_tasks.discard)
+
+    async def flush_adds(self) -> list:
+        """
+        Extract every buffered add window now, and wait for the windows being extracted by timers.
+
+        Returns:
+            list: The `add` result of each window extracted by this call.
+        """
+        if self._add_windows is None:
+            return []
+        results = [await self._extract_window(window, raise_errors=True) for window in self._add_windows.drain()]
+        await asyncio.gather(*self._window_tasks, return_exceptions=True)
+        return results
+
+    async def add_stream(
+        self,
+        messages,
+        *,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        run_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        infer: bool = True,
+        memory_type: Optional[str] = None,
+        prompt: Optional[str] = None,
+        llm=None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Create a new memory like `add`, yielding an event as each stage of the pipeline finishes.
+
+        Yields the events of `Memory.add_stream`, ending with `{"event": "done", "result": ...}`.
+        Closing the iterator early (e.g. with `contextlib.aclosing` and `break`) cancels the
+        running `add`. Takes the arguments of `add`.
+        """
+        events = asyncio.Queue()
+        token = _add_progress.set(events.put_nowait)
+        try:
+            task = asyncio.create_task(
+                self.add(
+                    messages,
+                    user_id=user_id,
+                    agent_id=agent_id,
+                    run_id=run_id,
+                    metadata=metadata,
+                    infer=infer,
+                    memory_type=memory_type,
+                    prompt=prompt,
+                    llm=llm,
+                )
+            )
+        finally:
+            _add_progress.reset(token)
+        task.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            yield {"event": "done", "result": await task}
+        finally:
+            task.cancel()
+
+    async def _run_add_stages(self, messages, metadata, filters, infer):
+        """Run the vector store and graph stages of `add` concurrently for normalized messages and format the result."""
         if self.config.llm.config.get("enable_vision"):
             messages = parse_vision_messages(messages, self.llm, self.config.llm.config.get("vision_details"))
         else:
             messages = parse_vision_messages(messages)
 
-        vector_store_task = asyncio.create_task(
-            self._add_to_vector_store(messages, processed_metadata, effective_filters, infer)
-        )
-        graph_task = asyncio.create_task(self._add_to_graph(messages, effective_filters))
+        vector_store_task = asyncio.create_task(self._add_to_vector_store(messages, metadata, filters, infer))
+        graph_task = asyncio.create_task(self._add_to_graph(messages, filters))
 
         vector_store_result, graph_result = await asyncio.gather(vector_store_task, graph_task)
 
@@ -1116,7 +1998,7 @@ class AsyncMemory(MemoryBase):
                 "To use the latest format, set `api_version='v1.1'`. "
                 "The current format will be removed in mem0ai 1.1.0 and later versions.",
                 category=DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
             return vector_store_result
 
@@ -1128,6 +2010,79 @@ class AsyncMemory(MemoryBase):
 
         return {"results": vector_store_result}
 
+    async def add_many(
+        self,
+        requests,
+        *,
+        concurrency: int = 4,
+        infer: bool = True,
+        checkpoint_path: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Add memories for many requests asynchronously, e.g. to backfill historical conversations.
+
+        Up to `concurrency` requests run at once, so fact extraction, embedding and vector writes of
+        different requests overlap. `requests` may be a sync or async iterable and is consumed lazily.
+        Results are yielded as requests finish, not in input order.
+
+        Args:
+            requests (Iterable[dict] or AsyncIterable[dict]): Keyword arguments of `add`, with an
+                optional "id" key identifying the request in the checkpoint.
+            concurrency (int, optional): Number of requests processed at once. Defaults to 4.
+            infer (bool, optional): Default for requests that do not set "infer". Defaults to True.
+            checkpoint_path (str, optional): JSON-lines file recording completed requests. Requests
+                already recorded in it are skipped, so an interrupted run can be resumed. Defaults to None.
+
+        Yields:
+            dict: `{"index": ..., "id": ..., "result": ...}` for each completed request, or
+                `{"index": ..., "id": ..., "error": ...}` for a request that failed.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        if not hasattr(requests, "__aiter__"):
+            sync_requests = requests
+
+            async def _iterate():
+                for request in sync_requests:
+                    yield request
+
+            requests = _iterate()
+
+        checkpoint = AddCheckpoint(checkpoint_path)
+        pending = set()
+        try:
+            index = -1
+            async for request in requests:
+                index += 1
+                key = checkpoint_key(index, request)
+                if key in checkpoint:
+                    continue
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield _record_add_many_result(task.result(), checkpoint)
+                pending.add(asyncio.create_task(self._add_many_item(index, key, request, infer)))
+
+            for task in asyncio.as_completed(pending):
+                yield _record_add_many_result(await task, checkpoint)
+            pending = set()
+        finally:
+            for task in pending:
+                task.cancel()
+            checkpoint.close()
+
+    async def _add_many_item(self, index, key, request, infer):
+        try:
+            request = dict(request)
+            request.pop("id", None)
+            request.setdefault("infer", infer)
+            result = await self.add(**request)
+            return {"index": index, "id": key, "result": result}
+        except Exception as e:
+            logger.error(f"Error adding memories for request {key}: {e}")
+            return {"index": index, "id": key, "error": str(e)}
+
     async def _add_to_vector_store(
         self,
         messages: list,
@@ -1136,41 +2091,11 @@ class AsyncMemory(MemoryBase):
         infer: bool,
     ):
         if not infer:
-            returned_memories = []
-            for message_dict in messages:
-                if (
-                    not isinstance(message_dict, dict)
-                    or message_dict.get("role") is None
-                    or message_dict.get("content") is None
-                ):
-                    logger.warning(f"Skipping invalid message format (async): {message_dict}")
-                    continue
-
-                if message_dict["role"] == "system":
-                    continue
-
-                per_msg_meta = deepcopy(metadata)
-                per_msg_meta["role"] = message_dict["role"]
-
-                actor_name = message_dict.get("name")
-                if actor_name:
-                    per_msg_meta["actor_id"] = actor_name
-
-                msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
-
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
-                )
-            return returned_memories
+            return await self._add_raw_messages(messages, metadata, effective_filters)
+        if self.config.add_pipeline == "single_pass":
+            return await self._add_single_pass(messages, metadata, effective_filters)
 
+        started = time.perf_counter()
         parsed_messages = parse_messages(messages)
         if self.config.custom_fact_extraction_prompt:
             system_prompt = self.config.custom_fact_extraction_prompt
@@ -1178,81 +2103,170 @@ class AsyncMemory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
+        response = await _call_async(
+            self.llm,
+            "generate_response",
             messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
             response_format={"type": "json_object"},
         )
+        self._add_stats.record(llm_calls=1)
         try:
             response = remove_code_blocks(response)
             new_retrieved_facts = json.loads(response)["facts"]
         except Exception as e:
             logger.error(f"Error in new_retrieved_facts: {e}")
             new_retrieved_facts = []
+        _report_progress("facts_extracted", facts=list(new_retrieved_facts))
+
+        extracted_facts = len(new_retrieved_facts)
+        duplicate_facts = await self._find_duplicate_facts(new_retrieved_facts, effective_filters)
+        if duplicate_facts:
+            logger.info(f"Skipping {len(duplicate_facts)} facts that are already stored")
+            new_retrieved_facts = [fact for fact in new_retrieved_facts if fact not in duplicate_facts]
+            skipped = extracted_facts - len(new_retrieved_facts)
+            self._add_stats.record(duplicate_facts=skipped, embeddings_avoided=skipped)
 
         if not new_retrieved_facts:
             logger.debug("No new facts retrieved from input. Skipping memory update LLM call.")
 
-        retrieved_old_memory = []
         new_message_embeddings = {}
 
         async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
+            embeddings = await _call_async(self.embedding_model, "embed", new_mem_content, "add")
             new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
+            return await _call_async(
+                self.vector_store,
+                "search",
                 query=new_mem_content,
                 vectors=embeddings,
                 limit=5,
                 filters=effective_filters,  # 'filters' is query_filters_for_inference
             )
-            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
 
         search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
         search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
-
-        unique_data = {}
-        for item in retrieved_old_memory:
-            unique_data[item["id"]] = item
-        retrieved_old_memory = list(unique_data.values())
+        await self._record_hashes(search_results_list)
+        direct_actions, update_facts, retrieved_old_memory = _triage_facts(
+            new_retrieved_facts,
+            search_results_list,
+            reconcile_all=bool(self.config.custom_update_memory_prompt),
+            similarity_threshold=self.config.update_similarity_threshold,
+        )
+        if extracted_facts and not update_facts:
+            self._add_stats.record(update_calls_avoided=1)
         logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        _report_progress("candidates_retrieved", memories=deepcopy(retrieved_old_memory))
         temp_uuid_mapping = {}
         for idx, item in enumerate(retrieved_old_memory):
             temp_uuid_mapping[str(idx)] = item["id"]
             retrieved_old_memory[idx]["id"] = str(idx)
 
-        if new_retrieved_facts:
+        if update_facts:
             function_calling_prompt = get_update_memory_messages(
-                retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
+                retrieved_old_memory, update_facts, self.config.custom_update_memory_prompt
             )
             try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
+                response = await _call_async(
+                    self.llm,
+                    "generate_response",
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
                 )
             except Exception as e:
                 logger.error(f"Error in new memory actions response: {e}")
                 response = ""
-            try:
-                if not response or not response.strip():
-                    logger.warning("Empty response from LLM, no memories to extract")
-                    new_memories_with_actions = {}
-                else:
-                    response = remove_code_blocks(response)
-                    new_memories_with_actions = json.loads(response)
-            except Exception as e:
-                logger.error(f"Invalid JSON response: {e}")
-                new_memories_with_actions = {}
+            self._add_stats.record(llm_calls=1)
+            new_memories_with_actions = _parse_memory_actions(response)
         else:
-            new_memories_with_actions = {}
+            new_memories_with_actions = []
+
+        returned_memories = await self._apply_memory_actions(
+            direct_actions + new_memories_with_actions, temp_uuid_mapping, new_message_embeddings, metadata
+        )
+        self._add_stats.record(inferred_adds=1, add_seconds=time.perf_counter() - started)
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+        )
+        return returned_memories
+
+    async def _add_single_pass(self, messages, metadata, effective_filters):
+        """
+        Extract facts and decide their ADD/UPDATE/DELETE/NONE actions in one LLM call.
+
+        The related memories are found before the call, from the user and assistant messages of the
+        conversation with one `embed_batch` and one `search_batch`, instead of from the extracted facts
+        after a first LLM call. Enabled with `add_pipeline="single_pass"`.
+        """
+        started = time.perf_counter()
+        queries = _conversation_queries(messages)
+        retrieved_old_memory = []
+        if queries:
+            query_embeddings = await _call_async(self.embedding_model, "embed_batch", queries, "search")
+            search_results = await _call_async(
+                self.vector_store,
+                "search_batch",
+                queries=queries,
+                vectors=query_embeddings,
+                limit=5,
+                filters=effective_filters,
+            )
+            await self._record_hashes(search_results)
+            retrieved_old_memory = _related_memories(search_results)
+        logger.info(f"Total existing memories: {len(retrieved_old_memory)}")
+        _report_progress("candidates_retrieved", memories=deepcopy(retrieved_old_memory))
+
+        temp_uuid_mapping = {}
+        for idx, item in enumerate(retrieved_old_memory):
+            temp_uuid_mapping[str(idx)] = item["id"]
+            retrieved_old_memory[idx]["id"] = str(idx)
+
+        system_prompt, user_prompt = get_single_pass_memory_messages(
+            parse_messages(messages),
+            retrieved_old_memory,
+            self.config.custom_fact_extraction_prompt,
+            self.config.custom_update_memory_prompt,
+        )
+        try:
+            response = await _call_async(
+                self.llm,
+                "generate_response",
+                messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
+                response_format={"type": "json_object"},
+            )
+        except Exception as e:
+            logger.error(f"Error in single-pass memory actions response: {e}")
+            response = ""
+        self._add_stats.record(llm_calls=1)
 
+        returned_memories = await self._apply_memory_actions(
+            _parse_memory_actions(response), temp_uuid_mapping, {}, metadata
+        )
+        self._add_stats.record(inferred_adds=1, add_seconds=time.perf_counter() - started)
+
+        keys, encoded_ids = process_telemetry_filters(effective_filters)
+        capture_event(
+            "mem0.add",
+            self,
+            {
+                "version": self.api_version,
+                "keys": keys,
+                "encoded_ids": encoded_ids,
+                "sync_type": "async",
+                "pipeline": "single_pass",
+            },
+        )
+        return returned_memories
+
+    async def _apply_memory_actions(self, actions, temp_uuid_mapping, existing_embeddings, metadata):
+        """Run the ADD/UPDATE/DELETE actions of an update response concurrently and return the resulting events."""
         returned_memories = []
         try:
             memory_tasks = []
-            for resp in new_memories_with_actions.get("memory", []):
+            for resp in actions:
                 logger.info(resp)
                 try:
                     action_text = resp.get("text")
@@ -1264,7 +2278,7 @@ class AsyncMemory(MemoryBase):
                         task = asyncio.create_task(
                             self._create_memory(
                                 data=action_text,
-                                existing_embeddings=new_message_embeddings,
+                                existing_embeddings=existing_embeddings,
                                 metadata=deepcopy(metadata),
                             )
                         )
@@ -1274,7 +2288,7 @@ class AsyncMemory(MemoryBase):
                             self._update_memory(
                                 memory_id=temp_uuid_mapping[resp["id"]],
                                 data=action_text,
-                                existing_embeddings=new_message_embeddings,
+                                existing_embeddings=existing_embeddings,
                                 metadata=deepcopy(metadata),
                             )
                         )
@@ -1303,18 +2317,92 @@ class AsyncMemory(MemoryBase):
                         )
                     elif event_type == "DELETE":
                         returned_memories.append({"id": mem_id, "memory": resp.get("text"), "event": event_type})
+                    _report_progress("memory_applied", memory=returned_memories[-1])
                 except Exception as e:
                     logger.error(f"Error awaiting memory task (async): {e}")
         except Exception as e:
             logger.error(f"Error in memory processing loop (async): {e}")
+        return returned_memories
+
+    async def _find_duplicate_facts(self, facts, filters):
+        """
+        Return the facts that exactly match a stored memory in the scope of `filters`.
+
+        Candidates are looked up by content hash in the hash index of the history database and
+        confirmed with one `bulk_get`. Entries of memories deleted or changed since are dropped.
+        """
+        scope = _hash_scope(filters)
+        if scope is None or not facts:
+            return set()
+        fact_hashes = {hashlib.md5(fact.encode()).hexdigest(): fact for fact in facts}
+        candidates = await asyncio.to_thread(self.db.find_memory_hashes, list(fact_hashes), scope)
+        if not candidates:
+            return set()
+        memories = await _call_async(
+            self.vector_store, "bulk_get", [candidate["memory_id"] for candidate in candidates]
+        )
+        duplicates, stale = _confirm_duplicates(candidates, memories, fact_hashes, filters)
+        await asyncio.to_thread(self.db.delete_memory_hashes, stale)
+        return duplicates
+
+    async def _record_hashes(self, search_results):
+        """Add the memories found by a fact search that are missing from the hash index, like `Memory._record_hashes`."""
+        records = _search_hash_records(search_results)
+        if not records:
+            return
+        indexed = await asyncio.to_thread(self.db.get_memory_hashes, [record["memory_id"] for record in records])
+        missing = _unindexed(records, indexed)
+        if missing:
+            await asyncio.to_thread(self.db.set_memory_hashes, missing)
+
+    def add_stats(self) -> Dict[str, float]:
+        """
+        Return the counters of inferred adds: how many ran, their LLM calls and total seconds (to compare
+        the two `add_pipeline` modes), and the work they avoided: extracted facts that matched a stored
+        memory (and so were not embedded) and update LLM calls skipped because no fact needed reconciliation.
+        """
+        return self._add_stats.snapshot()
+
+    async def _add_raw_messages(self, messages, metadata, effective_filters):
+        """
+        Store messages verbatim, without fact extraction.
+
+        All messages are embedded with one `embed_batch` and written with one vector store
+        `insert` and one history transaction; a single telemetry event is sent per call.
+        """
+        entries = _raw_memory_entries(messages, metadata)
+        if entries:
+            embeddings = await _call_async(
+                self.embedding_model, "embed_batch", [content for content, _, _ in entries], "add"
+            )
+            await _call_async(
+                self.vector_store,
+                "insert",
+                vectors=embeddings,
+                ids=[result["id"] for _, _, result in entries],
+                payloads=[payload for _, payload, _ in entries],
+            )
+            await asyncio.to_thread(self.db.add_history_batch, _raw_memory_history(entries))
+            await asyncio.to_thread(
+                self.db.set_memory_hashes, [_hash_record(result["id"], payload) for _, payload, result in entries]
+            )
+            for _, _, result in entries:
+                _report_progress("memory_applied", memory=result)
 
         keys, encoded_ids = process_telemetry_filters(effective_filters)
         capture_event(
             "mem0.add",
             self,
-            {"version": self.api_version, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"},
+            {
+                "version": self.api_version,
+                "keys": keys,
+                "encoded_ids": encoded_ids,
+                "sync_type": "async",
+                "infer": False,
+                "memory_count": len(entries),
+            },
         )
-        return returned_memories
+        return [result for _, _, result in entries]
 
     async def _add_to_graph(self, messages, filters):
         added_entities = []
@@ -1324,6 +2412,7 @@ class AsyncMemory(MemoryBase):
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
             added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            _report_progress("relations_added", relations=added_entities)
 
         return added_entities
 
@@ -1338,7 +2427,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await _call_async(self.vector_store, "get", vector_id=memory_id)
         if not memory:
             return None
 
@@ -1444,7 +2533,7 @@ class AsyncMemory(MemoryBase):
         return results_dict
 
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await _call_async(self.vector_store, "list", filters=filters, limit=limit)
         actual_memories = (
             memories_result[0]
             if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
@@ -1546,6 +2635,10 @@ class AsyncMemory(MemoryBase):
             original_memories = await vector_store_task
             graph_entities = None
 
+        if self._add_windows is not None and threshold is None:
+            # Read-your-writes: messages of add windows not stored yet. They have no score, so none pass a threshold.
+            original_memories = self._add_windows.with_overlay(original_memories, effective_filters, limit)
+
         if self.enable_graph:
             return {"results": original_memories, "relations": graph_entities}
 
@@ -1562,9 +2655,9 @@ class AsyncMemory(MemoryBase):
             return {"results": original_memories}
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        embeddings = await _call_async(self.embedding_model, "embed", query, "search")
+        memories = await _call_async(
+            self.vector_store, "search", query=query, vectors=embeddings, limit=limit, filters=filters
         )
 
         promoted_payload_keys = [
@@ -1618,7 +2711,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await _call_async(self.embedding_model, "embed", data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -1659,7 +2752,7 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        memories = await _call_async(self.vector_store, "list", filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -1692,7 +2785,7 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await _call_async(self.embedding_model, "embed", data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -1700,8 +2793,9 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        await _call_async(
+            self.vector_store,
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
@@ -1718,6 +2812,7 @@ class AsyncMemory(MemoryBase):
             role=metadata.get("role"),
         )
 
+        await asyncio.to_thread(self.db.set_memory_hashes, [_hash_record(memory_id, metadata)])
         capture_event("mem0._create_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
 
@@ -1755,7 +2850,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await _call_async(self.llm, "generate_response", messages=parsed_messages)
         except Exception as e:
             logger.error(f"Error generating procedural memory summary: {e}")
             raise
@@ -1764,7 +2859,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await _call_async(self.embedding_model, "embed", procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -1776,7 +2871,7 @@ class AsyncMemory(MemoryBase):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+            existing_memory = await _call_async(self.vector_store, "get", vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
@@ -1805,10 +2900,11 @@ class AsyncMemory(MemoryBase):
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await _call_async(self.embedding_model, "embed", data, "update")
 
-        await asyncio.to_thread(
-            self.vector_store.update,
+        await _call_async(
+            self.vector_store,
+            "update",
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
@@ -1826,15 +2922,16 @@ class AsyncMemory(MemoryBase):
             actor_id=new_metadata.get("actor_id"),
             role=new_metadata.get("role"),
         )
+        await asyncio.to_thread(self.db.set_memory_hashes, [_hash_record(memory_id, new_metadata)])
         capture_event("mem0._update_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
 
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        existing_memory = await _call_async(self.vector_store, "get", vector_id=memory_id)
         prev_value = existing_memory.payload["data"]
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
+        await _call_async(self.vector_store, "delete", vector_id=memory_id)
         await asyncio.to_thread(
             self.db.add_history,
             memory_id,
@@ -1845,6 +2942,7 @@ class AsyncMemory(MemoryBase):
             role=existing_memory.payload.get("role"),
             is_deleted=1,
         )
+        await asyncio.to_thread(self.db.delete_memory_hashes, [memory_id])
 
         capture_event("mem0._delete_memory", self, {"memory_id": memory_id, "sync_type": "async"})
         return memory_id
@@ -1866,6 +2964,7 @@ class AsyncMemory(MemoryBase):
 
         if hasattr(self.db, "connection") and self.db.connection:
             await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
+            await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS memory_hashes"))
             await asyncio.to_thread(self.db.connection.close)
 
         self.db = SQLiteManager(self.config.history_db_path)
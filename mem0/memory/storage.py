@@ -14,6 +14,7 @@ class SQLiteManager:
         self._lock = threading.Lock()
         self._migrate_history_table()
         self._create_history_table()
+        self._create_hash_table()
 
     def _migrate_history_table(self) -> None:
         """
@@ -123,6 +124,98 @@ class SQLiteManager:
                 logger.error(f"Failed to create history table: {e}")
                 raise
 
+    def _create_hash_table(self) -> None:
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS memory_hashes (
+                        memory_id    TEXT PRIMARY KEY,
+                        hash         TEXT,
+                        user_id      TEXT,
+                        agent_id     TEXT,
+                        run_id       TEXT
+                    )
+                """
+                )
+                self.connection.execute("CREATE INDEX IF NOT EXISTS memory_hashes_hash ON memory_hashes (hash)")
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to create memory hash table: {e}")
+                raise
+
+    def set_memory_hashes(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Record the content hash and scope of several memories, replacing their previous entries.
+
+        Args:
+            records: Dicts with `memory_id`, `hash` and optionally `user_id`, `agent_id` and `run_id`.
+        """
+        if not records:
+            return
+        rows = [
+            (record["memory_id"], record["hash"], record.get("user_id"), record.get("agent_id"), record.get("run_id"))
+            for record in records
+        ]
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    """
+                    INSERT OR REPLACE INTO memory_hashes (memory_id, hash, user_id, agent_id, run_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to record memory hashes: {e}")
+                raise
+
+    def find_memory_hashes(self, hashes: List[str], scope: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Return the `memory_id` and `hash` of the recorded memories with one of `hashes` whose
+        `user_id`, `agent_id` and `run_id` match the ones given in `scope`.
+        """
+        if not hashes:
+            return []
+        placeholders = ", ".join("?" for _ in hashes)
+        conditions = "".join(f" AND {key} = ?" for key in ("user_id", "agent_id", "run_id") if key in scope)
+        params = list(hashes) + [scope[key] for key in ("user_id", "agent_id", "run_id") if key in scope]
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT memory_id, hash FROM memory_hashes WHERE hash IN ({placeholders}){conditions}", params
+            ).fetchall()
+        return [{"memory_id": row[0], "hash": row[1]} for row in rows]
+
+    def get_memory_hashes(self, memory_ids: List[str]) -> Dict[str, str]:
+        """Return `{memory_id: hash}` for the given memories that have an entry in the hash index."""
+        if not memory_ids:
+            return {}
+        placeholders = ", ".join("?" for _ in memory_ids)
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT memory_id, hash FROM memory_hashes WHERE memory_id IN ({placeholders})", memory_ids
+            ).fetchall()
+        return dict(rows)
+
+    def delete_memory_hashes(self, memory_ids: List[str]) -> None:
+        if not memory_ids:
+            return
+        placeholders = ", ".join("?" for _ in memory_ids)
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.execute(f"DELETE FROM memory_hashes WHERE memory_id IN ({placeholders})", memory_ids)
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to delete memory hashes: {e}")
+                raise
+
     def add_history(
         self,
         memory_id: str,
@@ -166,6 +259,51 @@ class SQLiteManager:
                 logger.error(f"Failed to add history record: {e}")
                 raise
 
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert several history records in one transaction.
+
+        Args:
+            records: Dicts with the arguments of `add_history`: `memory_id`, `old_memory`,
+                `new_memory`, `event` and optionally `created_at`, `updated_at`, `is_deleted`,
+                `actor_id` and `role`.
+        """
+        if not records:
+            return
+        rows = [
+            (
+                str(uuid.uuid4()),
+                record["memory_id"],
+                record.get("old_memory"),
+                record.get("new_memory"),
+                record["event"],
+                record.get("created_at"),
+                record.get("updated_at"),
+                record.get("is_deleted", 0),
+                record.get("actor_id"),
+                record.get("role"),
+            )
+            for record in records
+        ]
+        with self._lock:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    """
+                    INSERT INTO history (
+                        id, memory_id, old_memory, new_memory, event,
+                        created_at, updated_at, is_deleted, actor_id, role
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+                self.connection.execute("COMMIT")
+            except Exception as e:
+                self.connection.execute("ROLLBACK")
+                logger.error(f"Failed to add history records: {e}")
+                raise
+
     def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
         with self._lock:
             cur = self.connection.execute(
@@ -197,13 +335,15 @@ class SQLiteManager:
         ]
 
     def reset(self) -> None:
-        """Drop and recreate the history table."""
+        """Drop and recreate the history and memory hash tables."""
         with self._lock:
             try:
                 self.connection.execute("BEGIN")
                 self.connection.execute("DROP TABLE IF EXISTS history")
+                self.connection.execute("DROP TABLE IF EXISTS memory_hashes")
                 self.connection.execute("COMMIT")
                 self._create_history_table()
+                self._create_hash_table()
             except Exception as e:
                 self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to reset history table: {e}")
@@ -1,7 +1,12 @@
+import atexit
 import logging
 import os
 import platform
+import queue
+import random
 import sys
+import threading
+from collections import Counter
 
 from posthog import Posthog
 
@@ -18,49 +23,146 @@ if isinstance(MEM0_TELEMETRY, str):
 if not isinstance(MEM0_TELEMETRY, bool):
     raise ValueError("MEM0_TELEMETRY must be a boolean value.")
 
+# Fraction of events that are sent, between 0 and 1. Sampled events carry `sample_rate` so counts can be scaled back.
+MEM0_TELEMETRY_SAMPLE_RATE = float(os.environ.get("MEM0_TELEMETRY_SAMPLE_RATE", "1.0"))
+# When enabled, events with the same name that are queued together are sent as one event with an `event_count`.
+MEM0_TELEMETRY_BATCH = os.environ.get("MEM0_TELEMETRY_BATCH", "False").lower() in ("true", "1", "yes")
+MEM0_TELEMETRY_QUEUE_SIZE = int(os.environ.get("MEM0_TELEMETRY_QUEUE_SIZE", "1000"))
+MEM0_TELEMETRY_BATCH_SIZE = 100
+
 logging.getLogger("posthog").setLevel(logging.CRITICAL + 1)
 logging.getLogger("urllib3").setLevel(logging.CRITICAL + 1)
 
 
 class AnonymousTelemetry:
-    def __init__(self, vector_store=None):
-        self.posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
-
-        self.user_id = get_or_create_user_id(vector_store)
-
-        if not MEM0_TELEMETRY:
-            self.posthog.disabled = True
-
-    def capture_event(self, event_name, properties=None, user_email=None):
-        if properties is None:
-            properties = {}
-        properties = {
-            "client_source": "python",
-            "client_version": mem0.__version__,
-            "python_version": sys.version,
-            "os": sys.platform,
-            "os_version": platform.version(),
-            "os_release": platform.release(),
-            "processor": platform.processor(),
-            "machine": platform.machine(),
-            **properties,
-        }
-        distinct_id = self.user_id if user_email is None else user_email
-        self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
+    """
+    Process-wide telemetry client.
+
+    Events are put on a bounded queue and sent by a single background thread, so capturing
+    never blocks on the network or the vector store. The anonymous user id is resolved once,
+    on the worker thread, from the first telemetry vector store that is passed in. When the queue is full,
+    events are dropped. With MEM0_TELEMETRY off nothing is created and every call is a no-op.
+    """
+
+    def __init__(
+        self,
+        vector_store=None,
+        sample_rate: float = MEM0_TELEMETRY_SAMPLE_RATE,
+        batch: bool = MEM0_TELEMETRY_BATCH,
+        max_queue_size: int = MEM0_TELEMETRY_QUEUE_SIZE,
+    ):
+        self.enabled = MEM0_TELEMETRY
+        self.sample_rate = sample_rate
+        self.batch = batch
+        self.posthog = None
+        self.user_id = None
+        self.dropped = 0
+
+        self._vector_store = vector_store
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._worker = None
+        self._lock = threading.Lock()
+
+        self._system_properties = {}
+        if self.enabled:
+            self.posthog = Posthog(project_api_key=PROJECT_API_KEY, host=HOST)
+            self._system_properties = {
+                "client_source": "python",
+                "client_version": mem0.__version__,
+                "python_version": sys.version,
+                "os": sys.platform,
+                "os_version": platform.version(),
+                "os_release": platform.release(),
+                "processor": platform.processor(),
+                "machine": platform.machine(),
+            }
+
+    def _start_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="mem0-telemetry", daemon=True)
+                self._worker.start()
+
+    @property
+    def needs_vector_store(self) -> bool:
+        """Whether the anonymous user id still needs a telemetry vector store to be resolved."""
+        return self.enabled and self.user_id is None and self._vector_store is None
+
+    def capture_event(self, event_name, properties=None, user_email=None, vector_store=None):
+        if not self.enabled:
+            return
+        if self.sample_rate < 1.0:
+            if random.random() >= self.sample_rate:
+                return
+            properties = {**(properties or {}), "sample_rate": self.sample_rate}
+        if vector_store is not None and self.user_id is None and self._vector_store is None:
+            self._vector_store = vector_store
+
+        try:
+            self._queue.put_nowait((event_name, properties, user_email))
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+        if self._worker is None:
+            self._start_worker()
+
+    def _run(self):
+        while True:
+            events = [self._queue.get()]
+            while len(events) < MEM0_TELEMETRY_BATCH_SIZE:
+                try:
+                    events.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._send(events)
+            except Exception as e:
+                logging.debug(f"Failed to send telemetry events: {e}")
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+    def _send(self, events):
+        if self.user_id is None:
+            self.user_id = get_or_create_user_id(self._vector_store)
+            # The id is resolved once, so the store (and the client it holds) is no longer needed
+            self._vector_store = None
+
+        if self.batch:
+            counts = Counter((event_name, user_email) for event_name, _, user_email in events)
+            latest = {(event_name, user_email): properties for event_name, properties, user_email in events}
+            events = [
+                (event_name, {**(latest[(event_name, user_email)] or {}), "event_count": count}, user_email)
+                for (event_name, user_email), count in counts.items()
+            ]
+
+        for event_name, properties, user_email in events:
+            properties = {**self._system_properties, **(properties or {})}
+            distinct_id = self.user_id if user_email is None else user_email
+            self.posthog.capture(distinct_id=distinct_id, event=event_name, properties=properties)
+
+    def flush(self, timeout: float = 5.0):
+        """Wait up to `timeout` seconds for queued events to be handed to the Posthog client."""
+        if not self.enabled or self._worker is None:
+            return
+        with self._queue.all_tasks_done:
+            self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
 
     def close(self):
+        if not self.enabled:
+            return
+        self.flush()
         self.posthog.shutdown()
 
 
 client_telemetry = AnonymousTelemetry()
+atexit.register(client_telemetry.flush)
 
 
 def capture_event(event_name, memory_instance, additional_data=None):
-    oss_telemetry = AnonymousTelemetry(
-        vector_store=memory_instance._telemetry_vector_store
-        if hasattr(memory_instance, "_telemetry_vector_store")
-        else None,
-    )
+    if not client_telemetry.enabled:
+        return
 
     event_data = {
         "collection": memory_instance.collection_name,
@@ -77,10 +179,21 @@ def capture_event(event_name, memory_instance, additional_data=None):
     if additional_data:
         event_data.update(additional_data)
 
-    oss_telemetry.capture_event(event_name, event_data)
+    vector_store = None
+    if client_telemetry.needs_vector_store:
+        # Created on the caller's thread: creating it imports the provider's modules, which must not
+        # run on the telemetry thread concurrently with the caller's own imports
+        try:
+            vector_store = memory_instance._telemetry_vector_store
+        except Exception as e:
+            logging.debug(f"Failed to create telemetry vector store: {e}")
+    client_telemetry.capture_event(event_name, event_data, vector_store=vector_store)
 
 
 def capture_client_event(event_name, instance, additional_data=None):
+    if not client_telemetry.enabled:
+        return
+
     event_data = {
         "function": f"{instance.__class__.__module__}.{instance.__class__.__name__}",
     }
@@ -0,0 +1,209 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pytz
+
+logger = logging.getLogger(__name__)
+
+_SESSION_KEYS = ("user_id", "agent_id", "run_id")
+
+
+def _matches(value: Any, expected: Any) -> bool:
+    # Operator filters are only evaluated by the vector store, so they never match a buffered window
+    if isinstance(expected, dict):
+        return False
+    if isinstance(expected, list):
+        return value in expected
+    return value == expected
+
+
+class AddWindow:
+    """Messages of one session buffered for a single inferred add."""
+
+    def __init__(self, key: tuple, metadata: Dict[str, Any], filters: Dict[str, Any]):
+        self.key = key
+        self.metadata = metadata
+        self.filters = filters
+        self.messages = []
+        # Ids of the buffered messages in the search overlay; the stored memories get their own ids
+        self.message_ids = []
+        self.created_at = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+
+    def extend(self, messages: list):
+        self.messages.extend(messages)
+        self.message_ids.extend(f"pending-{uuid.uuid4()}" for _ in messages)
+
+    def matches(self, filters: Dict[str, Any]) -> bool:
+        """Return whether searches with `filters` see this window; keys other than the session ids match its metadata."""
+        return all(
+            _matches(self.filters.get(key) if key in _SESSION_KEYS else self.metadata.get(key), expected)
+            for key, expected in filters.items()
+        )
+
+    def overlay(self) -> List[Dict[str, Any]]:
+        """Return the buffered user and assistant messages in the format of search results."""
+        ids = {key: self.filters[key] for key in _SESSION_KEYS if key in self.filters}
+        return [
+            {
+                "id": message_id,
+                "memory": message["content"],
+                "hash": None,
+                "metadata": None,
+                "score": None,
+                "created_at": self.created_at,
+                "updated_at": None,
+                **ids,
+                "role": message["role"],
+                "pending": True,
+            }
+            for message_id, message in zip(self.message_ids, self.messages)
+            if message.get("role") in ("user", "assistant") and isinstance(message.get("content"), str)
+        ]
+
+
+class AddWindows:
+    """
+    Debounce buffers of inferred adds, one per (user_id, agent_id, run_id) session. Thread-safe.
+
+    Consecutive adds of a session are merged into one window, so one extraction and reconciliation
+    runs over all of their messages. A window is full once it holds `max_messages` messages; the
+    caller also extracts it `max_seconds` after it was started. An add with different metadata
+    closes the session's window and starts a new one.
+
+    Windows taken for extraction stay in the search overlay until `finish` is called, so searches
+    keep seeing their messages until the memories extracted from them are stored.
+    """
+
+    def __init__(self, max_messages: int, max_seconds: float):
+        self.max_messages = max_messages
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._windows = {}
+        self._extracting = []
+
+    def add(
+        self, messages: list, metadata: Dict[str, Any], filters: Dict[str, Any]
+    ) -> Tuple[Optional[AddWindow], Optional[AddWindow], Optional[AddWindow]]:
+        """
+        Buffer the messages of an add.
+
+        Returns:
+            tuple: The session's previous window, closed because its metadata differs; the window
+                holding these messages if it is now full; and the window started by this add, to
+                be extracted after `max_seconds` unless it fills up first. Each may be None.
+        """
+        key = tuple(filters.get(name) for name in _SESSION_KEYS)
+        closed = full = started = None
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None and window.metadata != metadata:
+                closed = self._windows.pop(key)
+                self._extracting.append(closed)
+                window = None
+            if window is None:
+                window = started = self._windows[key] = AddWindow(key, metadata, filters)
+            window.extend(messages)
+            if len(window.messages) >= self.max_messages:
+                full = self._windows.pop(key)
+                self._extracting.append(full)
+        return closed, full, started
+
+    def pop(self, window: AddWindow) -> bool:
+        """Remove `window` if it is still buffered; return False if it was already extracted."""
+        with self._lock:
+            if self._windows.get(window.key) is not window:
+                return False
+            del self._windows[window.key]
+            self._extracting.append(window)
+            return True
+
+    def drain(self) -> List[AddWindow]:
+        """Remove and return every buffered window."""
+        with self._lock:
+            windows = list(self._windows.values())
+            self._windows.clear()
+            self._extracting.extend(windows)
+        return windows
+
+    def finish(self, window: AddWindow):
+        """Drop an extracted window from the search overlay."""
+        with self._lock:
+            self._extracting = [extracting for extracting in self._extracting if extracting is not window]
+
+    def overlay(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the buffered messages of the windows matching `filters` (see `AddWindow.matches`)."""
+        with self._lock:
+            return [
+                item
+                for window in [*self._extracting, *self._windows.values()]
+                if window.matches(filters)
+                for item in window.overlay()
+            ]
+
+    def with_overlay(self, memories: List[Dict[str, Any]], filters: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """
+        Return the search results `memories` followed by the overlay of `filters`, `limit` items at most.
+
+        The buffered messages are kept first and the lowest-ranked stored memories make room for
+        them, so a search whose stored hits already fill `limit` still sees the messages not stored yet.
+        """
+        overlay = self.overlay(filters)[:limit]
+        return memories[: limit - len(overlay)] + overlay
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(window.messages) for window in self._windows.values())
+
+
+class WindowTimer:
+    """
+    Calls `callback(window)` for each scheduled window once its delay has passed.
+
+    A single daemon thread, started by the first `schedule`, waits for the earliest deadline of a
+    heap, so buffering many sessions does not start a thread per window. `callback` runs on that
+    thread and should hand slow work off to a pool.
+    """
+
+    def __init__(self, callback: Callable[[AddWindow], None]):
+        self._callback = callback
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._order = itertools.count()
+        self._thread = None
+        self._closed = False
+
+    def schedule(self, window: AddWindow, delay: float):
+        with self._condition:
+            if self._closed:
+                return
+            heapq.heappush(self._deadlines, (time.monotonic() + delay, next(self._order), window))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mem0-add-window-timer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def close(self):
+        """Drop the scheduled windows and stop the thread."""
+        with self._condition:
+            self._closed = True
+            self._deadlines.clear()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (not self._deadlines or self._deadlines[0][0] > time.monotonic()):
+                    self._condition.wait(self._deadlines[0][0] - time.monotonic() if self._deadlines else None)
+                if self._closed:
+                    return
+                _, _, window = heapq.heappop(self._deadlines)
+            try:
+                self._callback(window)
+            except Exception as e:
+                logger.error(f"Error extracting an expired add window: {e}")
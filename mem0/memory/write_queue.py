@@ -0,0 +1,502 @@
+import asyncio
+import collections
+import json
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WriteJournal:
+    """
+    SQLite journal of the adds accepted by a write queue and not stored yet.
+
+    Adds are recorded when submitted and removed once stored, so the adds of a process that
+    exited with a non-empty queue are replayed by the next queue opened on the same file. Adds
+    that still failed after their retries are kept with a `failed` status until they are retried.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pending_adds (
+                    id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                    request    TEXT,
+                    created_at REAL,
+                    status     TEXT DEFAULT 'pending',
+                    error      TEXT
+                )
+            """
+            )
+            columns = {row[1] for row in self.connection.execute("PRAGMA table_info(pending_adds)")}
+            if "status" not in columns:
+                self.connection.execute("ALTER TABLE pending_adds ADD COLUMN status TEXT DEFAULT 'pending'")
+                self.connection.execute("ALTER TABLE pending_adds ADD COLUMN error TEXT")
+            self.connection.commit()
+
+    def append(self, request: Dict[str, Any]) -> int:
+        """Record an add request and return its journal id."""
+        with self._lock:
+            cursor = self.connection.execute(
+                "INSERT INTO pending_adds (request, created_at) VALUES (?, ?)", (json.dumps(request), time.time())
+            )
+            self.connection.commit()
+        return cursor.lastrowid
+
+    def remove(self, ids: List[int]) -> None:
+        self._update("DELETE FROM pending_adds WHERE id IN ({ids})", ids)
+
+    def mark_failed(self, ids: List[int], error: str) -> None:
+        """Keep the adds `ids` as failed, so they are not replayed until `retry`."""
+        self._update("UPDATE pending_adds SET status = 'failed', error = ? WHERE id IN ({ids})", ids, error)
+
+    def retry(self, ids: List[int]) -> None:
+        """Mark the failed adds `ids` as pending again."""
+        self._update("UPDATE pending_adds SET status = 'pending', error = NULL WHERE id IN ({ids})", ids)
+
+    def pending(self) -> List[tuple]:
+        """Return the `(id, request)` of the recorded adds, oldest first."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT id, request FROM pending_adds WHERE status = 'pending' ORDER BY id"
+            ).fetchall()
+        return [(row[0], json.loads(row[1])) for row in rows]
+
+    def failed(self) -> List[tuple]:
+        """Return the `(id, request, error)` of the adds that failed, oldest first."""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT id, request, error FROM pending_adds WHERE status = 'failed' ORDER BY id"
+            ).fetchall()
+        return [(row[0], json.loads(row[1]), row[2]) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+
+    def _update(self, statement: str, ids: List[int], *params) -> None:
+        if not ids:
+            return
+        with self._lock:
+            if self.connection is None:
+                # A worker abandoned by `close` finished its add: the entry stays in the journal
+                logger.warning(f"Write queue journal is closed, {len(ids)} adds stay journaled")
+                return
+            placeholders = ", ".join("?" for _ in ids)
+            self.connection.execute(statement.format(ids=placeholders), (*params, *ids))
+            self.connection.commit()
+
+
+def _coalesce_key(request: Dict[str, Any]) -> str:
+    """Adds with the same arguments apart from their messages (same user, agent, run, metadata...) can be merged."""
+    return json.dumps({name: value for name, value in request.items() if name != "messages"}, sort_keys=True)
+
+
+def _message_list(messages) -> list:
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    if isinstance(messages, dict):
+        return [messages]
+    return list(messages)
+
+
+def _merge_requests(requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return one add request with the messages of `requests`, which share their other arguments, in order."""
+    if len(requests) == 1:
+        return requests[0]
+    messages = [message for request in requests for message in _message_list(request["messages"])]
+    return {**requests[0], "messages": messages}
+
+
+class _WriteBacklog:
+    """
+    Pending adds of a write queue, grouped for coalescing. Not thread-safe: the queues guard it with their lock.
+
+    A new add joins the last pending group of its coalescing key, unless that group is full; otherwise
+    it starts a new group at the end of the queue. Groups of a key are written one at a time and in
+    submission order, so a later add of a conversation is never reconciled before an earlier one.
+    """
+
+    def __init__(self, max_coalesce: int):
+        self.max_coalesce = max_coalesce
+        self._groups = collections.deque()
+        self._open = {}
+        self._running = set()
+        self.pending = 0
+        self.counts = dict.fromkeys(("submitted", "completed", "coalesced", "retried", "failed"), 0)
+
+    def push(self, journal_id: int, request: Dict[str, Any]):
+        key = _coalesce_key(request)
+        group = self._open.get(key)
+        if group is not None and len(group["entries"]) < self.max_coalesce:
+            self.counts["coalesced"] += 1
+        else:
+            group = {"key": key, "entries": []}
+            self._groups.append(group)
+            self._open[key] = group
+        group["entries"].append((journal_id, request))
+        self.pending += 1
+
+    def pop(self) -> Optional[dict]:
+        """Remove and return the oldest group whose key is not being written, or None."""
+        for group in self._groups:
+            if group["key"] not in self._running:
+                self._groups.remove(group)
+                if self._open.get(group["key"]) is group:
+                    del self._open[group["key"]]
+                self._running.add(group["key"])
+                return group
+        return None
+
+    def done(self, group: dict, stored: bool):
+        self._running.discard(group["key"])
+        self.pending -= len(group["entries"])
+        self.counts["completed" if stored else "failed"] += len(group["entries"])
+
+    @property
+    def idle(self) -> bool:
+        return self.pending == 0
+
+    def metrics(self, workers: int) -> Dict[str, int]:
+        return {
+            **self.counts,
+            "pending": self.pending,
+            "queued_groups": len(self._groups),
+            "in_flight_groups": len(self._running),
+            "workers": workers,
+        }
+
+
+class _WriteQueueBase:
+    def __init__(
+        self,
+        memory,
+        max_workers: int,
+        max_pending: int,
+        max_coalesce: int,
+        max_retries: int,
+        initial_backoff: float,
+        journal_path: Optional[str],
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_coalesce < 1:
+            raise ValueError("max_coalesce must be at least 1")
+        self.memory = memory
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.journal = WriteJournal(journal_path or ":memory:")
+        self._backlog = _WriteBacklog(max_coalesce)
+        self._closed = False
+        recovered = self.journal.pending()
+        for journal_id, request in recovered:
+            self._backlog.push(journal_id, request)
+        if recovered:
+            logger.info(f"Replaying {len(recovered)} adds from write queue journal {journal_path}")
+        self._backlog.counts["failed"] = len(self.journal.failed())
+
+    def _backoff(self, attempt: int) -> float:
+        return self.initial_backoff * 2**attempt
+
+    def _fail(self, group: dict, error: Exception):
+        logger.error(f"Giving up on {len(group['entries'])} queued adds after {self.max_retries} retries: {error}")
+        self.journal.mark_failed([journal_id for journal_id, _ in group["entries"]], str(error))
+
+    def _requeue_failed(self) -> int:
+        """Move the failed adds of the journal back to the backlog; the caller holds the queue lock."""
+        failed = self.journal.failed()
+        self.journal.retry([journal_id for journal_id, _, _ in failed])
+        for journal_id, request, _ in failed:
+            self._backlog.push(journal_id, request)
+        self._backlog.counts["failed"] -= len(failed)
+        return len(failed)
+
+
+class MemoryWriteQueue(_WriteQueueBase):
+    """
+    Background queue of `add` calls for a `Memory` or `MemoryClient`, e.g. for fire-and-forget writes.
+
+    Adds are run by a bounded pool of worker threads. Consecutive adds for the same user, agent and
+    run (with the same other arguments) that are still queued are merged into one `add`, so their
+    messages go through one extraction call. Failed adds are retried with exponential backoff.
+
+    Queued adds are recorded in a SQLite journal; with `journal_path`, adds left in the queue when
+    the process exits are replayed by the next queue opened on the same file. Adds that still fail
+    after `max_retries` stay in the journal as failed, and are queued again by `retry_failed`.
+
+    Args:
+        memory: Object whose `add(messages, **kwargs)` stores memories.
+        max_workers (int, optional): Number of worker threads. Defaults to 4.
+        max_pending (int, optional): Queued adds above which `submit` blocks. Defaults to 1000.
+        max_coalesce (int, optional): Maximum number of adds merged into one. Defaults to 20.
+        max_retries (int, optional): Retries of a failed add before it is kept aside as failed. Defaults to 3.
+        initial_backoff (float, optional): Seconds before the first retry, doubled on each retry. Defaults to 1.0.
+        journal_path (str, optional): Path of the journal database. Defaults to None (in memory, not durable).
+    """
+
+    def __init__(
+        self,
+        memory,
+        *,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        max_coalesce: int = 20,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        journal_path: Optional[str] = None,
+    ):
+        super().__init__(memory, max_workers, max_pending, max_coalesce, max_retries, initial_backoff, journal_path)
+        self._condition = threading.Condition()
+        self._live_workers = max_workers
+        self._workers = [
+            threading.Thread(target=self._work, name=f"mem0-write-queue-{index}", daemon=True)
+            for index in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, messages, *, block: bool = True, timeout: Optional[float] = None, **kwargs):
+        """
+        Queue an `add(messages, **kwargs)` call; the arguments must be JSON-serializable.
+
+        Raises:
+            queue.Full: If `max_pending` adds are queued and none completed within `timeout`,
+                or immediately when `block` is False.
+            RuntimeError: If the queue is closed.
+        """
+        request = {"messages": messages, **kwargs}
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MemoryWriteQueue is closed")
+            if self._backlog.pending >= self.max_pending:
+                if not block or not self._condition.wait_for(
+                    lambda: self._backlog.pending < self.max_pending or self._closed, timeout
+                ):
+                    raise queue.Full(f"{self.max_pending} adds are already queued")
+                if self._closed:
+                    raise RuntimeError("MemoryWriteQueue is closed")
+            self._backlog.push(self.journal.append(request), request)
+            self._backlog.counts["submitted"] += 1
+            self._condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued add is stored or failed; return False if `timeout` expired first."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._backlog.idle, timeout)
+
+    def retry_failed(self) -> int:
+        """Queue again the adds kept in the journal as failed, and return how many there were."""
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MemoryWriteQueue is closed")
+            count = self._requeue_failed()
+            self._condition.notify_all()
+        return count
+
+    def metrics(self) -> Dict[str, int]:
+        """
+        Return the queue counters: adds submitted, completed, coalesced into another add, retried
+        and failed (kept in the journal), plus the adds pending and the groups queued and being written.
+        """
+        with self._condition:
+            return self._backlog.metrics(len(self._workers))
+
+    def close(self, wait: bool = True, timeout: Optional[float] = None):
+        """
+        Stop the workers, after storing the queued adds if `wait`; adds left are kept in the journal.
+
+        A worker still storing an add when `timeout` expires finishes it in the background, and the
+        journal is closed once the last worker exits.
+        """
+        if wait:
+            self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+        with self._condition:
+            if self._live_workers:
+                logger.warning(f"{self._live_workers} write queue workers are still storing adds")
+                return
+        self.journal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                group = None
+                while not self._closed and (group := self._backlog.pop()) is None:
+                    self._condition.wait()
+                if group is None:
+                    self._live_workers -= 1
+                    if self._live_workers == 0:
+                        self.journal.close()
+                    return
+            stored = self._store(group)
+            with self._condition:
+                self._backlog.done(group, stored)
+                self._condition.notify_all()
+
+    def _store(self, group: dict) -> bool:
+        request = _merge_requests([request for _, request in group["entries"]])
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.memory.add(**request)
+                self.journal.remove([journal_id for journal_id, _ in group["entries"]])
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._fail(group, e)
+                    return False
+                logger.warning(f"Queued add failed, retrying: {e}")
+                with self._condition:
+                    self._backlog.counts["retried"] += 1
+                time.sleep(self._backoff(attempt))
+
+
+class AsyncMemoryWriteQueue(_WriteQueueBase):
+    """
+    Background queue of `add` calls for an `AsyncMemory` or `AsyncMemoryClient`, run by worker tasks.
+
+    Takes the arguments of `MemoryWriteQueue` and behaves the same. Workers are started on the
+    running event loop by the first `submit` or `flush`.
+    """
+
+    def __init__(
+        self,
+        memory,
+        *,
+        max_workers: int = 4,
+        max_pending: int = 1000,
+        max_coalesce: int = 20,
+        max_retries: int = 3,
+        initial_backoff: float = 1.0,
+        journal_path: Optional[str] = None,
+    ):
+        super().__init__(memory, max_workers, max_pending, max_coalesce, max_retries, initial_backoff, journal_path)
+        self._condition = None
+        self._workers = []
+
+    def _start(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+            self._workers = [asyncio.create_task(self._work()) for _ in range(self.max_workers)]
+
+    async def submit(self, messages, *, block: bool = True, timeout: Optional[float] = None, **kwargs):
+        """Queue an `add(messages, **kwargs)` call like `MemoryWriteQueue.submit`."""
+        self._start()
+        request = {"messages": messages, **kwargs}
+        async with self._condition:
+            if self._closed:
+                raise RuntimeError("AsyncMemoryWriteQueue is closed")
+            if self._backlog.pending >= self.max_pending:
+                if not block:
+                    raise queue.Full(f"{self.max_pending} adds are already queued")
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait_for(lambda: self._backlog.pending < self.max_pending or self._closed),
+                        timeout,
+                    )
+                except asyncio.TimeoutError:
+                    raise queue.Full(f"{self.max_pending} adds are already queued")
+                if self._closed:
+                    raise RuntimeError("AsyncMemoryWriteQueue is closed")
+            journal_id = await asyncio.to_thread(self.journal.append, request)
+            self._backlog.push(journal_id, request)
+            self._backlog.counts["submitted"] += 1
+            self._condition.notify_all()
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued add is stored or failed; return False if `timeout` expired first."""
+        self._start()
+        async with self._condition:
+            try:
+                await asyncio.wait_for(self._condition.wait_for(lambda: self._backlog.idle), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return True
+
+    async def retry_failed(self) -> int:
+        """Queue again the adds kept in the journal as failed, like `MemoryWriteQueue.retry_failed`."""
+        self._start()
+        async with self._condition:
+            if self._closed:
+                raise RuntimeError("AsyncMemoryWriteQueue is closed")
+            count = await asyncio.to_thread(self._requeue_failed)
+            self._condition.notify_all()
+        return count
+
+    def metrics(self) -> Dict[str, int]:
+        """Return the queue counters, like `MemoryWriteQueue.metrics`."""
+        return self._backlog.metrics(len(self._workers))
+
+    async def close(self, wait: bool = True, timeout: Optional[float] = None):
+        """
+        Stop the workers, after storing the queued adds if `wait`; adds left are kept in the journal.
+
+        Workers still storing an add when `timeout` expires are cancelled, and their adds stay journaled.
+        """
+        if self._condition is not None:
+            if wait:
+                await self.flush(timeout)
+            async with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            _, running = await asyncio.wait(self._workers, timeout=timeout)
+            for worker in running:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._closed = True
+        self.journal.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _work(self):
+        while True:
+            async with self._condition:
+                group = None
+                while not self._closed and (group := self._backlog.pop()) is None:
+                    await self._condition.wait()
+                if group is None:
+                    return
+            stored = await self._store(group)
+            async with self._condition:
+                self._backlog.done(group, stored)
+                self._condition.notify_all()
+
+    async def _store(self, group: dict) -> bool:
+        request = _merge_requests([request for _, request in group["entries"]])
+        for attempt in range(self.max_retries + 1):
+            try:
+                await self.memory.add(**request)
+                await asyncio.to_thread(self.journal.remove, [journal_id for journal_id, _ in group["entries"]])
+                return True
+            except Exception as e:
+                if attempt == self.max_retries:
+                    await asyncio.to_thread(self._fail, group, e)
+                    return False
+                logger.warning(f"Queued add failed, retrying: {e}")
+                self._backlog.counts["retried"] += 1
+                await asyncio.sleep(self._backoff(attempt))
@@ -1,7 +1,9 @@
+import atexit
 import logging
+import os
 import subprocess
 import sys
-import threading
+import weakref
 from typing import List, Optional, Union
 
 import httpx
@@ -19,35 +21,91 @@ except ImportError:
         sys.exit(1)
 
 from mem0 import Memory, MemoryClient
+from mem0.configs.base import mem0_dir
 from mem0.configs.prompts import MEMORY_ANSWER_PROMPT
 from mem0.memory.telemetry import capture_client_event, capture_event
+from mem0.memory.write_queue import MemoryWriteQueue
 
 logger = logging.getLogger(__name__)
 
 
+def _plain_message(message) -> dict:
+    """Return a copy of a chat message as a JSON-serializable dict, e.g. of a message object returned by an SDK."""
+    if isinstance(message, dict):
+        return dict(message)
+    if hasattr(message, "model_dump"):
+        return message.model_dump(mode="json", exclude_none=True)
+    return {"role": message.role, "content": message.content}
+
+
 class Mem0:
     def __init__(
         self,
         config: Optional[dict] = None,
         api_key: Optional[str] = None,
         host: Optional[str] = None,
+        write_queue: Optional[dict] = None,
     ):
+        """
+        Args:
+            write_queue (dict, optional): Arguments of the `MemoryWriteQueue` that stores the messages
+                of chat calls in the background, e.g. `{"max_workers": 8, "journal_path": "adds.db"}`.
+                Coalescing is always off, since each chat call carries the whole conversation. The
+                journal defaults to `proxy_write_queue.db` in the mem0 directory; proxies running at
+                the same time should each be given their own `journal_path`.
+        """
         if api_key:
             self.mem0_client = MemoryClient(api_key, host)
         else:
             self.mem0_client = Memory.from_config(config) if config else Memory()
 
-        self.chat = Chat(self.mem0_client)
+        self.chat = Chat(self.mem0_client, _chat_write_queue(self.mem0_client, write_queue))
+
+    def close(self, wait: bool = True, timeout: Optional[float] = None):
+        """Stop the write queue of the chat calls, after storing the queued messages if `wait`."""
+        self.chat.completions.close(wait, timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _close_write_queue_at_exit(write_queue_ref):
+    write_queue = write_queue_ref()
+    if write_queue is None:
+        return
+    try:
+        write_queue.close()
+    except Exception as e:
+        logger.error(f"Error storing queued chat messages at exit: {e}")
+
+
+def _chat_write_queue(mem0_client, write_queue: Optional[dict] = None) -> MemoryWriteQueue:
+    # Merging queued chat calls would store the history they share once per call
+    options = {**(write_queue or {}), "max_coalesce": 1}
+    if "journal_path" not in options:
+        os.makedirs(mem0_dir, exist_ok=True)
+        options["journal_path"] = os.path.join(mem0_dir, "proxy_write_queue.db")
+    chat_queue = MemoryWriteQueue(mem0_client, **options)
+    atexit.register(_close_write_queue_at_exit, weakref.ref(chat_queue))
+    return chat_queue
 
 
 class Chat:
-    def __init__(self, mem0_client):
-        self.completions = Completions(mem0_client)
+    def __init__(self, mem0_client, write_queue: Optional[MemoryWriteQueue] = None):
+        self.completions = Completions(mem0_client, write_queue)
 
 
 class Completions:
-    def __init__(self, mem0_client):
+    def __init__(self, mem0_client, write_queue: Optional[MemoryWriteQueue] = None):
         self.mem0_client = mem0_client
+        self.write_queue = write_queue or _chat_write_queue(mem0_client)
+
+    def close(self, wait: bool = True, timeout: Optional[float] = None):
+        """Stop the write queue, after storing the queued messages if `wait`; messages left stay journaled."""
+        self.write_queue.close(wait, timeout)
 
     def create(
         self,
@@ -100,12 +158,17 @@ class Completions:
                 f"Model '{model}' does not support function calling. Please use a model that supports function calling."
             )
 
+        # The write queue journals messages as JSON, which message objects of the SDKs are not
+        messages = [_plain_message(message) for message in messages]
         prepared_messages = self._prepare_messages(messages)
         if prepared_messages[-1]["role"] == "user":
             self._async_add_to_memory(messages, user_id, agent_id, run_id, metadata, filters)
             relevant_memories = self._fetch_relevant_memories(messages, user_id, agent_id, run_id, filters, limit)
             logger.debug(f"Retrieved {len(relevant_memories)} relevant memories")
-            prepared_messages[-1]["content"] = self._format_query_with_memories(messages, relevant_memories)
+            prepared_messages[-1] = {
+                **prepared_messages[-1],
+                "content": self._format_query_with_memories(messages, relevant_memories),
+            }
 
         response = litellm.completion(
             model=model,
@@ -150,18 +213,12 @@ class Completions:
         return messages
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
-        def add_task():
-            logger.debug("Adding to memory asynchronously")
-            self.mem0_client.add(
-                messages=messages,
-                user_id=user_id,
-                agent_id=agent_id,
-                run_id=run_id,
-                metadata=metadata,
-                filters=filters,
-            )
-
-        threading.Thread(target=add_task, daemon=True).start()
+        logger.debug("Adding to memory asynchronously")
+        kwargs = {"user_id": user_id, "agent_id": agent_id, "run_id": run_id, "metadata": metadata}
+        if filters is not None:
+            # Only the platform client accepts filters on add
+            kwargs["filters"] = filters
+        self.write_queue.submit(messages, **kwargs)
 
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
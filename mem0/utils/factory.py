@@ -10,7 +10,12 @@ from mem0.configs.llms.lmstudio import LMStudioConfig
 from mem0.configs.llms.ollama import OllamaConfig
 from mem0.configs.llms.openai import OpenAIConfig
 from mem0.configs.llms.vllm import VllmConfig
+from mem0.embeddings.cache import CachedEmbedding, EmbeddingCache
+from mem0.embeddings.configs import EmbeddingCacheConfig
 from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.cache import LlmResponseCache
+from mem0.llms.configs import LlmCacheConfig, RateLimitConfig
+from mem0.llms.limiter import disable_sdk_retries, get_concurrency_limiter, get_rate_limiter
 
 
 def load_class(class_type):
@@ -47,13 +52,24 @@ class LlmFactory:
     }
 
     @classmethod
-    def create(cls, provider_name: str, config: Optional[Union[BaseLlmConfig, Dict]] = None, **kwargs):
+    def create(
+        cls,
+        provider_name: str,
+        config: Optional[Union[BaseLlmConfig, Dict]] = None,
+        cache_config: Optional[Union[LlmCacheConfig, Dict]] = None,
+        max_concurrency: Optional[int] = None,
+        rate_limit_config: Optional[Union[RateLimitConfig, Dict]] = None,
+        **kwargs,
+    ):
         """
         Create an LLM instance with the appropriate configuration.
 
         Args:
             provider_name (str): The provider name (e.g., 'openai', 'anthropic')
             config: Configuration object or dict. If None, will create default config
+            cache_config: Response cache configuration. When enabled, deterministic calls are cached
+            max_concurrency: Maximum number of requests in flight to the provider, across all its instances
+            rate_limit_config: Rate limit and retry policy, shared by all instances of the provider and model
             **kwargs: Additional configuration parameters
 
         Returns:
@@ -100,7 +116,22 @@ class LlmFactory:
             # Assume it's already the correct config type
             pass
 
-        return llm_class(config)
+        llm = llm_class(config)
+
+        if isinstance(cache_config, dict):
+            cache_config = LlmCacheConfig(**cache_config)
+        if cache_config is not None and cache_config.enabled:
+            llm.response_cache = LlmResponseCache(
+                backend=cache_config.backend,
+                max_size=cache_config.max_size,
+                ttl=cache_config.ttl,
+                path=cache_config.path,
+            )
+        llm.concurrency_limiter = get_concurrency_limiter(provider_name, max_concurrency)
+        llm.rate_limiter = get_rate_limiter(provider_name, getattr(config, "model", None), rate_limit_config)
+        if llm.rate_limiter is not None:
+            disable_sdk_retries(llm)
+        return llm
 
     @classmethod
     def register_provider(cls, name: str, class_path: str, config_class=None):
@@ -142,16 +173,37 @@ class EmbedderFactory:
     }
 
     @classmethod
-    def create(cls, provider_name, config, vector_config: Optional[dict]):
+    def create(
+        cls,
+        provider_name,
+        config,
+        vector_config: Optional[dict],
+        cache_config: Optional[Union[EmbeddingCacheConfig, Dict]] = None,
+        rate_limit_config: Optional[Union[RateLimitConfig, Dict]] = None,
+    ):
         if provider_name == "upstash_vector" and vector_config and vector_config.enable_embeddings:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
+        embedder.rate_limiter = get_rate_limiter(provider_name, base_config.model, rate_limit_config)
+        if embedder.rate_limiter is not None:
+            disable_sdk_retries(embedder)
+
+        if isinstance(cache_config, dict):
+            cache_config = EmbeddingCacheConfig(**cache_config)
+        if cache_config is not None and cache_config.enabled:
+            cache = EmbeddingCache(
+                max_size=cache_config.max_size,
+                persistent=cache_config.persistent,
+                path=cache_config.path,
+            )
+            return CachedEmbedding(embedder, provider_name, cache)
+        return embedder
 
 
 class VectorStoreFactory:
@@ -184,6 +236,8 @@ class VectorStoreFactory:
         if class_type:
             if not isinstance(config, dict):
                 config = config.model_dump()
+            if provider_name == "faiss" and config.get("shard_by"):
+                class_type = "mem0.vector_stores.faiss.ShardedFAISS"
             vector_store_instance = load_class(class_type)
             return vector_store_instance(**config)
         else:
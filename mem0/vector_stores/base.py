@@ -1,7 +1,13 @@
+import asyncio
+import concurrent.futures
+import functools
 from abc import ABC, abstractmethod
 
 
 class VectorStoreBase(ABC):
+    # Pool used by the default `search_batch`; `Memory` sets it to its shared executor
+    executor = None
+
     @abstractmethod
     def create_col(self, name, vector_size, distance):
         """Create a new collection."""
@@ -17,6 +23,40 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_batch(self, queries, vectors, limit=5, filters=None):
+        """
+        Search for similar vectors for several queries at once.
+
+        Stores with a native multi-query API should override this. The default
+        runs the single-query `search` for each query concurrently, on `executor`
+        when one is set.
+
+        Args:
+            queries (list): Query strings, one per vector.
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query, in input order.
+        """
+        if len(queries) != len(vectors):
+            raise ValueError("Queries and vectors must have the same length")
+        if not vectors:
+            return []
+        if len(vectors) == 1:
+            return [self.search(query=queries[0], vectors=vectors[0], limit=limit, filters=filters)]
+
+        if self.executor is not None:
+            return list(self.executor.map(functools.partial(self.search, limit=limit, filters=filters), queries, vectors))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(len(vectors), 8)) as executor:
+            futures = [
+                executor.submit(self.search, query=query, vectors=vector, limit=limit, filters=filters)
+                for query, vector in zip(queries, vectors)
+            ]
+            return [future.result() for future in futures]
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
@@ -32,6 +72,53 @@ class VectorStoreBase(ABC):
         """Retrieve a vector by ID."""
         pass
 
+    def bulk_get(self, vector_ids):
+        """
+        Retrieve several vectors by ID.
+
+        Stores that can fetch many points in one request should override this. The
+        default calls `get` for each ID.
+
+        Args:
+            vector_ids (list): IDs of the vectors to retrieve.
+
+        Returns:
+            list: One result per ID, in input order, with None for IDs that were not found.
+        """
+        results = []
+        for vector_id in vector_ids:
+            try:
+                results.append(self.get(vector_id=vector_id))
+            except Exception:
+                results.append(None)
+        return results
+
+    def bulk_update(self, updates):
+        """
+        Update several vectors and their payloads.
+
+        Stores with a native batch write should override this. The default calls
+        `update` for each entry.
+
+        Args:
+            updates (list): Dicts with a "vector_id" key and optional "vector" and "payload" keys.
+        """
+        for update in updates:
+            self.update(vector_id=update["vector_id"], vector=update.get("vector"), payload=update.get("payload"))
+
+    def bulk_delete(self, vector_ids):
+        """
+        Delete several vectors by ID.
+
+        Stores with a native batch delete should override this. The default calls
+        `delete` for each ID.
+
+        Args:
+            vector_ids (list): IDs of the vectors to delete.
+        """
+        for vector_id in vector_ids:
+            self.delete(vector_id=vector_id)
+
     @abstractmethod
     def list_cols(self):
         """List all collections."""
@@ -56,3 +143,69 @@ class VectorStoreBase(ABC):
     def reset(self):
         """Reset by delete the collection and recreate it."""
         pass
+
+
+class AsyncVectorStoreBase(ABC):
+    """
+    Optional native async interface of a vector store.
+
+    Stores with an async client mix this into their `VectorStoreBase` subclass;
+    `AsyncMemory` awaits these methods instead of running the sync ones in a
+    worker thread. Methods without an async counterpart keep running in a thread.
+    """
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether the async methods can be used; e.g. stores built from a user-provided sync client cannot."""
+        return True
+
+    @abstractmethod
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Insert vectors into a collection."""
+        pass
+
+    @abstractmethod
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        """Search for similar vectors."""
+        pass
+
+    async def asearch_batch(self, queries, vectors, limit=5, filters=None):
+        """
+        Search for similar vectors for several queries at once.
+
+        Stores with a native multi-query API should override this. The default
+        runs the single-query `asearch` for each query concurrently.
+
+        Returns:
+            list: One list of search results per query, in input order.
+        """
+        if len(queries) != len(vectors):
+            raise ValueError("Queries and vectors must have the same length")
+        return list(
+            await asyncio.gather(
+                *(
+                    self.asearch(query=query, vectors=vector, limit=limit, filters=filters)
+                    for query, vector in zip(queries, vectors)
+                )
+            )
+        )
+
+    @abstractmethod
+    async def adelete(self, vector_id):
+        """Delete a vector by ID."""
+        pass
+
+    @abstractmethod
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Update a vector and its payload."""
+        pass
+
+    @abstractmethod
+    async def aget(self, vector_id):
+        """Retrieve a vector by ID."""
+        pass
+
+    @abstractmethod
+    async def alist(self, filters=None, limit=None):
+        """List all memories."""
+        pass
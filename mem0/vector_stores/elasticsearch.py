@@ -2,15 +2,15 @@ import logging
 from typing import Any, Dict, List, Optional
 
 try:
-    from elasticsearch import Elasticsearch
-    from elasticsearch.helpers import bulk
+    from elasticsearch import AsyncElasticsearch, Elasticsearch
+    from elasticsearch.helpers import async_bulk, bulk
 except ImportError:
     raise ImportError("Elasticsearch requires extra dependencies. Install with `pip install elasticsearch`") from None
 
 from pydantic import BaseModel
 
 from mem0.configs.vector_stores.elasticsearch import ElasticsearchConfig
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
@@ -21,25 +21,27 @@ class OutputData(BaseModel):
     payload: Dict
 
 
-class ElasticsearchDB(VectorStoreBase):
+class ElasticsearchDB(VectorStoreBase, AsyncVectorStoreBase):
     def __init__(self, **kwargs):
         config = ElasticsearchConfig(**kwargs)
 
         # Initialize Elasticsearch client
         if config.cloud_id:
-            self.client = Elasticsearch(
+            self._client_kwargs = dict(
                 cloud_id=config.cloud_id,
                 api_key=config.api_key,
                 verify_certs=config.verify_certs,
-                headers= config.headers or {},
+                headers=config.headers or {},
             )
         else:
-            self.client = Elasticsearch(
+            self._client_kwargs = dict(
                 hosts=[f"{config.host}" if config.port is None else f"{config.host}:{config.port}"],
                 basic_auth=(config.user, config.password) if (config.user and config.password) else None,
                 verify_certs=config.verify_certs,
-                headers= config.headers or {},
+                headers=config.headers or {},
             )
+        self.client = Elasticsearch(**self._client_kwargs)
+        self._async_client = None
 
         self.collection_name = config.collection_name
         self.embedding_model_dims = config.embedding_model_dims
@@ -53,6 +55,13 @@ class ElasticsearchDB(VectorStoreBase):
         else:
             self.custom_search_query = None
 
+    @property
+    def async_client(self) -> AsyncElasticsearch:
+        """Async Elasticsearch client with the same connection settings, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncElasticsearch(**self._client_kwargs)
+        return self._async_client
+
     def create_index(self) -> None:
         """Create Elasticsearch index with proper mappings if it doesn't exist"""
         index_settings = {
@@ -93,10 +102,9 @@ class ElasticsearchDB(VectorStoreBase):
             self.client.indices.create(index=name, body=index_settings)
             logger.info(f"Created index {name}")
 
-    def insert(
-        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
-    ) -> List[OutputData]:
-        """Insert vectors into the index."""
+    def _insert_actions(
+        self, vectors: List[List[float]], payloads: Optional[List[Dict]], ids: Optional[List[str]]
+    ) -> tuple:
         if not ids:
             ids = [str(i) for i in range(len(vectors))]
 
@@ -115,8 +123,6 @@ class ElasticsearchDB(VectorStoreBase):
             }
             actions.append(action)
 
-        bulk(self.client, actions)
-
         results = []
         for i, id_ in enumerate(ids):
             results.append(
@@ -126,30 +132,43 @@ class ElasticsearchDB(VectorStoreBase):
                     payload=payloads[i],
                 )
             )
+        return actions, results
+
+    def insert(
+        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
+    ) -> List[OutputData]:
+        """Insert vectors into the index."""
+        actions, results = self._insert_actions(vectors, payloads, ids)
+        bulk(self.client, actions)
         return results
 
-    def search(
-        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    async def ainsert(
+        self, vectors: List[List[float]], payloads: Optional[List[Dict]] = None, ids: Optional[List[str]] = None
     ) -> List[OutputData]:
+        """Insert vectors into the index with the async client."""
+        actions, results = self._insert_actions(vectors, payloads, ids)
+        await async_bulk(self.async_client, actions)
+        return results
+
+    def _search_query(self, vectors: List[float], limit: int, filters: Optional[Dict]) -> Dict:
         """
-        Search with two options:
+        Build the search body with two options:
         1. Use custom search query if provided
         2. Use KNN search on vectors with pre-filtering if no custom search query is provided
         """
         if self.custom_search_query:
-            search_query = self.custom_search_query(vectors, limit, filters)
-        else:
-            search_query = {
-                "knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}
-            }
-            if filters:
-                filter_conditions = []
-                for key, value in filters.items():
-                    filter_conditions.append({"term": {f"metadata.{key}": value}})
-                search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+            return self.custom_search_query(vectors, limit, filters)
 
-        response = self.client.search(index=self.collection_name, body=search_query)
+        search_query = {"knn": {"field": "vector", "query_vector": vectors, "k": limit, "num_candidates": limit * 2}}
+        if filters:
+            filter_conditions = []
+            for key, value in filters.items():
+                filter_conditions.append({"term": {f"metadata.{key}": value}})
+            search_query["knn"]["filter"] = {"bool": {"must": filter_conditions}}
+        return search_query
 
+    @staticmethod
+    def _search_results(response) -> List[OutputData]:
         results = []
         for hit in response["hits"]["hits"]:
             results.append(
@@ -158,24 +177,54 @@ class ElasticsearchDB(VectorStoreBase):
 
         return results
 
+    def search(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """Search for similar vectors, with the custom search query if one is configured."""
+        response = self.client.search(index=self.collection_name, body=self._search_query(vectors, limit, filters))
+        return self._search_results(response)
+
+    async def asearch(
+        self, query: str, vectors: List[float], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """Search for similar vectors with the async client."""
+        response = await self.async_client.search(
+            index=self.collection_name, body=self._search_query(vectors, limit, filters)
+        )
+        return self._search_results(response)
+
     def delete(self, vector_id: str) -> None:
         """Delete a vector by ID."""
         self.client.delete(index=self.collection_name, id=vector_id)
 
-    def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
-        """Update a vector and its payload."""
+    async def adelete(self, vector_id: str) -> None:
+        """Delete a vector by ID with the async client."""
+        await self.async_client.delete(index=self.collection_name, id=vector_id)
+
+    @staticmethod
+    def _update_doc(vector: Optional[List[float]], payload: Optional[Dict]) -> Dict:
         doc = {}
         if vector is not None:
             doc["vector"] = vector
         if payload is not None:
             doc["metadata"] = payload
+        return doc
 
-        self.client.update(index=self.collection_name, id=vector_id, body={"doc": doc})
-
-    def get(self, vector_id: str) -> Optional[OutputData]:
-        """Retrieve a vector by ID."""
+    def update(self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None) -> None:
+        """Update a vector and its payload."""
+        self.client.update(index=self.collection_name, id=vector_id, body={"doc": self._update_doc(vector, payload)})
+
+    async def aupdate(
+        self, vector_id: str, vector: Optional[List[float]] = None, payload: Optional[Dict] = None
+    ) -> None:
+        """Update a vector and its payload with the async client."""
+        await self.async_client.update(
+            index=self.collection_name, id=vector_id, body={"doc": self._update_doc(vector, payload)}
+        )
+
+    @staticmethod
+    def _get_result(response) -> Optional[OutputData]:
         try:
-            response = self.client.get(index=self.collection_name, id=vector_id)
             return OutputData(
                 id=response["_id"],
                 score=1.0,  # Default score for direct get
@@ -187,6 +236,19 @@ class ElasticsearchDB(VectorStoreBase):
         except TypeError as e:
             logger.warning(f"Invalid response type from Elasticsearch: {e}")
             return None
+
+    def get(self, vector_id: str) -> Optional[OutputData]:
+        """Retrieve a vector by ID."""
+        try:
+            return self._get_result(self.client.get(index=self.collection_name, id=vector_id))
+        except Exception as e:
+            logger.error(f"Unexpected error while parsing Elasticsearch response: {e}")
+            return None
+
+    async def aget(self, vector_id: str) -> Optional[OutputData]:
+        """Retrieve a vector by ID with the async client."""
+        try:
+            return self._get_result(await self.async_client.get(index=self.collection_name, id=vector_id))
         except Exception as e:
             logger.error(f"Unexpected error while parsing Elasticsearch response: {e}")
             return None
@@ -203,8 +265,8 @@ class ElasticsearchDB(VectorStoreBase):
         """Get information about a collection (index)."""
         return self.client.indices.get(index=name)
 
-    def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
-        """List all memories."""
+    @staticmethod
+    def _list_query(filters: Optional[Dict], limit: Optional[int]) -> Dict[str, Any]:
         query: Dict[str, Any] = {"query": {"match_all": {}}}
 
         if filters:
@@ -215,9 +277,10 @@ class ElasticsearchDB(VectorStoreBase):
 
         if limit:
             query["size"] = limit
+        return query
 
-        response = self.client.search(index=self.collection_name, body=query)
-
+    @staticmethod
+    def _list_results(response) -> List[List[OutputData]]:
         results = []
         for hit in response["hits"]["hits"]:
             results.append(
@@ -230,6 +293,16 @@ class ElasticsearchDB(VectorStoreBase):
 
         return [results]
 
+    def list(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
+        """List all memories."""
+        response = self.client.search(index=self.collection_name, body=self._list_query(filters, limit))
+        return self._list_results(response)
+
+    async def alist(self, filters: Optional[Dict] = None, limit: Optional[int] = None) -> List[List[OutputData]]:
+        """List all memories with the async client."""
+        response = await self.async_client.search(index=self.collection_name, body=self._list_query(filters, limit))
+        return self._list_results(response)
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
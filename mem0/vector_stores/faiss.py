@@ -1,9 +1,18 @@
+import atexit
+import hashlib
+import json
 import logging
 import os
 import pickle
+import shutil
+import sqlite3
+import threading
 import uuid
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 import numpy as np
 from pydantic import BaseModel
@@ -37,7 +46,246 @@ class OutputData(BaseModel):
     payload: Optional[Dict]  # metadata
 
 
+def _flush_at_exit(store_ref):
+    store = store_ref()
+    if store is not None:
+        store.flush()
+
+
+def _flush_when_due(store_ref):
+    store = store_ref()
+    if store is not None:
+        store._timed_flush()
+
+
+class PayloadStore:
+    """
+    SQLite-backed payloads of a FAISS collection.
+
+    Each row maps a memory id to the int64 id of its vector in the FAISS index. The keys in
+    `columns` are stored in their own indexed columns when they hold strings; the rest of the
+    payload is kept as a JSON blob. Rows are read on demand, so opening a collection does not
+    load its payloads. Writes are only made durable by `commit()`, which the FAISS store calls
+    after each logged mutation, or when it snapshots the index with "immediate" persistence, so
+    no write transaction is held open between mutations.
+    """
+
+    columns = ("user_id", "agent_id", "run_id", "actor_id", "hash", "created_at")
+    # Bound on the number of SQL variables per statement
+    batch_size = 500
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            column_defs = ", ".join(f"{column} TEXT" for column in self.columns)
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS payloads (id TEXT PRIMARY KEY, index_id INTEGER UNIQUE, "
+                f"{column_defs}, payload TEXT)"
+            )
+            for column in self.columns:
+                self.connection.execute(f"CREATE INDEX IF NOT EXISTS payloads_{column} ON payloads ({column})")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS tombstones (index_id INTEGER PRIMARY KEY)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.connection.commit()
+            self._tombstone_count = self.connection.execute("SELECT COUNT(*) FROM tombstones").fetchone()[0]
+
+    def _encode(self, vector_id: str, index_id: int, payload: Optional[Dict]) -> Tuple:
+        payload = dict(payload or {})
+        values = [payload.pop(column) if isinstance(payload.get(column), str) else None for column in self.columns]
+        return (vector_id, index_id, *values, json.dumps(payload))
+
+    def _decode(self, row: Tuple) -> Dict:
+        *values, blob = row
+        payload = {column: value for column, value in zip(self.columns, values) if value is not None}
+        payload.update(json.loads(blob))
+        return payload
+
+    @property
+    def _payload_columns(self) -> str:
+        return ", ".join((*self.columns, "payload"))
+
+    def _where(self, filters: Dict[str, List[str]]) -> Tuple[str, List[str]]:
+        clauses, params = [], []
+        for column, values in filters.items():
+            clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+            params.extend(values)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def put_many(self, rows: List[Tuple[str, int, Optional[Dict]]]):
+        """Insert or replace `(vector_id, index_id, payload)` rows."""
+        encoded = [self._encode(*row) for row in rows]
+        placeholders = ", ".join("?" for _ in range(len(self.columns) + 3))
+        with self._lock:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO payloads (id, index_id, {self._payload_columns}) VALUES ({placeholders})",
+                encoded,
+            )
+
+    def set_payload(self, vector_id: str, payload: Optional[Dict]):
+        """Replace the payload of an existing row, keeping its index id."""
+        _, _, *values = self._encode(vector_id, None, payload)
+        assignments = ", ".join(f"{column} = ?" for column in (*self.columns, "payload"))
+        with self._lock:
+            self.connection.execute(f"UPDATE payloads SET {assignments} WHERE id = ?", (*values, vector_id))
+
+    def get(self, vector_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self.connection.execute(
+                f"SELECT {self._payload_columns} FROM payloads WHERE id = ?", (vector_id,)
+            ).fetchone()
+        return self._decode(row) if row is not None else None
+
+    def get_many(self, vector_ids: List[str]) -> Dict[str, Dict]:
+        """Return `{vector_id: payload}` for the given memory ids that exist."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(vector_ids), self.batch_size):
+                chunk = vector_ids[start : start + self.batch_size]
+                rows = self.connection.execute(
+                    f"SELECT id, {self._payload_columns} FROM payloads WHERE id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for vector_id, *payload_row in rows:
+                    found[vector_id] = self._decode(payload_row)
+        return found
+
+    def get_by_index_ids(self, index_ids: List[int]) -> Dict[int, Tuple[str, Dict]]:
+        """Return `{index_id: (vector_id, payload)}` for the index ids that belong to a live row."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(index_ids), self.batch_size):
+                chunk = index_ids[start : start + self.batch_size]
+                rows = self.connection.execute(
+                    f"SELECT index_id, id, {self._payload_columns} FROM payloads "
+                    f"WHERE index_id IN ({', '.join('?' for _ in chunk)})",
+                    chunk,
+                ).fetchall()
+                for index_id, vector_id, *payload_row in rows:
+                    found[index_id] = (vector_id, self._decode(payload_row))
+        return found
+
+    def index_ids_for(self, vector_ids: List[str]) -> Dict[str, int]:
+        """Return `{vector_id: index_id}` for the given memory ids that exist."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(vector_ids), self.batch_size):
+                chunk = vector_ids[start : start + self.batch_size]
+                rows = self.connection.execute(
+                    f"SELECT id, index_id FROM payloads WHERE id IN ({', '.join('?' for _ in chunk)})", chunk
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def index_ids(self, filters: Optional[Dict[str, List[str]]] = None) -> List[int]:
+        """Return the index ids of the rows matching `filters` on `columns`, in insertion order."""
+        where, params = self._where(filters or {})
+        with self._lock:
+            rows = self.connection.execute(f"SELECT index_id FROM payloads{where} ORDER BY rowid", params).fetchall()
+        return [row[0] for row in rows]
+
+    def iter_rows(self, filters: Optional[Dict[str, List[str]]] = None) -> Iterator[Tuple[str, Dict]]:
+        """Yield `(vector_id, payload)` for the rows matching `filters` on `columns`, in insertion order."""
+        where, params = self._where(filters or {})
+        where = f"{where} AND rowid > ?" if where else " WHERE rowid > ?"
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self.connection.execute(
+                    f"SELECT rowid, id, {self._payload_columns} FROM payloads{where} ORDER BY rowid LIMIT ?",
+                    (*params, last_rowid, self.batch_size),
+                ).fetchall()
+            for rowid, vector_id, *payload_row in rows:
+                last_rowid = rowid
+                yield vector_id, self._decode(payload_row)
+            if len(rows) < self.batch_size:
+                return
+
+    def remove(self, vector_id: str) -> Optional[int]:
+        """Delete a row and return the index id it held, or None if it does not exist."""
+        with self._lock:
+            row = self.connection.execute("SELECT index_id FROM payloads WHERE id = ?", (vector_id,)).fetchone()
+            if row is None:
+                return None
+            self.connection.execute("DELETE FROM payloads WHERE id = ?", (vector_id,))
+        return row[0]
+
+    def remove_many(self, vector_ids: List[str]) -> Dict[str, int]:
+        """Delete rows and return `{vector_id: index_id}` for the ones that existed."""
+        removed = self.index_ids_for(vector_ids)
+        with self._lock:
+            self.connection.executemany("DELETE FROM payloads WHERE id = ?", [(i,) for i in removed])
+        return removed
+
+    def count(self) -> int:
+        with self._lock:
+            return self.connection.execute("SELECT COUNT(*) FROM payloads").fetchone()[0]
+
+    def add_tombstones(self, index_ids: Iterable[int]):
+        """Record index ids whose vectors are still in the index but no longer belong to a row."""
+        index_ids = [(int(i),) for i in index_ids]
+        if not index_ids:
+            return
+        with self._lock:
+            self.connection.executemany("INSERT OR IGNORE INTO tombstones (index_id) VALUES (?)", index_ids)
+            self._tombstone_count = self.connection.execute("SELECT COUNT(*) FROM tombstones").fetchone()[0]
+
+    def tombstones(self) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self.connection.execute("SELECT index_id FROM tombstones").fetchall()]
+
+    def tombstone_count(self) -> int:
+        return self._tombstone_count
+
+    def set_tombstones(self, index_ids: Iterable[int]):
+        with self._lock:
+            self.connection.execute("DELETE FROM tombstones")
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO tombstones (index_id) VALUES (?)", [(int(i),) for i in index_ids]
+            )
+            self._tombstone_count = self.connection.execute("SELECT COUNT(*) FROM tombstones").fetchone()[0]
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row is not None else default
+
+    def set_meta(self, key: str, value: Any):
+        with self._lock:
+            self.connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def clear(self):
+        with self._lock:
+            for table in ("payloads", "tombstones", "meta"):
+                self.connection.execute(f"DELETE FROM {table}")
+            self._tombstone_count = 0
+
+    def commit(self):
+        with self._lock:
+            self.connection.commit()
+
+    def close(self):
+        """Close the connection; writes that were not committed are discarded."""
+        with self._lock:
+            if self.connection is not None:
+                self.connection.close()
+                self.connection = None
+
+
 class FAISS(VectorStoreBase):
+    # Compact once tombstoned rows make up more than this fraction of the index.
+    compaction_ratio = 0.2
+    # Payload keys with an inverted index, so filters on them are applied inside the FAISS search.
+    indexed_payload_keys = ("user_id", "agent_id", "run_id", "actor_id")
+    # Spec of the exact-search index, also used to hold vectors until a trained index can be built.
+    flat_spec = {"index_type": "flat", "compression": None}
+    # Filtered HNSW searches selecting at most this many rows compare the query with each of them exactly
+    # instead of walking the graph, which finds few matches when most nodes are filtered out.
+    hnsw_exact_search_max_ids = 2048
+
     def __init__(
         self,
         collection_name: str,
@@ -45,6 +293,21 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        persistence: Literal["immediate", "debounced", "manual"] = "immediate",
+        flush_interval_ms: int = 1000,
+        flush_every_n_ops: int = 100,
+        index_type: Literal["flat", "hnsw", "ivf"] = "flat",
+        compression: Optional[Literal["pq", "sq8"]] = None,
+        hnsw_m: int = 32,
+        hnsw_ef_construction: int = 40,
+        hnsw_ef_search: int = 16,
+        ivf_nlist: int = 100,
+        ivf_nprobe: int = 10,
+        pq_m: int = 8,
+        train_min_vectors: Optional[int] = None,
+        shard_by: Optional[Literal["user_id"]] = None,
+        shard_buckets: Optional[int] = None,
+        max_resident_shards: int = 32,
     ):
         """
         Initialize the FAISS vector store.
@@ -56,17 +319,75 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            persistence (str, optional): When to write a snapshot of the index and payloads. "immediate" writes one
+                after every mutation; "debounced" appends mutations to a log and snapshots every `flush_interval_ms`
+                or `flush_every_n_ops`; "manual" only snapshots on `flush()`. Defaults to "immediate".
+            flush_interval_ms (int, optional): Maximum age of unsnapshotted mutations in debounced mode; a
+                background timer snapshots the store once it elapses. Defaults to 1000.
+            flush_every_n_ops (int, optional): Maximum number of unsnapshotted mutations in debounced mode.
+                Defaults to 100.
+            index_type (str, optional): Index structure. "flat" is exact brute-force search; "hnsw" and "ivf" are
+                approximate and sub-linear. Defaults to "flat".
+            compression (str, optional): Store vectors product-quantized ("pq") or as 8-bit scalars ("sq8").
+                Defaults to None.
+            hnsw_m (int, optional): Neighbours per HNSW node. Defaults to 32.
+            hnsw_ef_construction (int, optional): HNSW candidate list size at build time. Defaults to 40.
+            hnsw_ef_search (int, optional): HNSW candidate list size at search time. Defaults to 16.
+            ivf_nlist (int, optional): Number of IVF clusters. Defaults to 100.
+            ivf_nprobe (int, optional): IVF clusters visited per search. Defaults to 10.
+            pq_m (int, optional): PQ sub-quantizers, must divide `embedding_model_dims`. Defaults to 8.
+            train_min_vectors (int, optional): Vectors required before an index that needs training is built;
+                until then vectors are held in a flat index. Defaults to None (derived from the spec).
+            shard_by (str, optional): Payload key to shard the collection by. Only accepted as None here;
+                `VectorStoreFactory` creates a `ShardedFAISS` when it is set. Defaults to None.
+            shard_buckets (int, optional): Number of hash buckets for sharding. Defaults to None.
+            max_resident_shards (int, optional): Number of shards kept loaded when sharding. Defaults to 32.
         """
+        if shard_by is not None:
+            raise ValueError("FAISS does not shard; use ShardedFAISS for shard_by")
+        if persistence not in ("immediate", "debounced", "manual"):
+            raise ValueError("Invalid persistence. Must be one of: 'immediate', 'debounced', 'manual'")
+        if index_type not in ("flat", "hnsw", "ivf"):
+            raise ValueError("Invalid index_type. Must be one of: 'flat', 'hnsw', 'ivf'")
+        if compression not in (None, "pq", "sq8"):
+            raise ValueError("Invalid compression. Must be one of: None, 'pq', 'sq8'")
+        if compression == "pq" and embedding_model_dims % pq_m:
+            raise ValueError(f"pq_m ({pq_m}) must divide embedding_model_dims ({embedding_model_dims})")
+
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
-
-        # Initialize storage structures
+        self.persistence = persistence
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_every_n_ops = flush_every_n_ops
+        self.index_type = index_type
+        self.compression = compression
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.ivf_nlist = ivf_nlist
+        self.ivf_nprobe = ivf_nprobe
+        self.pq_m = pq_m
+        self.train_min_vectors = train_min_vectors
+
+        # Guards swapping in an index rebuilt by a background thread
+        self._lock = threading.RLock()
+        self._rebuild_thread = None
+        # Spec the current index was built with; differs from `_index_spec()` until training or a rebuild is done
+        self._built_spec = dict(self.flat_spec)
+
+        # Mutations not yet covered by a snapshot are appended to `<collection>.log` and replayed on load
+        self._pending_ops = 0
+        self._flush_timer = None
+        self._replaying = False
+
+        # Initialize storage structures. Vectors live in the FAISS index under int64 ids; `payloads` maps them
+        # to memory ids and payloads. Deleted or replaced rows are tombstoned until compaction.
         self.index = None
-        self.docstore = {}
-        self.index_to_id = {}
+        self.payloads = None
+        self._next_id = 0
 
         # Create directory if it doesn't exist
         if self.path:
@@ -74,46 +395,542 @@ class FAISS(VectorStoreBase):
 
             # Try to load existing index if available
             index_path = f"{self.path}/{collection_name}.faiss"
-            docstore_path = f"{self.path}/{collection_name}.pkl"
-            if os.path.exists(index_path) and os.path.exists(docstore_path):
-                self._load(index_path, docstore_path)
+            if os.path.exists(index_path):
+                self._load(index_path)
             else:
                 self.create_col(collection_name)
+            self._replay_log()
+
+        if self.persistence != "immediate":
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
+        if self.index is not None:
+            self._maybe_rebuild()
+
+    def _open_payloads(self, name: str):
+        if self.payloads is not None:
+            self.payloads.close()
+        if self.path:
+            os.makedirs(self.path, exist_ok=True)
+            self.payloads = PayloadStore(f"{self.path}/{name}.db")
+        else:
+            self.payloads = PayloadStore()
 
-    def _load(self, index_path: str, docstore_path: str):
+    def _load(self, index_path: str):
         """
-        Load FAISS index and docstore from disk.
+        Load the FAISS index from disk and open the payload store next to it.
 
         Args:
             index_path (str): Path to FAISS index file.
-            docstore_path (str): Path to docstore pickle file.
         """
         try:
-            self.index = faiss.read_index(index_path)
-            with open(docstore_path, "rb") as f:
-                self.docstore, self.index_to_id = pickle.load(f)
+            index = faiss.read_index(index_path)
+            legacy_docstore_path = f"{self.path}/{self.collection_name}.pkl"
+            import_legacy = os.path.exists(legacy_docstore_path) and not os.path.exists(self._payloads_path)
+            self._open_payloads(self.collection_name)
+            if import_legacy:
+                self._import_legacy_docstore(legacy_docstore_path, index)
+
+            if isinstance(index, (faiss.IndexIDMap2, faiss.IndexIVF)):
+                self.index = index
+                self._built_spec = self.payloads.get_meta("built_spec", dict(self.flat_spec))
+                self._configure_search(index, self._built_spec)
+                self._next_id = self.payloads.get_meta("next_id")
+                if self._next_id is None:
+                    stored_ids = self._stored_ids(index)
+                    self._next_id = int(stored_ids.max()) + 1 if len(stored_ids) else 0
+            else:
+                self.index = self._migrate_legacy_index(index)
+                self._built_spec = dict(self.flat_spec)
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
+            self._next_id = 0
 
-            self.docstore = {}
-            self.index_to_id = {}
+    @property
+    def _payloads_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.db"
 
-    def _save(self):
-        """Save FAISS index and docstore to disk."""
-        if not self.path or not self.index:
+    def _import_legacy_docstore(self, docstore_path: str, index):
+        """
+        Move payloads from a pickled docstore, written before payloads were kept in SQLite, into `payloads`.
+
+        Args:
+            docstore_path (str): Path to the `(docstore, index_to_id[, built_spec])` pickle.
+            index: FAISS index loaded alongside it.
+        """
+        with open(docstore_path, "rb") as f:
+            state = pickle.load(f)
+        docstore, index_to_id = state[:2]
+        if len(state) > 2:
+            self.payloads.set_meta("built_spec", state[2])
+
+        self.payloads.put_many(
+            [(vector_id, index_id, docstore.get(vector_id)) for index_id, vector_id in index_to_id.items()]
+        )
+        if isinstance(index, (faiss.IndexIDMap2, faiss.IndexIVF)):
+            stored_ids = self._stored_ids(index)
+            self.payloads.add_tombstones(set(stored_ids.tolist()) - set(index_to_id))
+            self.payloads.set_meta("next_id", int(stored_ids.max()) + 1 if len(stored_ids) else 0)
+        self.payloads.commit()
+        os.remove(docstore_path)
+        logger.info(f"Moved {len(index_to_id)} payloads from {docstore_path} to {self._payloads_path}")
+
+    def _migrate_legacy_index(self, index):
+        """
+        Convert an index saved before ids were stored in FAISS, where row positions were the ids.
+
+        Rows whose position is past the end of the index are dropped here.
+
+        Args:
+            index: Flat FAISS index loaded from disk.
+
+        Returns:
+            faiss.IndexIDMap2: Index holding the live rows under their previous positions.
+        """
+        positions = np.array(sorted(i for i in self.payloads.index_ids() if i < index.ntotal), dtype=np.int64)
+        vectors = index.reconstruct_n(0, index.ntotal) if index.ntotal else None
+
+        base_index = faiss.clone_index(index)
+        base_index.reset()
+        migrated = faiss.IndexIDMap2(base_index)
+        if len(positions):
+            migrated.add_with_ids(vectors[positions], positions)
+
+        self.payloads.set_tombstones([])
+        self._next_id = int(positions.max()) + 1 if len(positions) else 0
+        self.payloads.set_meta("next_id", self._next_id)
+        logger.info(f"Migrated FAISS index for collection {self.collection_name} to IndexIDMap2")
+        return migrated
+
+    def _index_spec(self) -> Dict[str, Any]:
+        """Return the configured index spec; only the parameters that shape the built index are included."""
+        spec = {"index_type": self.index_type, "compression": self.compression}
+        if self.index_type == "hnsw":
+            spec.update(hnsw_m=self.hnsw_m, hnsw_ef_construction=self.hnsw_ef_construction)
+        elif self.index_type == "ivf":
+            spec["ivf_nlist"] = self.ivf_nlist
+        if self.compression == "pq":
+            spec["pq_m"] = self.pq_m
+        return spec
+
+    def _min_training_vectors(self, spec: Dict[str, Any]) -> int:
+        """Number of live vectors needed before `spec` can be trained; 0 if it needs no training."""
+        # FAISS k-means wants ~39 points per centroid and cannot train with fewer points than centroids
+        needed = minimum = 0
+        if spec["index_type"] == "ivf":
+            needed, minimum = 39 * spec["ivf_nlist"], spec["ivf_nlist"]
+        if spec["compression"] == "pq":
+            needed, minimum = max(needed, 39 * 256), max(minimum, 256)
+        elif spec["compression"] == "sq8":
+            needed, minimum = max(needed, 1000), max(minimum, 1)
+        if needed and self.train_min_vectors is not None:
+            return max(self.train_min_vectors, minimum)
+        return needed
+
+    def _new_index(self, spec: Dict[str, Any], distance: Optional[str] = None):
+        """
+        Build an empty index for `spec`. It may still need training before vectors can be added.
+
+        Args:
+            spec (Dict[str, Any]): Index spec, see `_index_spec`.
+            distance (str, optional): Distance strategy, defaults to the one passed during initialization.
+        """
+        distance_strategy = (distance or self.distance_strategy).lower()
+        inner_product = distance_strategy in ("inner_product", "cosine")
+        metric = faiss.METRIC_INNER_PRODUCT if inner_product else faiss.METRIC_L2
+        d = self.embedding_model_dims
+        compression = spec["compression"]
+
+        if spec["index_type"] == "ivf":
+            quantizer = faiss.IndexFlat(d, metric)
+            if compression == "pq":
+                index = faiss.IndexIVFPQ(quantizer, d, spec["ivf_nlist"], spec["pq_m"], 8, metric)
+            elif compression == "sq8":
+                index = faiss.IndexIVFScalarQuantizer(
+                    quantizer, d, spec["ivf_nlist"], faiss.ScalarQuantizer.QT_8bit, metric
+                )
+            else:
+                index = faiss.IndexIVFFlat(quantizer, d, spec["ivf_nlist"], metric)
+            # IVF indexes store int64 ids themselves; the hashtable direct map allows reconstruct and remove_ids
+            index.set_direct_map_type(faiss.DirectMap.Hashtable)
+            self._configure_search(index, spec)
+            return index
+
+        if spec["index_type"] == "hnsw":
+            if compression == "pq":
+                base_index = faiss.IndexHNSWPQ(d, spec["pq_m"], spec["hnsw_m"], 8, metric)
+            elif compression == "sq8":
+                base_index = faiss.IndexHNSWSQ(d, faiss.ScalarQuantizer.QT_8bit, spec["hnsw_m"], metric)
+            else:
+                base_index = faiss.IndexHNSWFlat(d, spec["hnsw_m"], metric)
+            base_index.hnsw.efConstruction = spec["hnsw_ef_construction"]
+        elif compression == "pq":
+            base_index = faiss.IndexPQ(d, spec["pq_m"], 8, metric)
+        elif compression == "sq8":
+            base_index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit, metric)
+        elif inner_product:
+            base_index = faiss.IndexFlatIP(d)
+        else:
+            base_index = faiss.IndexFlatL2(d)
+        index = faiss.IndexIDMap2(base_index)
+        self._configure_search(index, spec)
+        return index
+
+    def _configure_search(self, index, spec: Dict[str, Any]):
+        """Apply the search-time parameters, which are not part of the spec and may change between runs."""
+        if spec["index_type"] == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efSearch = self.hnsw_ef_search
+        elif spec["index_type"] == "ivf":
+            index.nprobe = self.ivf_nprobe
+
+    def _search_parameters(self, spec: Dict[str, Any], selector, ef_search: Optional[int] = None):
+        if spec["index_type"] == "hnsw":
+            return faiss.SearchParametersHNSW(sel=selector, efSearch=ef_search or self.hnsw_ef_search)
+        if spec["index_type"] == "ivf":
+            return faiss.SearchParametersIVF(sel=selector, nprobe=self.ivf_nprobe)
+        return faiss.SearchParameters(sel=selector)
+
+    @staticmethod
+    def _stored_ids(index) -> np.ndarray:
+        """Return the int64 ids of every row physically stored in `index`, including tombstoned ones."""
+        if isinstance(index, faiss.IndexIVF):
+            invlists = index.invlists
+            ids = [
+                faiss.rev_swig_ptr(invlists.get_ids(i), invlists.list_size(i)).copy()
+                for i in range(invlists.nlist)
+                if invlists.list_size(i)
+            ]
+            return np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+        return faiss.vector_to_array(index.id_map)
+
+    def _maybe_rebuild(self):
+        """Start a background rebuild once the configured spec differs from the built one and can be trained."""
+        spec = self._index_spec()
+        if self._built_spec == spec:
             return
+        if self.index.ntotal - self.payloads.tombstone_count() >= self._min_training_vectors(spec):
+            self.rebuild(background=True)
+
+    def rebuild(self, background: bool = True):
+        """
+        Rebuild the index with the configured spec from the vectors currently stored, training it if needed.
+
+        Searches and writes keep using the current index while the new one is built; rows written meanwhile
+        are carried over when it is swapped in. Tombstoned rows are dropped.
+
+        Args:
+            background (bool, optional): Build in a daemon thread instead of blocking. Defaults to True.
+        """
+        with self._lock:
+            if self._rebuild_thread is not None and self._rebuild_thread.is_alive():
+                return
+            if background:
+                self._rebuild_thread = threading.Thread(
+                    target=self._rebuild, name=f"mem0-faiss-rebuild-{self.collection_name}", daemon=True
+                )
+                self._rebuild_thread.start()
+                return
+        self._rebuild()
+
+    def _rebuild(self):
+        try:
+            spec = self._index_spec()
+            with self._lock:
+                if self.index is None:
+                    return
+                index_ids = np.array(self.payloads.index_ids(), dtype=np.int64)
+                vectors = self.index.reconstruct_batch(index_ids) if len(index_ids) else None
+
+            index = self._new_index(spec)
+            if not index.is_trained:
+                if len(index_ids) < self._min_training_vectors(spec):
+                    logger.info(f"Not enough vectors to train the FAISS index for {self.collection_name} yet")
+                    return
+                index.train(vectors)
+            if len(index_ids):
+                index.add_with_ids(vectors, index_ids)
+
+            with self._lock:
+                if self.index is None:
+                    return
+                # Carry over rows inserted while the new index was being built
+                snapshot_ids = set(index_ids.tolist())
+                added = np.array([i for i in self.payloads.index_ids() if i not in snapshot_ids], dtype=np.int64)
+                if len(added):
+                    index.add_with_ids(self.index.reconstruct_batch(added), added)
+                # Rows deleted meanwhile are in the new index and stay tombstoned; older tombstones are gone
+                self.payloads.set_tombstones([i for i in self.payloads.tombstones() if i in snapshot_ids])
+                self.index = index
+                self._built_spec = spec
+                self._snapshot()
+            logger.info(f"Rebuilt FAISS index for collection {self.collection_name} as {spec}")
+        except Exception as e:
+            logger.warning(f"Failed to rebuild FAISS index: {e}")
+
+    def _indexed_filters(self, filters: Optional[Dict]) -> Optional[Dict[str, List[str]]]:
+        """
+        Pick the filters on `indexed_payload_keys` that the payload store can answer from its columns.
+
+        Returns:
+            Optional[Dict[str, List[str]]]: Accepted values per key, or None when there are no such filters.
+        """
+        indexed = {}
+        for key, value in (filters or {}).items():
+            if key not in self.indexed_payload_keys:
+                continue
+            values = value if isinstance(value, list) else [value]
+            if not all(isinstance(v, str) for v in values):
+                return None
+            indexed[key] = values
+        return indexed or None
+
+    def _candidate_ids(self, filters: Optional[Dict]) -> Optional[List[int]]:
+        """
+        Resolve the filters on `indexed_payload_keys` to the index ids of the rows that match them.
+
+        Returns:
+            Optional[List[int]]: Matching index ids in insertion order, or None when no filter
+                can be answered from the payload store's columns.
+        """
+        indexed_filters = self._indexed_filters(filters)
+        if indexed_filters is None:
+            return None
+        return self.payloads.index_ids(indexed_filters)
+
+    def _prepare_search(
+        self, filters: Optional[Dict], limit: int, index, spec: Dict[str, Any]
+    ) -> Optional[Tuple[Dict[str, Any], Dict, int]]:
+        """
+        Work out how to run a filtered search against `index`, built with `spec`.
+
+        Returns:
+            Optional[Tuple[Dict[str, Any], Dict, int]]: Extra `_search_index` arguments, the filters left to
+                check in Python and the number of neighbours to fetch; None when nothing can match.
+        """
+        # IndexPQ does not accept an id selector, so those filters are applied in Python as well
+        selectable = spec["index_type"] != "flat" or spec["compression"] != "pq"
+        candidates = self._candidate_ids(filters) if selectable else None
+        if candidates is None:
+            # Tombstoned rows can still be returned by FAISS, so fetch enough to fill `limit` with live rows
+            return {}, filters, (limit * 2 if filters else limit) + self.payloads.tombstone_count()
+
+        index_ids = candidates
+        if not index_ids:
+            return None
+
+        remaining_filters = {k: v for k, v in filters.items() if k not in self.indexed_payload_keys}
+        fetch_k = min(limit * 2 if remaining_filters else limit, len(index_ids))
+        ids = np.array(index_ids, dtype=np.int64)
+        ef_search = None
+        if spec["index_type"] == "hnsw":
+            if len(ids) <= self.hnsw_exact_search_max_ids:
+                return {"exact_ids": ids}, remaining_filters, fetch_k
+            # The graph walk visits filtered-out nodes too, so widen it by the inverse of the selectivity
+            ef_search = min(max(self.hnsw_ef_search, fetch_k * index.ntotal // len(ids)), index.ntotal)
+        selector = faiss.IDSelectorBatch(ids)
+        return {"params": self._search_parameters(spec, selector, ef_search)}, remaining_filters, fetch_k
+
+    @staticmethod
+    def _search_index(index, query_vectors: np.ndarray, k: int, exact_ids=None, **search_kwargs):
+        """Run `index.search`, or an exact search over the vectors of `exact_ids` with the index's metric."""
+        if exact_ids is None:
+            return index.search(query_vectors, k, **search_kwargs)
+        stored = index.reconstruct_batch(exact_ids)
+        scores, positions = faiss.knn(query_vectors, stored, k, metric=index.metric_type)
+        return scores, np.where(positions >= 0, exact_ids[np.maximum(positions, 0)], -1)
+
+    def _compact(self) -> int:
+        with self._lock:
+            if self.index is None or not self.payloads.tombstone_count():
+                return 0
+            if self._built_spec["index_type"] == "hnsw":
+                # HNSW graphs do not support removal, so compaction rebuilds them without the tombstoned rows
+                removed = self.payloads.tombstone_count()
+                self.rebuild(background=False)
+                return removed
+            removed = self.index.remove_ids(np.array(self.payloads.tombstones(), dtype=np.int64))
+            self.payloads.set_tombstones([])
+            return int(removed)
+
+    def _maybe_compact(self):
+        tombstones = self.payloads.tombstone_count()
+        if tombstones and tombstones > self.compaction_ratio * self.index.ntotal:
+            if self._built_spec["index_type"] == "hnsw":
+                self.rebuild(background=True)
+            else:
+                self._compact()
+
+    def compact(self) -> int:
+        """
+        Remove tombstoned rows left behind by deletes and updates from the index.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        removed = self._compact()
+        if removed and self._built_spec["index_type"] != "hnsw":
+            self._snapshot()
+            logger.info(f"Compacted {removed} rows from collection {self.collection_name}")
+        return removed
+
+    def _save(self) -> bool:
+        """
+        Commit the payload store and save a snapshot of the FAISS index, replacing the old file atomically.
+
+        Payloads are committed first: if the process dies before the index is replaced, the rows it is
+        missing are re-added from the mutation log, and searches skip index rows without a payload.
+        """
+        if not self.path or not self.index:
+            return False
 
         try:
             os.makedirs(self.path, exist_ok=True)
             index_path = f"{self.path}/{self.collection_name}.faiss"
-            docstore_path = f"{self.path}/{self.collection_name}.pkl"
 
-            faiss.write_index(self.index, index_path)
-            with open(docstore_path, "wb") as f:
-                pickle.dump((self.docstore, self.index_to_id), f)
+            with self._lock:
+                self.payloads.set_meta("next_id", self._next_id)
+                self.payloads.set_meta("built_spec", self._built_spec)
+                self.payloads.commit()
+                faiss.write_index(self.index, f"{index_path}.tmp")
+                os.replace(f"{index_path}.tmp", index_path)
+            return True
         except Exception as e:
             logger.warning(f"Failed to save FAISS index: {e}")
+            return False
+
+    @property
+    def _log_path(self) -> str:
+        return f"{self.path}/{self.collection_name}.log"
+
+    def _persist(self, mutation: Dict):
+        """
+        Make a mutation durable according to the persistence policy.
+
+        Args:
+            mutation (Dict): Log record describing the mutation, replayed by `_replay_log`.
+        """
+        if self._replaying or not self.path:
+            return
+        if self.persistence == "immediate":
+            self._save()
+            return
+
+        with self._lock:
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                with open(self._log_path, "a") as f:
+                    f.write(json.dumps(mutation) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                logger.warning(f"Failed to append to FAISS mutation log: {e}")
+            # Commit the payloads now rather than at the next snapshot, so the SQLite write lock is not
+            # held between mutations; replaying the log re-adds vectors the last snapshot is missing.
+            if self.payloads is not None:
+                self.payloads.set_meta("next_id", self._next_id)
+                self.payloads.commit()
+            self._pending_ops += 1
+
+            if self.persistence != "debounced":
+                return
+            if self._pending_ops < self.flush_every_n_ops:
+                if self._flush_timer is None:
+                    self._flush_timer = threading.Timer(
+                        self.flush_interval_ms / 1000, _flush_when_due, args=(weakref.ref(self),)
+                    )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                return
+        self.flush()
+
+    def _timed_flush(self):
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+
+    def _replay_log(self):
+        """Apply mutations logged after the last snapshot, then snapshot and truncate the log."""
+        if not os.path.exists(self._log_path):
+            return
+
+        applied = 0
+        self._replaying = True
+        try:
+            with open(self._log_path) as f:
+                for line in f:
+                    try:
+                        mutation = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A torn final write from a crash; everything before it has been applied
+                        logger.warning(f"Ignoring truncated entry in FAISS mutation log {self._log_path}")
+                        break
+                    try:
+                        self._apply(mutation)
+                        applied += 1
+                    except ValueError as e:
+                        logger.warning(f"Skipping FAISS mutation log entry: {e}")
+        finally:
+            self._replaying = False
+
+        self._drop_unlogged_rows()
+        logger.info(f"Replayed {applied} mutations from {self._log_path}")
+        self._pending_ops = applied
+        self.flush()
+
+    def _drop_unlogged_rows(self):
+        """
+        Remove payload rows whose vector is in neither the snapshot nor the replayed log.
+
+        Payloads are committed right after their mutation is logged, so a crash in between can leave
+        a committed row for a vector that was never written.
+        """
+        if self.index is None or self.payloads is None:
+            return
+        with self._lock:
+            stored_ids = set(self._stored_ids(self.index).tolist())
+            orphans = [index_id for index_id in self.payloads.index_ids() if index_id not in stored_ids]
+            if orphans:
+                rows = self.payloads.get_by_index_ids(orphans)
+                self.payloads.remove_many([vector_id for vector_id, _ in rows.values()])
+                logger.warning(f"Dropped {len(rows)} payloads without a vector from {self._payloads_path}")
+
+    def _apply(self, mutation: Dict):
+        op = mutation["op"]
+        if op == "insert":
+            self.insert(mutation["vectors"], mutation["payloads"], mutation["ids"])
+        elif op == "delete":
+            self.delete(mutation["id"])
+        elif op == "delete_many":
+            self.bulk_delete(mutation["ids"])
+        elif op == "update":
+            self.update(mutation["id"], payload=mutation["payload"])
+        elif op == "update_many":
+            self.bulk_update([{"vector_id": u["id"], "payload": u["payload"]} for u in mutation["updates"]])
+        else:
+            raise ValueError(f"Unknown mutation {op}")
+
+    def flush(self):
+        """
+        Commit the payloads, write a snapshot of the index and truncate the mutation log.
+
+        Only needed with the "debounced" or "manual" persistence policies; with "immediate" every
+        mutation is already snapshotted.
+        """
+        if self._pending_ops:
+            self._snapshot()
+
+    def _snapshot(self):
+        # Held throughout so no mutation is logged between writing the snapshot and truncating the log
+        with self._lock:
+            if not self._save():
+                return
+            try:
+                if os.path.exists(self._log_path):
+                    os.remove(self._log_path)
+            except OSError as e:
+                logger.warning(f"Failed to truncate FAISS mutation log: {e}")
+            self._pending_ops = 0
 
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
@@ -130,27 +947,22 @@ class FAISS(VectorStoreBase):
         if limit is None:
             limit = len(ids)
 
+        # FAISS returns -1 for empty results
+        index_ids = [int(i) for i in ids[:limit] if i != -1]
+        rows = self.payloads.get_by_index_ids(index_ids)
+
         results = []
         for i in range(min(len(ids), limit)):
-            if ids[i] == -1:  # FAISS returns -1 for empty results
-                continue
-
-            index_id = int(ids[i])
-            vector_id = self.index_to_id.get(index_id)
-            if vector_id is None:
-                continue
-
-            payload = self.docstore.get(vector_id)
-            if payload is None:
+            row = rows.get(int(ids[i]))
+            if row is None:  # empty result or tombstoned row
                 continue
 
-            payload_copy = payload.copy()
-
+            vector_id, payload = row
             score = float(scores[i])
             entry = OutputData(
                 id=vector_id,
                 score=score,
-                payload=payload_copy,
+                payload=payload,
             )
             results.append(entry)
 
@@ -168,13 +980,18 @@ class FAISS(VectorStoreBase):
         Returns:
             self: The FAISS instance.
         """
-        distance_strategy = distance or self.distance_strategy
-
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
+        spec = self._index_spec()
+        index = self._new_index(spec, distance)
+        if not index.is_trained:
+            # Hold vectors in a flat index until there are enough to train the configured one
+            spec = dict(self.flat_spec)
+            index = self._new_index(spec, distance)
+        with self._lock:
+            self.index = index
+            self._built_spec = spec
+            self._open_payloads(name)
+            self.payloads.clear()
+        self._next_id = 0
 
         self.collection_name = name
 
@@ -213,14 +1030,19 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(vectors_np)
 
-        self.index.add(vectors_np)
+        with self._lock:
+            index_ids = np.arange(self._next_id, self._next_id + len(ids), dtype=np.int64)
+            self._next_id += len(ids)
+            self.index.add_with_ids(vectors_np, index_ids)
 
-        starting_idx = len(self.index_to_id)
-        for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
-            self.docstore[vector_id] = payload.copy()
-            self.index_to_id[starting_idx + i] = vector_id
+            # Re-inserting an existing id replaces its row instead of leaving a stale vector behind
+            self.payloads.add_tombstones(self.payloads.index_ids_for(list(ids)).values())
+            self.payloads.put_many(list(zip(ids, index_ids.tolist(), payloads)))
 
-        self._save()
+        self._maybe_compact()
+        self._persist({"op": "insert", "vectors": vectors_np.tolist(), "payloads": payloads, "ids": ids})
+        if not self._replaying:
+            self._maybe_rebuild()
 
         logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
 
@@ -250,10 +1072,15 @@ class FAISS(VectorStoreBase):
         if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
             faiss.normalize_L2(query_vectors)
 
-        fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        with self._lock:
+            index, spec = self.index, self._built_spec
+        prepared = self._prepare_search(filters, limit, index, spec)
+        if prepared is None:
+            return []
+        search_kwargs, filters, fetch_k = prepared
+        scores, indices = self._search_index(index, query_vectors, fetch_k, **search_kwargs)
 
-        results = self._parse_output(scores[0], indices[0], limit)
+        results = self._parse_output(scores[0], indices[0], fetch_k)
 
         if filters:
             filtered_results = []
@@ -262,9 +1089,56 @@ class FAISS(VectorStoreBase):
                     filtered_results.append(result)
                     if len(filtered_results) >= limit:
                         break
-            results = filtered_results[:limit]
+            results = filtered_results
 
-        return results
+        return results[:limit]
+
+    def search_batch(
+        self, queries: List[str], vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search for similar vectors for several queries with a single index lookup.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors (List[list]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Search results per query, in input order.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        if len(queries) != len(vectors):
+            raise ValueError("Queries and vectors must have the same length")
+
+        if not vectors:
+            return []
+
+        with self._lock:
+            index, spec = self.index, self._built_spec
+        prepared = self._prepare_search(filters, limit, index, spec)
+        if prepared is None:
+            return [[] for _ in queries]
+        search_kwargs, filters, fetch_k = prepared
+
+        query_vectors = np.array(vectors, dtype=np.float32)
+
+        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+            faiss.normalize_L2(query_vectors)
+
+        scores, indices = self._search_index(index, query_vectors, fetch_k, **search_kwargs)
+
+        batch_results = []
+        for row_scores, row_indices in zip(scores, indices):
+            results = self._parse_output(row_scores, row_indices, fetch_k)
+            if filters:
+                results = [result for result in results if self._apply_filters(result.payload, filters)]
+            batch_results.append(results[:limit])
+
+        return batch_results
 
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
@@ -302,17 +1176,13 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        index_to_delete = None
-        for idx, vid in self.index_to_id.items():
-            if vid == vector_id:
-                index_to_delete = idx
-                break
-
-        if index_to_delete is not None:
-            self.docstore.pop(vector_id, None)
-            self.index_to_id.pop(index_to_delete, None)
-
-            self._save()
+        with self._lock:
+            index_id = self.payloads.remove(vector_id)
+            if index_id is not None:
+                self.payloads.add_tombstones([index_id])
+        if index_id is not None:
+            self._maybe_compact()
+            self._persist({"op": "delete", "id": vector_id})
 
             logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
         else:
@@ -335,20 +1205,19 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
+        current_payload = self.payloads.get(vector_id)
+        if current_payload is None:
             raise ValueError(f"Vector {vector_id} not found")
 
-        current_payload = self.docstore[vector_id].copy()
-
         if payload is not None:
-            self.docstore[vector_id] = payload.copy()
-            current_payload = self.docstore[vector_id].copy()
+            self.payloads.set_payload(vector_id, payload)
+            current_payload = payload.copy()
 
         if vector is not None:
-            self.delete(vector_id)
+            # insert() tombstones the current row for this id
             self.insert([vector], [current_payload], [vector_id])
         else:
-            self._save()
+            self._persist({"op": "update", "id": vector_id, "payload": current_payload})
 
         logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
 
@@ -365,17 +1234,98 @@ class FAISS(VectorStoreBase):
         if self.index is None:
             raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
+        payload = self.payloads.get(vector_id)
+        if payload is None:
             return None
 
-        payload = self.docstore[vector_id].copy()
-
         return OutputData(
             id=vector_id,
             score=None,
             payload=payload,
         )
 
+    def bulk_get(self, vector_ids: List[str]) -> List[Optional[OutputData]]:
+        """
+        Retrieve several vectors by ID with a single payload lookup.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[Optional[OutputData]]: One result per ID, in input order, None where not found.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        found = self.payloads.get_many(list(vector_ids))
+        return [
+            OutputData(id=vector_id, score=None, payload=found[vector_id]) if vector_id in found else None
+            for vector_id in vector_ids
+        ]
+
+    def bulk_update(self, updates: List[Dict]):
+        """
+        Update several vectors and their payloads.
+
+        Rows with a new vector are re-added in one `insert`; payload-only changes are written
+        together and logged as one mutation.
+
+        Args:
+            updates (List[Dict]): Dicts with a "vector_id" key and optional "vector" and "payload" keys.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        current = self.payloads.get_many([u["vector_id"] for u in updates])
+        missing = [u["vector_id"] for u in updates if u["vector_id"] not in current]
+        if missing:
+            raise ValueError(f"Vectors {', '.join(missing)} not found")
+
+        vectors, payloads, ids, payload_updates = [], [], [], []
+        for update in updates:
+            vector_id, payload = update["vector_id"], update.get("payload")
+            if payload is None:
+                payload = current[vector_id]
+            if update.get("vector") is not None:
+                vectors.append(update["vector"])
+                payloads.append(payload)
+                ids.append(vector_id)
+            elif update.get("payload") is not None:
+                payload_updates.append({"id": vector_id, "payload": payload})
+
+        if payload_updates:
+            with self._lock:
+                for update in payload_updates:
+                    self.payloads.set_payload(update["id"], update["payload"])
+            self._persist({"op": "update_many", "updates": payload_updates})
+        if vectors:
+            # insert() tombstones the current rows for these ids
+            self.insert(vectors, payloads, ids)
+
+        logger.info(f"Updated {len(updates)} vectors in collection {self.collection_name}")
+
+    def bulk_delete(self, vector_ids: List[str]):
+        """
+        Delete several vectors by ID, compacting and persisting once.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        if self.index is None:
+            raise ValueError("Collection not initialized. Call create_col first.")
+
+        with self._lock:
+            removed = self.payloads.remove_many(list(vector_ids))
+            self.payloads.add_tombstones(removed.values())
+        if removed:
+            self._maybe_compact()
+            self._persist({"op": "delete_many", "ids": list(removed)})
+
+        missing = [vector_id for vector_id in vector_ids if vector_id not in removed]
+        if missing:
+            logger.warning(f"Vectors {', '.join(missing)} not found in collection {self.collection_name}")
+        logger.info(f"Deleted {len(removed)} vectors from collection {self.collection_name}")
+
     def list_cols(self) -> List[str]:
         """
         List all collections.
@@ -403,20 +1353,28 @@ class FAISS(VectorStoreBase):
         if self.path:
             try:
                 index_path = f"{self.path}/{self.collection_name}.faiss"
-                docstore_path = f"{self.path}/{self.collection_name}.pkl"
 
+                if self.payloads is not None:
+                    self.payloads.close()
+                    self.payloads = None
                 if os.path.exists(index_path):
                     os.remove(index_path)
-                if os.path.exists(docstore_path):
-                    os.remove(docstore_path)
+                if os.path.exists(self._payloads_path):
+                    os.remove(self._payloads_path)
+                if os.path.exists(self._log_path):
+                    os.remove(self._log_path)
 
                 logger.info(f"Deleted collection {self.collection_name}")
             except Exception as e:
                 logger.warning(f"Failed to delete collection: {e}")
 
-        self.index = None
-        self.docstore = {}
-        self.index_to_id = {}
+        with self._lock:
+            self.index = None
+            if self.payloads is not None:
+                self.payloads.close()
+                self.payloads = None
+        self._next_id = 0
+        self._pending_ops = 0
 
     def col_info(self) -> Dict:
         """
@@ -430,9 +1388,10 @@ class FAISS(VectorStoreBase):
 
         return {
             "name": self.collection_name,
-            "count": self.index.ntotal,
+            "count": self.index.ntotal - self.payloads.tombstone_count(),
             "dimension": self.index.d,
             "distance": self.distance_strategy,
+            "index_type": self._built_spec["index_type"],
         }
 
     def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
@@ -452,17 +1411,19 @@ class FAISS(VectorStoreBase):
         results = []
         count = 0
 
-        for vector_id, payload in self.docstore.items():
+        indexed_filters = self._indexed_filters(filters)
+        if indexed_filters:
+            filters = {k: v for k, v in filters.items() if k not in indexed_filters}
+
+        for vector_id, payload in self.payloads.iter_rows(indexed_filters):
             if filters and not self._apply_filters(payload, filters):
                 continue
 
-            payload_copy = payload.copy()
-
             results.append(
                 OutputData(
                     id=vector_id,
                     score=None,
-                    payload=payload_copy,
+                    payload=payload,
                 )
             )
 
@@ -477,3 +1438,527 @@ class FAISS(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.create_col(self.collection_name)
+
+
+class ShardedFAISS(VectorStoreBase):
+    """
+    FAISS collection split into one index per `shard_by` value, or per hash bucket of it.
+
+    Created by `VectorStoreFactory` when the FAISS config sets `shard_by`. Each shard is a `FAISS` store under
+    `<path>/shards/<shard>`, and `<collection>.routes.db` records which shard holds each memory id.
+    Shards are opened on first use and at most `max_resident_shards` stay loaded; the least recently
+    used one is flushed and closed to make room. Searches and lists filtered on `shard_by` only open
+    the matching shards, other calls visit every shard.
+
+    The store's lock only guards the resident shards and the routing table. Index and payload work
+    runs under the lock of its shard, so calls for different shards do not wait for each other; a
+    shard is leased while a call uses it, and is not evicted before the call is done.
+    """
+
+    # Shard for rows without a `shard_by` value, e.g. memories scoped only to an agent or run
+    unscoped_shard = "unscoped"
+
+    def __init__(
+        self,
+        collection_name: str,
+        path: Optional[str] = None,
+        shard_by: Literal["user_id"] = "user_id",
+        shard_buckets: Optional[int] = None,
+        max_resident_shards: int = 32,
+        **shard_config,
+    ):
+        """
+        Initialize the sharded FAISS vector store.
+
+        Args:
+            collection_name (str): Name of the collection.
+            path (str, optional): Directory holding the shards and routing table. Defaults to None.
+            shard_by (str, optional): Payload key the collection is sharded by. Defaults to "user_id".
+            shard_buckets (int, optional): Hash values into this many shards instead of one shard per value.
+                Defaults to None.
+            max_resident_shards (int, optional): Number of shards kept loaded. Defaults to 32.
+            **shard_config: Options for every shard, as accepted by `FAISS`.
+        """
+        if max_resident_shards < 1:
+            raise ValueError("max_resident_shards must be at least 1")
+
+        self.collection_name = collection_name
+        self.path = path or f"/tmp/faiss/{collection_name}"
+        self.shard_by = shard_by
+        self.shard_buckets = shard_buckets
+        self.max_resident_shards = max_resident_shards
+        self.shard_config = shard_config
+        self.distance_strategy = shard_config.get("distance_strategy", "euclidean")
+        self.embedding_model_dims = shard_config.get("embedding_model_dims", 1536)
+
+        self._lock = threading.RLock()
+        self._resident: "OrderedDict[str, FAISS]" = OrderedDict()
+        self._leases: Dict[str, int] = {}
+        self.routes = None
+        self.create_col(collection_name)
+
+    @property
+    def _shards_dir(self) -> str:
+        return os.path.join(self.path, "shards")
+
+    @property
+    def _routes_path(self) -> str:
+        return os.path.join(self.path, f"{self.collection_name}.routes.db")
+
+    def _shard_name(self, value: Any) -> str:
+        if value is None:
+            return self.unscoped_shard
+        # Hashing keeps arbitrary ids safe to use as directory names
+        digest = hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+        if self.shard_buckets:
+            return f"bucket-{int(digest, 16) % self.shard_buckets}"
+        return f"{self.shard_by}-{digest[:32]}"
+
+    def _shard_names(self, filters: Optional[Dict]) -> List[str]:
+        """Return the shards that can hold rows matching `filters`."""
+        value = (filters or {}).get(self.shard_by)
+        if value is not None:
+            values = value if isinstance(value, list) else [value]
+            return list(dict.fromkeys(self._shard_name(v) for v in values))
+        if not os.path.isdir(self._shards_dir):
+            return []
+        return sorted(os.listdir(self._shards_dir))
+
+    def _shard(self, name: str, create: bool = False) -> Optional[FAISS]:
+        """
+        Return a loaded shard, opening it and evicting the least recently used one if needed.
+
+        The caller holds the store's lock, and should lease the shard before releasing it.
+        """
+        shard = self._resident.get(name)
+        if shard is not None:
+            self._resident.move_to_end(name)
+            return shard
+
+        shard_path = os.path.join(self._shards_dir, name)
+        if not create and not os.path.exists(os.path.join(shard_path, f"{self.collection_name}.faiss")):
+            return None
+
+        shard = FAISS(collection_name=self.collection_name, path=shard_path, **self.shard_config)
+        self._resident[name] = shard
+        self._evict(keep=name)
+        return shard
+
+    @contextmanager
+    def _leased(self, name: Optional[str], create: bool = False, load: bool = True) -> Iterator[Optional[FAISS]]:
+        """
+        Yield the shard `name`, or None if there is none, keeping it loaded until the block exits.
+
+        With `load` False, a shard that is not loaded is not opened either.
+        """
+        with self._lock:
+            if name is None or (not load and name not in self._resident):
+                shard = None
+            else:
+                shard = self._shard(name, create)
+            if shard is not None:
+                self._leases[name] = self._leases.get(name, 0) + 1
+        try:
+            yield shard
+        finally:
+            if shard is not None:
+                with self._lock:
+                    self._leases[name] -= 1
+                    if not self._leases[name]:
+                        del self._leases[name]
+
+    def _evict(self, keep: str):
+        """
+        Close the least recently used shards beyond `max_resident_shards`.
+
+        Shards leased by a running call or rebuilding their index in the background are skipped
+        rather than waited for, so they may briefly exceed the limit until a later call evicts them.
+        """
+        for name in list(self._resident):
+            if len(self._resident) <= self.max_resident_shards:
+                return
+            shard = self._resident[name]
+            if (
+                name == keep
+                or name in self._leases
+                or (shard._rebuild_thread is not None and shard._rebuild_thread.is_alive())
+            ):
+                continue
+            del self._resident[name]
+            self._close_shard(shard)
+
+    def _close_shard(self, shard: FAISS, flush: bool = True):
+        if shard._rebuild_thread is not None:
+            shard._rebuild_thread.join()
+        if flush:
+            shard.flush()
+        if shard.payloads is not None:
+            shard.payloads.close()
+
+    def _routes_for(self, vector_ids: List[str]) -> Dict[str, str]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(vector_ids), PayloadStore.batch_size):
+                chunk = vector_ids[start : start + PayloadStore.batch_size]
+                rows = self.routes.execute(
+                    f"SELECT id, shard FROM routes WHERE id IN ({', '.join('?' for _ in chunk)})", chunk
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def _merge(self, results: List[OutputData], limit: int) -> List[OutputData]:
+        # Inner product and cosine scores are similarities, euclidean scores are distances
+        descending = self.distance_strategy.lower() in ("inner_product", "cosine")
+        return sorted(results, key=lambda r: r.score, reverse=descending)[:limit]
+
+    def create_col(self, name: str, distance: str = None):
+        """
+        Open the collection's routing table; shards are created as rows are inserted into them.
+
+        Args:
+            name (str): Name of the collection.
+            distance (str, optional): Distance metric to use. Overrides the distance_strategy
+                passed during initialization. Defaults to None.
+
+        Returns:
+            self: The ShardedFAISS instance.
+        """
+        with self._lock:
+            if distance:
+                self.distance_strategy = distance
+                self.shard_config["distance_strategy"] = distance
+            self.collection_name = name
+            os.makedirs(self.path, exist_ok=True)
+            if self.routes is not None:
+                self.routes.close()
+            self.routes = sqlite3.connect(self._routes_path, check_same_thread=False, isolation_level=None)
+            self.routes.execute("CREATE TABLE IF NOT EXISTS routes (id TEXT PRIMARY KEY, shard TEXT)")
+        return self
+
+    def insert(
+        self,
+        vectors: List[list],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+    ):
+        """
+        Insert vectors into the shards their payloads belong to.
+
+        Args:
+            vectors (List[list]): List of vectors to insert.
+            payloads (Optional[List[Dict]], optional): List of payloads corresponding to vectors. Defaults to None.
+            ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
+        """
+        if ids is None:
+            ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+
+        if payloads is None:
+            payloads = [{} for _ in range(len(vectors))]
+
+        if len(vectors) != len(ids) or len(vectors) != len(payloads):
+            raise ValueError("Vectors, payloads, and IDs must have the same length")
+
+        names = [self._shard_name((payload or {}).get(self.shard_by)) for payload in payloads]
+        groups: Dict[str, List[int]] = {}
+        for position, name in enumerate(names):
+            groups.setdefault(name, []).append(position)
+
+        for name, positions in groups.items():
+            with self._leased(name, create=True) as shard:
+                shard.insert(
+                    [vectors[i] for i in positions], [payloads[i] for i in positions], [ids[i] for i in positions]
+                )
+
+        # Routes are swapped in one step once the rows are stored, so concurrent inserts of an id
+        # agree on the shard that keeps it
+        with self._lock:
+            previous = self._routes_for(list(ids))
+            self.routes.executemany("INSERT OR REPLACE INTO routes (id, shard) VALUES (?, ?)", list(zip(ids, names)))
+
+        # A re-inserted id whose shard changed must not linger in the old one
+        moved: Dict[str, List[str]] = {}
+        for vector_id, name in zip(ids, names):
+            old_name = previous.get(vector_id)
+            if old_name is not None and old_name != name:
+                moved.setdefault(old_name, []).append(vector_id)
+        for old_name, moved_ids in moved.items():
+            with self._leased(old_name) as old_shard:
+                if old_shard is not None:
+                    old_shard.bulk_delete(moved_ids)
+
+    def search(
+        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """
+        Search the shards matching `filters` and merge their results.
+
+        Args:
+            query (str): Query (not used, kept for API compatibility).
+            vectors (List[list]): List of vectors to search.
+            limit (int, optional): Number of results to return. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to the search. Defaults to None.
+
+        Returns:
+            List[OutputData]: Search results.
+        """
+        results = []
+        for name in self._shard_names(filters):
+            with self._leased(name) as shard:
+                if shard is not None:
+                    results.extend(shard.search(query, vectors, limit, filters))
+        return self._merge(results, limit)
+
+    def search_batch(
+        self, queries: List[str], vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search the shards matching `filters` for several queries and merge the results per query.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors (List[list]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: Search results per query, in input order.
+        """
+        if len(queries) != len(vectors):
+            raise ValueError("Queries and vectors must have the same length")
+
+        merged = [[] for _ in queries]
+        for name in self._shard_names(filters):
+            with self._leased(name) as shard:
+                if shard is None:
+                    continue
+                for results, shard_results in zip(merged, shard.search_batch(queries, vectors, limit, filters)):
+                    results.extend(shard_results)
+        return [self._merge(results, limit) for results in merged]
+
+    def delete(self, vector_id: str):
+        """
+        Delete a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to delete.
+        """
+        with self._leased(self._routes_for([vector_id]).get(vector_id)) as shard:
+            if shard is None:
+                logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
+                return
+            shard.delete(vector_id)
+        with self._lock:
+            self.routes.execute("DELETE FROM routes WHERE id = ?", (vector_id,))
+
+    def update(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[Dict] = None,
+    ):
+        """
+        Update a vector and its payload, moving it to another shard if its `shard_by` value changed.
+
+        Args:
+            vector_id (str): ID of the vector to update.
+            vector (Optional[List[float]], optional): Updated vector. Defaults to None.
+            payload (Optional[Dict], optional): Updated payload. Defaults to None.
+        """
+        name = self._routes_for([vector_id]).get(vector_id)
+        with self._leased(name) as shard:
+            if shard is None:
+                raise ValueError(f"Vector {vector_id} not found")
+
+            if payload is None or self._shard_name(payload.get(self.shard_by)) == name:
+                shard.update(vector_id, vector=vector, payload=payload)
+                return
+
+            if vector is None:
+                with shard._lock:
+                    index_id = shard.payloads.index_ids_for([vector_id])[vector_id]
+                    vector = shard.index.reconstruct(index_id).tolist()
+        self.insert([vector], [payload], [vector_id])
+
+    def get(self, vector_id: str) -> OutputData:
+        """
+        Retrieve a vector by ID.
+
+        Args:
+            vector_id (str): ID of the vector to retrieve.
+
+        Returns:
+            OutputData: Retrieved vector.
+        """
+        with self._leased(self._routes_for([vector_id]).get(vector_id)) as shard:
+            return shard.get(vector_id) if shard is not None else None
+
+    def bulk_get(self, vector_ids: List[str]) -> List[Optional[OutputData]]:
+        """
+        Retrieve several vectors by ID with one lookup per shard.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to retrieve.
+
+        Returns:
+            List[Optional[OutputData]]: One result per ID, in input order, None where not found.
+        """
+        groups: Dict[str, List[str]] = {}
+        for vector_id, name in self._routes_for(list(vector_ids)).items():
+            groups.setdefault(name, []).append(vector_id)
+        found = {}
+        for name, ids in groups.items():
+            with self._leased(name) as shard:
+                if shard is not None:
+                    found.update((r.id, r) for r in shard.bulk_get(ids) if r is not None)
+        return [found.get(vector_id) for vector_id in vector_ids]
+
+    def bulk_update(self, updates: List[Dict]):
+        """
+        Update several vectors and their payloads, one shard at a time.
+
+        Rows whose `shard_by` value changed are moved individually through `update`.
+
+        Args:
+            updates (List[Dict]): Dicts with a "vector_id" key and optional "vector" and "payload" keys.
+        """
+        routes = self._routes_for([u["vector_id"] for u in updates])
+        missing = [u["vector_id"] for u in updates if u["vector_id"] not in routes]
+        if missing:
+            raise ValueError(f"Vectors {', '.join(missing)} not found")
+
+        groups: Dict[str, List[Dict]] = {}
+        for update in updates:
+            name, payload = routes[update["vector_id"]], update.get("payload")
+            if payload is not None and self._shard_name(payload.get(self.shard_by)) != name:
+                self.update(update["vector_id"], vector=update.get("vector"), payload=payload)
+            else:
+                groups.setdefault(name, []).append(update)
+        for name, shard_updates in groups.items():
+            with self._leased(name) as shard:
+                shard.bulk_update(shard_updates)
+
+    def bulk_delete(self, vector_ids: List[str]):
+        """
+        Delete several vectors by ID with one batched delete per shard.
+
+        Args:
+            vector_ids (List[str]): IDs of the vectors to delete.
+        """
+        routes = self._routes_for(list(vector_ids))
+        missing = [vector_id for vector_id in vector_ids if vector_id not in routes]
+        if missing:
+            logger.warning(f"Vectors {', '.join(missing)} not found in collection {self.collection_name}")
+
+        groups: Dict[str, List[str]] = {}
+        for vector_id, name in routes.items():
+            groups.setdefault(name, []).append(vector_id)
+        for name, ids in groups.items():
+            with self._leased(name) as shard:
+                if shard is not None:
+                    shard.bulk_delete(ids)
+        with self._lock:
+            self.routes.executemany("DELETE FROM routes WHERE id = ?", [(i,) for i in routes])
+
+    def list_cols(self) -> List[str]:
+        """
+        List all collections.
+
+        Returns:
+            List[str]: List of collection names.
+        """
+        return [self.collection_name] if self.routes is not None else []
+
+    def delete_col(self):
+        """
+        Delete the collection and all of its shards.
+        """
+        with self._lock:
+            while self._resident:
+                _, shard = self._resident.popitem()
+                self._close_shard(shard, flush=False)
+            if self.routes is not None:
+                self.routes.close()
+                self.routes = None
+            try:
+                if os.path.isdir(self._shards_dir):
+                    shutil.rmtree(self._shards_dir)
+                if os.path.exists(self._routes_path):
+                    os.remove(self._routes_path)
+                logger.info(f"Deleted collection {self.collection_name}")
+            except Exception as e:
+                logger.warning(f"Failed to delete collection: {e}")
+
+    def col_info(self) -> Dict:
+        """
+        Get information about the collection.
+
+        Returns:
+            Dict: Collection information.
+        """
+        with self._lock:
+            if self.routes is None:
+                return {"name": self.collection_name, "count": 0}
+            return {
+                "name": self.collection_name,
+                "count": self.routes.execute("SELECT COUNT(*) FROM routes").fetchone()[0],
+                "dimension": self.embedding_model_dims,
+                "distance": self.distance_strategy,
+                "shards": len(self._shard_names(None)),
+                "resident_shards": len(self._resident),
+            }
+
+    def list(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+        """
+        List the vectors in the shards matching `filters`.
+
+        Args:
+            filters (Optional[Dict], optional): Filters to apply to the list. Defaults to None.
+            limit (int, optional): Number of vectors to return. Defaults to 100.
+
+        Returns:
+            List[OutputData]: List of vectors.
+        """
+        results = []
+        for name in self._shard_names(filters):
+            if len(results) >= limit:
+                break
+            with self._leased(name) as shard:
+                if shard is not None:
+                    results.extend(shard.list(filters=filters, limit=limit - len(results))[0])
+        return [results]
+
+    def flush(self):
+        """Snapshot every loaded shard; see `FAISS.flush`."""
+        with self._lock:
+            names = list(self._resident)
+        for name in names:
+            with self._leased(name, load=False) as shard:
+                if shard is not None:
+                    shard.flush()
+
+    def compact(self) -> int:
+        """
+        Compact every shard; see `FAISS.compact`.
+
+        Returns:
+            int: Number of rows removed.
+        """
+        removed = 0
+        for name in self._shard_names(None):
+            with self._leased(name) as shard:
+                if shard is not None:
+                    removed += shard.compact()
+        return removed
+
+    def rebuild(self, background: bool = True):
+        """Rebuild every shard with the configured index spec; see `FAISS.rebuild`."""
+        for name in self._shard_names(None):
+            with self._leased(name) as shard:
+                if shard is not None:
+                    shard.rebuild(background=background)
+
+    def reset(self):
+        """Reset the collection by deleting and recreating it."""
+        logger.warning(f"Resetting index {self.collection_name}...")
+        self.delete_col()
+        self.create_col(self.collection_name)
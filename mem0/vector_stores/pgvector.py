@@ -1,6 +1,7 @@
+import asyncio
 import json
 import logging
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any, List, Optional
 
 from pydantic import BaseModel
@@ -8,7 +9,7 @@ from pydantic import BaseModel
 # Try to import psycopg (psycopg3) first, then fall back to psycopg2
 try:
     from psycopg.types.json import Json
-    from psycopg_pool import ConnectionPool
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
     PSYCOPG_VERSION = 3
     logger = logging.getLogger(__name__)
     logger.info("Using psycopg (psycopg3) with ConnectionPool for PostgreSQL connections")
@@ -25,7 +26,7 @@ except ImportError:
             "Please install one of them using 'pip install psycopg[pool]' or 'pip install psycopg2'"
         )
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
@@ -36,7 +37,7 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
-class PGVector(VectorStoreBase):
+class PGVector(VectorStoreBase, AsyncVectorStoreBase):
     def __init__(
         self,
         dbname,
@@ -78,6 +79,10 @@ class PGVector(VectorStoreBase):
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
         self.connection_pool = None
+        # psycopg3 async pool, opened on first async call; only used when the store manages its own pool
+        self._async_pool = None
+        self._async_pool_lock = None
+        self._async_pool_args = None
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
         if connection_pool is not None:
@@ -102,6 +107,7 @@ class PGVector(VectorStoreBase):
             if PSYCOPG_VERSION == 3:
                 # psycopg3 ConnectionPool
                 self.connection_pool = ConnectionPool(conninfo=connection_string, min_size=minconn, max_size=maxconn, open=True)
+                self._async_pool_args = {"conninfo": connection_string, "min_size": minconn, "max_size": maxconn}
             else:
                 # psycopg2 ThreadedConnectionPool
                 self.connection_pool = ConnectionPool(minconn=minconn, maxconn=maxconn, dsn=connection_string)
@@ -144,6 +150,38 @@ class PGVector(VectorStoreBase):
                 cur.close()
                 self.connection_pool.putconn(conn)
 
+    @property
+    def supports_async(self) -> bool:
+        return self._async_pool_args is not None
+
+    async def _get_async_pool(self):
+        if self._async_pool is None:
+            if self._async_pool_lock is None:
+                self._async_pool_lock = asyncio.Lock()
+            async with self._async_pool_lock:
+                if self._async_pool is None:
+                    pool = AsyncConnectionPool(**self._async_pool_args, open=False)
+                    await pool.open()
+                    self._async_pool = pool
+        return self._async_pool
+
+    @asynccontextmanager
+    async def _get_async_cursor(self, commit: bool = False):
+        """
+        Async counterpart of `_get_cursor` on the psycopg3 async pool.
+        """
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    yield cur
+                    if commit:
+                        await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    logger.error("Error in async cursor context (psycopg3)", exc_info=True)
+                    raise
+
     def create_col(self) -> None:
         """
         Create a new collection (table in PostgreSQL).
@@ -199,6 +237,39 @@ class PGVector(VectorStoreBase):
                     data,
                 )
 
+    async def ainsert(self, vectors: list[list[float]], payloads=None, ids=None) -> None:
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        data = [(id, vector, json.dumps(payload)) for id, vector, payload in zip(ids, vectors, payloads)]
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.executemany(
+                f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                data,
+            )
+
+    @staticmethod
+    def _filter_clause(filters: Optional[dict]) -> tuple:
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                filter_conditions.append("payload->>%s = %s")
+                filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    def _search_query(self, vectors: list[float], limit: Optional[int], filters: Optional[dict]) -> tuple:
+        filter_clause, filter_params = self._filter_clause(filters)
+        query = f"""
+                SELECT id, vector <=> %s::vector AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+                """
+        return query, (vectors, *filter_params, limit)
+
     def search(
         self,
         query: str,
@@ -218,31 +289,24 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
-
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
-
         with self._get_cursor() as cur:
-            cur.execute(
-                f"""
-                SELECT id, vector <=> %s::vector AS distance, payload
-                FROM {self.collection_name}
-                {filter_clause}
-                ORDER BY distance
-                LIMIT %s
-                """,
-                (vectors, *filter_params, limit),
-            )
-
+            cur.execute(*self._search_query(vectors, limit, filters))
             results = cur.fetchall()
         return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
+    async def asearch(
+        self,
+        query: str,
+        vectors: list[float],
+        limit: Optional[int] = 5,
+        filters: Optional[dict] = None,
+    ) -> List[OutputData]:
+        """Search for similar vectors on the async pool."""
+        async with self._get_async_cursor() as cur:
+            await cur.execute(*self._search_query(vectors, limit, filters))
+            results = await cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+
     def delete(self, vector_id: str) -> None:
         """
         Delete a vector by ID.
@@ -253,6 +317,11 @@ class PGVector(VectorStoreBase):
         with self._get_cursor(commit=True) as cur:
             cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
 
+    async def adelete(self, vector_id: str) -> None:
+        """Delete a vector by ID on the async pool."""
+        async with self._get_async_cursor(commit=True) as cur:
+            await cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+
     def update(
         self,
         vector_id: str,
@@ -288,6 +357,24 @@ class PGVector(VectorStoreBase):
                         (Json(payload), vector_id),
                     )
 
+    async def aupdate(
+        self,
+        vector_id: str,
+        vector: Optional[list[float]] = None,
+        payload: Optional[dict] = None,
+    ) -> None:
+        """Update a vector and its payload on the async pool."""
+        async with self._get_async_cursor(commit=True) as cur:
+            if vector:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
+                    (vector, vector_id),
+                )
+            if payload:
+                await cur.execute(
+                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
+                    (Json(payload), vector_id),
+                )
 
     def get(self, vector_id: str) -> OutputData:
         """
@@ -309,6 +396,18 @@ class PGVector(VectorStoreBase):
                 return None
             return OutputData(id=str(result[0]), score=None, payload=result[2])
 
+    async def aget(self, vector_id: str) -> OutputData:
+        """Retrieve a vector by ID on the async pool."""
+        async with self._get_async_cursor() as cur:
+            await cur.execute(
+                f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
+                (vector_id,),
+            )
+            result = await cur.fetchone()
+            if not result:
+                return None
+            return OutputData(id=str(result[0]), score=None, payload=result[2])
+
     def list_cols(self) -> List[str]:
         """
         List all collections.
@@ -362,27 +461,31 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+        with self._get_cursor() as cur:
+            cur.execute(*self._list_query(filters, limit))
+            results = cur.fetchall()
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+    async def alist(
+        self,
+        filters: Optional[dict] = None,
+        limit: Optional[int] = 100
+    ) -> List[OutputData]:
+        """List all vectors in a collection on the async pool."""
+        async with self._get_async_cursor() as cur:
+            await cur.execute(*self._list_query(filters, limit))
+            results = await cur.fetchall()
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    def _list_query(self, filters: Optional[dict], limit: Optional[int]) -> tuple:
+        filter_clause, filter_params = self._filter_clause(filters)
         query = f"""
             SELECT id, vector, payload
             FROM {self.collection_name}
             {filter_clause}
             LIMIT %s
         """
-
-        with self._get_cursor() as cur:
-            cur.execute(query, (*filter_params, limit))
-            results = cur.fetchall()
-        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
+        return query, (*filter_params, limit)
 
     def __del__(self) -> None:
         """
@@ -2,7 +2,7 @@ import logging
 import os
 import shutil
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     FieldCondition,
@@ -10,16 +10,17 @@ from qdrant_client.models import (
     MatchValue,
     PointIdsList,
     PointStruct,
+    QueryRequest,
     Range,
     VectorParams,
 )
 
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
 
-class Qdrant(VectorStoreBase):
+class Qdrant(VectorStoreBase, AsyncVectorStoreBase):
     def __init__(
         self,
         collection_name: str,
@@ -46,6 +47,10 @@ class Qdrant(VectorStoreBase):
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
         """
+        # Connection parameters for the async client; None when the store cannot open its own
+        # async connection (a user-provided client, or local mode, which holds a lock on its path)
+        self._async_params = None
+        self._async_client = None
         if client:
             self.client = client
             self.is_local = False
@@ -67,6 +72,7 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                self._async_params = params
 
             self.client = QdrantClient(**params)
 
@@ -75,6 +81,17 @@ class Qdrant(VectorStoreBase):
         self.on_disk = on_disk
         self.create_col(embedding_model_dims, on_disk)
 
+    @property
+    def supports_async(self) -> bool:
+        return self._async_params is not None
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        """Async Qdrant client for the same server, created on first use."""
+        if self._async_client is None:
+            self._async_client = AsyncQdrantClient(**self._async_params)
+        return self._async_client
+
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
         """
         Create a new collection.
@@ -128,7 +145,16 @@ class Qdrant(VectorStoreBase):
             ids (list, optional): List of IDs corresponding to vectors. Defaults to None.
         """
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        points = [
+        self.client.upsert(collection_name=self.collection_name, points=self._points(vectors, payloads, ids))
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """Insert vectors into a collection with the async client."""
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        await self.async_client.upsert(collection_name=self.collection_name, points=self._points(vectors, payloads, ids))
+
+    @staticmethod
+    def _points(vectors: list, payloads: list = None, ids: list = None) -> list:
+        return [
             PointStruct(
                 id=idx if ids is None else ids[idx],
                 vector=vector,
@@ -136,7 +162,6 @@ class Qdrant(VectorStoreBase):
             )
             for idx, vector in enumerate(vectors)
         ]
-        self.client.upsert(collection_name=self.collection_name, points=points)
 
     def _create_filter(self, filters: dict) -> Filter:
         """
@@ -181,6 +206,54 @@ class Qdrant(VectorStoreBase):
         )
         return hits.points
 
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Search for similar vectors with the async client."""
+        query_filter = self._create_filter(filters) if filters else None
+        hits = await self.async_client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            limit=limit,
+        )
+        return hits.points
+
+    def search_batch(self, queries: list, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several queries in a single request.
+
+        Args:
+            queries (list): Queries, one per vector.
+            vectors (list): Query vectors.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: Search results per query, in input order.
+        """
+        if not vectors:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        responses = self.client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True) for vector in vectors
+            ],
+        )
+        return [response.points for response in responses]
+
+    async def asearch_batch(self, queries: list, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Search for similar vectors for several queries in a single request with the async client."""
+        if not vectors:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        responses = await self.async_client.query_batch_points(
+            collection_name=self.collection_name,
+            requests=[
+                QueryRequest(query=vector, filter=query_filter, limit=limit, with_payload=True) for vector in vectors
+            ],
+        )
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -195,6 +268,13 @@ class Qdrant(VectorStoreBase):
             ),
         )
 
+    async def adelete(self, vector_id: int):
+        """Delete a vector by ID with the async client."""
+        await self.async_client.delete(
+            collection_name=self.collection_name,
+            points_selector=PointIdsList(points=[vector_id]),
+        )
+
     def update(self, vector_id: int, vector: list = None, payload: dict = None):
         """
         Update a vector and its payload.
@@ -207,6 +287,11 @@ class Qdrant(VectorStoreBase):
         point = PointStruct(id=vector_id, vector=vector, payload=payload)
         self.client.upsert(collection_name=self.collection_name, points=[point])
 
+    async def aupdate(self, vector_id: int, vector: list = None, payload: dict = None):
+        """Update a vector and its payload with the async client."""
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await self.async_client.upsert(collection_name=self.collection_name, points=[point])
+
     def get(self, vector_id: int) -> dict:
         """
         Retrieve a vector by ID.
@@ -220,6 +305,13 @@ class Qdrant(VectorStoreBase):
         result = self.client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
         return result[0] if result else None
 
+    async def aget(self, vector_id: int) -> dict:
+        """Retrieve a vector by ID with the async client."""
+        result = await self.async_client.retrieve(
+            collection_name=self.collection_name, ids=[vector_id], with_payload=True
+        )
+        return result[0] if result else None
+
     def list_cols(self) -> list:
         """
         List all collections.
@@ -263,6 +355,17 @@ class Qdrant(VectorStoreBase):
         )
         return result
 
+    async def alist(self, filters: dict = None, limit: int = 100) -> list:
+        """List all vectors in a collection with the async client."""
+        query_filter = self._create_filter(filters) if filters else None
+        return await self.async_client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+
     def reset(self):
         """Reset the index by deleting and recreating it."""
         logger.warning(f"Resetting index {self.collection_name}...")
@@ -6,13 +6,14 @@ from functools import reduce
 import numpy as np
 import pytz
 import redis
+import redis.asyncio
 from redis.commands.search.query import Query
-from redisvl.index import SearchIndex
+from redisvl.index import AsyncSearchIndex, SearchIndex
 from redisvl.query import VectorQuery
 from redisvl.query.filter import Tag
 
 from mem0.memory.utils import extract_json
-from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.base import AsyncVectorStoreBase, VectorStoreBase
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ class MemoryResult:
         self.score = score
 
 
-class RedisDB(VectorStoreBase):
+class RedisDB(VectorStoreBase, AsyncVectorStoreBase):
     def __init__(
         self,
         redis_url: str,
@@ -71,10 +72,21 @@ class RedisDB(VectorStoreBase):
 
         self.schema = {"index": index_schema, "fields": fields}
 
+        self.redis_url = redis_url
         self.client = redis.Redis.from_url(redis_url)
         self.index = SearchIndex.from_dict(self.schema)
         self.index.set_client(self.client)
         self.index.create(overwrite=True)
+        self._async_index = None
+
+    @property
+    def async_index(self) -> AsyncSearchIndex:
+        """Async handle on the current index over a `redis.asyncio` connection, created on first use."""
+        if self._async_index is None or self._async_index.schema.index.name != self.schema["index"]["name"]:
+            self._async_index = AsyncSearchIndex.from_dict(
+                self.schema, redis_client=redis.asyncio.Redis.from_url(self.redis_url)
+            )
+        return self._async_index
 
     def create_col(self, name=None, vector_size=None, distance=None):
         """
@@ -119,34 +131,39 @@ class RedisDB(VectorStoreBase):
 
         return index
 
+    @staticmethod
+    def _entry(vector_id, vector, payload) -> dict:
+        entry = {
+            "memory_id": vector_id,
+            "hash": payload["hash"],
+            "memory": payload["data"],
+            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
+            "embedding": np.array(vector, dtype=np.float32).tobytes(),
+        }
+
+        # Conditionally add optional fields
+        for field in ["agent_id", "run_id", "user_id"]:
+            if field in payload:
+                entry[field] = payload[field]
+
+        # Add metadata excluding specific keys
+        entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
+        return entry
+
     def insert(self, vectors: list, payloads: list = None, ids: list = None):
-        data = []
-        for vector, payload, id in zip(vectors, payloads, ids):
-            # Start with required fields
-            entry = {
-                "memory_id": id,
-                "hash": payload["hash"],
-                "memory": payload["data"],
-                "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-                "embedding": np.array(vector, dtype=np.float32).tobytes(),
-            }
-
-            # Conditionally add optional fields
-            for field in ["agent_id", "run_id", "user_id"]:
-                if field in payload:
-                    entry[field] = payload[field]
-
-            # Add metadata excluding specific keys
-            entry["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-
-            data.append(entry)
+        data = [self._entry(id, vector, payload) for vector, payload, id in zip(vectors, payloads, ids)]
         self.index.load(data, id_field="memory_id")
 
-    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        data = [self._entry(id, vector, payload) for vector, payload, id in zip(vectors, payloads, ids)]
+        await self.async_index.load(data, id_field="memory_id")
+
+    @staticmethod
+    def _vector_query(vectors: list, limit: int, filters: dict) -> VectorQuery:
         conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
         filter = reduce(lambda x, y: x & y, conditions)
 
-        v = VectorQuery(
+        return VectorQuery(
             vector=np.array(vectors, dtype=np.float32).tobytes(),
             vector_field_name="embedding",
             return_fields=["memory_id", "hash", "agent_id", "run_id", "user_id", "memory", "metadata", "created_at"],
@@ -154,57 +171,9 @@ class RedisDB(VectorStoreBase):
             num_results=limit,
         )
 
-        results = self.index.query(v)
-
-        return [
-            MemoryResult(
-                id=result["memory_id"],
-                score=result["vector_distance"],
-                payload={
-                    "hash": result["hash"],
-                    "data": result["memory"],
-                    "created_at": datetime.fromtimestamp(
-                        int(result["created_at"]), tz=pytz.timezone("US/Pacific")
-                    ).isoformat(timespec="microseconds"),
-                    **(
-                        {
-                            "updated_at": datetime.fromtimestamp(
-                                int(result["updated_at"]), tz=pytz.timezone("US/Pacific")
-                            ).isoformat(timespec="microseconds")
-                        }
-                        if "updated_at" in result
-                        else {}
-                    ),
-                    **{field: result[field] for field in ["agent_id", "run_id", "user_id"] if field in result},
-                    **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
-                },
-            )
-            for result in results
-        ]
-
-    def delete(self, vector_id):
-        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
-
-    def update(self, vector_id=None, vector=None, payload=None):
-        data = {
-            "memory_id": vector_id,
-            "hash": payload["hash"],
-            "memory": payload["data"],
-            "created_at": int(datetime.fromisoformat(payload["created_at"]).timestamp()),
-            "updated_at": int(datetime.fromisoformat(payload["updated_at"]).timestamp()),
-            "embedding": np.array(vector, dtype=np.float32).tobytes(),
-        }
-
-        for field in ["agent_id", "run_id", "user_id"]:
-            if field in payload:
-                data[field] = payload[field]
-
-        data["metadata"] = json.dumps({k: v for k, v in payload.items() if k not in excluded_keys})
-        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
-
-    def get(self, vector_id):
-        result = self.index.fetch(vector_id)
-        payload = {
+    @staticmethod
+    def _payload(result) -> dict:
+        return {
             "hash": result["hash"],
             "data": result["memory"],
             "created_at": datetime.fromtimestamp(int(result["created_at"]), tz=pytz.timezone("US/Pacific")).isoformat(
@@ -223,7 +192,48 @@ class RedisDB(VectorStoreBase):
             **{k: v for k, v in json.loads(extract_json(result["metadata"])).items()},
         }
 
-        return MemoryResult(id=result["memory_id"], payload=payload)
+    def search(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+        results = self.index.query(self._vector_query(vectors, limit, filters))
+        return [
+            MemoryResult(id=result["memory_id"], score=result["vector_distance"], payload=self._payload(result))
+            for result in results
+        ]
+
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None):
+        results = await self.async_index.query(self._vector_query(vectors, limit, filters))
+        return [
+            MemoryResult(id=result["memory_id"], score=result["vector_distance"], payload=self._payload(result))
+            for result in results
+        ]
+
+    def delete(self, vector_id):
+        self.index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
+
+    async def adelete(self, vector_id):
+        await self.async_index.drop_keys(f"{self.schema['index']['prefix']}:{vector_id}")
+
+    def _updated_entry(self, vector_id, vector, payload) -> dict:
+        data = self._entry(vector_id, vector, payload)
+        data["updated_at"] = int(datetime.fromisoformat(payload["updated_at"]).timestamp())
+        return data
+
+    def update(self, vector_id=None, vector=None, payload=None):
+        data = self._updated_entry(vector_id, vector, payload)
+        self.index.load(data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id")
+
+    async def aupdate(self, vector_id=None, vector=None, payload=None):
+        data = self._updated_entry(vector_id, vector, payload)
+        await self.async_index.load(
+            data=[data], keys=[f"{self.schema['index']['prefix']}:{vector_id}"], id_field="memory_id"
+        )
+
+    def get(self, vector_id):
+        result = self.index.fetch(vector_id)
+        return MemoryResult(id=result["memory_id"], payload=self._payload(result))
+
+    async def aget(self, vector_id):
+        result = await self.async_index.fetch(vector_id)
+        return MemoryResult(id=result["memory_id"], payload=self._payload(result))
 
     def list_cols(self):
         return self.index.listall()
@@ -252,17 +262,17 @@ class RedisDB(VectorStoreBase):
         # Recreate the index with the same parameters
         self.create_col(collection_name, self.embedding_model_dims)
 
-    def list(self, filters: dict = None, limit: int = None) -> list:
-        """
-        List all recent created memories from the vector store.
-        """
+    @staticmethod
+    def _list_query(filters: dict, limit: int = None) -> Query:
         conditions = [Tag(key) == value for key, value in filters.items() if value is not None]
         filter = reduce(lambda x, y: x & y, conditions)
         query = Query(str(filter)).sort_by("created_at", asc=False)
         if limit is not None:
             query = Query(str(filter)).sort_by("created_at", asc=False).paging(0, limit)
+        return query
 
-        results = self.index.search(query)
+    @staticmethod
+    def _list_results(results) -> list:
         return [
             [
                 MemoryResult(
@@ -293,3 +303,15 @@ class RedisDB(VectorStoreBase):
                 for result in results.docs
             ]
         ]
+
+    def list(self, filters: dict = None, limit: int = None) -> list:
+        """
+        List all recent created memories from the vector store.
+        """
+        return self._list_results(self.index.search(self._list_query(filters, limit)))
+
+    async def alist(self, filters: dict = None, limit: int = None) -> list:
+        """
+        List all recent created memories from the vector store asynchronously.
+        """
+        return self._list_results(await self.async_index.search(self._list_query(filters, limit)))
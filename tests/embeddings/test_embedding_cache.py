@@ -0,0 +1,102 @@
+import os
+import tempfile
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.base import AsyncEmbeddingBase
+from mem0.embeddings.cache import CachedEmbedding, EmbeddingCache
+from mem0.embeddings.mock import MockEmbeddings
+from mem0.utils.factory import EmbedderFactory
+
+
+@pytest.fixture
+def inner_embedder():
+    embedder = Mock()
+    embedder.config = BaseEmbedderConfig(model="test-model", embedding_dims=2)
+    embedder.embed.side_effect = lambda text, memory_action=None: [float(len(text)), 1.0]
+    embedder.embed_batch.side_effect = lambda texts, memory_action=None: [[float(len(t)), 1.0] for t in texts]
+    return embedder
+
+
+def test_embed_hits_cache_on_repeat(inner_embedder):
+    embedder = CachedEmbedding(inner_embedder, "openai", EmbeddingCache())
+
+    first = embedder.embed("alice", "add")
+    second = embedder.embed("alice", "add")
+
+    assert first == second == [5.0, 1.0]
+    assert inner_embedder.embed.call_count == 1
+    assert embedder.cache.stats()["hits"] == 1
+    assert embedder.cache.stats()["misses"] == 1
+
+
+def test_memory_action_is_part_of_key(inner_embedder):
+    embedder = CachedEmbedding(inner_embedder, "openai", EmbeddingCache())
+
+    embedder.embed("alice", "add")
+    embedder.embed("alice", "search")
+
+    assert inner_embedder.embed.call_count == 2
+
+
+def test_embed_batch_only_sends_misses(inner_embedder):
+    embedder = CachedEmbedding(inner_embedder, "openai", EmbeddingCache())
+    embedder.embed("alice", "add")
+
+    result = embedder.embed_batch(["alice", "bob", "bob"], "add")
+
+    inner_embedder.embed_batch.assert_called_once_with(["bob"], "add")
+    assert result == [[5.0, 1.0], [3.0, 1.0], [3.0, 1.0]]
+
+
+@pytest.mark.asyncio
+async def test_async_embed_batch_only_awaits_misses(inner_embedder):
+    assert not CachedEmbedding(inner_embedder, "openai", EmbeddingCache()).supports_async
+
+    async_embedder = Mock(spec=AsyncEmbeddingBase)
+    async_embedder.config = inner_embedder.config
+    async_embedder.supports_async = True
+    async_embedder.aembed_batch = AsyncMock(side_effect=lambda texts, memory_action=None: [[float(len(t))] for t in texts])
+    embedder = CachedEmbedding(async_embedder, "openai", EmbeddingCache())
+    assert embedder.supports_async
+
+    await embedder.aembed_batch(["alice", "bob"], "add")
+    result = await embedder.aembed_batch(["bob", "carol"], "add")
+
+    assert result == [[3.0], [5.0]]
+    assert async_embedder.aembed_batch.await_args_list[-1].args == (["carol"], "add")
+
+
+def test_lru_evicts_oldest_entry(inner_embedder):
+    embedder = CachedEmbedding(inner_embedder, "openai", EmbeddingCache(max_size=1))
+
+    embedder.embed("alice")
+    embedder.embed("bob")
+    embedder.embed("alice")
+
+    assert inner_embedder.embed.call_count == 3
+
+
+def test_persistent_tier_survives_new_cache(inner_embedder):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "cache.db")
+        CachedEmbedding(inner_embedder, "openai", EmbeddingCache(persistent=True, path=path)).embed("alice")
+
+        embedder = CachedEmbedding(inner_embedder, "openai", EmbeddingCache(persistent=True, path=path))
+        assert embedder.embed("alice") == [5.0, 1.0]
+
+        assert inner_embedder.embed.call_count == 1
+        assert embedder.cache.stats()["persistent_hits"] == 1
+        embedder.cache.close()
+
+
+def test_factory_wraps_provider_when_enabled(monkeypatch):
+    monkeypatch.setitem(EmbedderFactory.provider_to_class, "mock", "mem0.embeddings.mock.MockEmbeddings")
+
+    embedder = EmbedderFactory.create("mock", {}, None, cache_config={"enabled": True, "max_size": 10})
+    assert isinstance(embedder, CachedEmbedding)
+    assert embedder.cache.max_size == 10
+
+    assert isinstance(EmbedderFactory.create("mock", {}, None), MockEmbeddings)
@@ -41,3 +41,16 @@ def test_ensure_model_exists(mock_ollama_client):
     embedder._ensure_model_exists()
 
     mock_ollama_client.pull.assert_called_once_with("nomic-embed-text")
+
+
+def test_embed_batch(mock_ollama_client):
+    config = BaseEmbedderConfig(model="nomic-embed-text", embedding_dims=512)
+    embedder = OllamaEmbedding(config)
+
+    mock_ollama_client.embed.return_value = {"embeddings": [[0.1, 0.2], [0.3, 0.4]]}
+
+    embeddings = embedder.embed_batch(["first", "second"])
+
+    mock_ollama_client.embed.assert_called_once_with(model="nomic-embed-text", input=["first", "second"])
+    mock_ollama_client.embeddings.assert_not_called()
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
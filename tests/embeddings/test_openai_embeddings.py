@@ -1,4 +1,4 @@
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -88,3 +88,53 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.4, 0.5], index=1), Mock(embedding=[0.1, 0.2], index=0)]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.4, 0.5]]
+
+
+def test_embed_batch_respects_batch_limits(mock_openai_client):
+    config = BaseEmbedderConfig(batch_size=2, batch_max_tokens=10)
+    embedder = OpenAIEmbedding(config)
+
+    def create(input, model, dimensions):
+        return Mock(data=[Mock(embedding=[float(len(text))], index=i) for i, text in enumerate(input)])
+
+    mock_openai_client.embeddings.create.side_effect = create
+
+    texts = ["a", "bb", "ccc", "x" * 40]
+    result = embedder.embed_batch(texts)
+
+    batches = [call.kwargs["input"] for call in mock_openai_client.embeddings.create.call_args_list]
+    assert batches == [["a", "bb"], ["ccc"], ["x" * 40]]
+    assert result == [[1.0], [2.0], [3.0], [40.0]]
+
+
+@pytest.mark.asyncio
+async def test_aembed_batch_uses_async_client(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="test-key"))
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        create = mock_async_openai.return_value.embeddings.create = AsyncMock(
+            return_value=Mock(data=[Mock(embedding=[0.4], index=1), Mock(embedding=[0.1], index=0)])
+        )
+
+        result = await embedder.aembed_batch(["Hello\nworld", "Second text"])
+
+    mock_async_openai.assert_called_once_with(api_key="test-key", base_url="https://api.openai.com/v1")
+    create.assert_awaited_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    mock_openai_client.embeddings.create.assert_not_called()
+    assert result == [[0.1], [0.4]]
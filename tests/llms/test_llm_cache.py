@@ -0,0 +1,126 @@
+import os
+import tempfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.llms.cache import LlmResponseCache
+from mem0.llms.openai import OpenAILLM
+from mem0.utils.factory import LlmFactory
+
+MESSAGES = [
+    {"role": "system", "content": "Extract facts."},
+    {"role": "user", "content": "I live in Berlin."},
+]
+
+
+@pytest.fixture
+def mock_openai_client():
+    with patch("mem0.llms.openai.OpenAI") as mock_openai:
+        mock_client = Mock()
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content='{"facts": ["Lives in Berlin"]}'))]
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai.return_value = mock_client
+        yield mock_client
+
+
+def test_factory_attaches_cache_only_when_enabled(mock_openai_client):
+    llm = LlmFactory.create("openai", {"model": "gpt-4o-mini"})
+    assert llm.response_cache is None
+
+    llm = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, cache_config={"enabled": True, "max_size": 5})
+    assert isinstance(llm.response_cache, LlmResponseCache)
+    assert llm.response_cache.max_size == 5
+
+
+def test_deterministic_calls_are_cached(mock_openai_client):
+    llm = LlmFactory.create("openai", {"model": "gpt-4o-mini", "temperature": 0}, cache_config={"enabled": True})
+
+    first = llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    second = llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+
+    assert first == second == '{"facts": ["Lives in Berlin"]}'
+    assert mock_openai_client.chat.completions.create.call_count == 1
+    stats = llm.response_cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_request_arguments_are_part_of_key(mock_openai_client):
+    llm = LlmFactory.create("openai", {"model": "gpt-4o-mini", "temperature": 0}, cache_config={"enabled": True})
+
+    llm.generate_response(messages=MESSAGES)
+    llm.generate_response(messages=MESSAGES, response_format={"type": "json_object"})
+    llm.generate_response(messages=MESSAGES[:1])
+
+    assert mock_openai_client.chat.completions.create.call_count == 3
+
+
+def test_non_zero_temperature_bypasses_cache(mock_openai_client):
+    llm = LlmFactory.create("openai", {"model": "gpt-4o-mini", "temperature": 0.1}, cache_config={"enabled": True})
+
+    llm.generate_response(messages=MESSAGES)
+    llm.generate_response(messages=MESSAGES)
+
+    assert mock_openai_client.chat.completions.create.call_count == 2
+    assert llm.response_cache.stats()["bypassed"] == 2
+
+
+def test_ttl_expires_entries():
+    cache = LlmResponseCache(ttl=10)
+    with patch("mem0.llms.cache.time.time", return_value=100.0):
+        cache.set("key", "response")
+    with patch("mem0.llms.cache.time.time", return_value=105.0):
+        assert cache.get("key") == (True, "response")
+    with patch("mem0.llms.cache.time.time", return_value=111.0):
+        assert cache.get("key") == (False, None)
+
+
+def test_memory_backend_evicts_least_recently_used():
+    cache = LlmResponseCache(max_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "1")
+
+
+def test_disk_backend_survives_new_instance():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "llm_cache.db")
+        cache = LlmResponseCache(backend="disk", path=path)
+        cache.set("key", {"tool_calls": [{"name": "noop", "arguments": {}}]})
+        cache.close()
+
+        cache = LlmResponseCache(backend="disk", path=path)
+        assert cache.get("key") == (True, {"tool_calls": [{"name": "noop", "arguments": {}}]})
+        assert cache.stats()["size"] == 1
+        cache.close()
+
+
+def test_disk_backend_evicts_least_recently_used():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = LlmResponseCache(backend="disk", max_size=2, path=os.path.join(temp_dir, "llm_cache.db"))
+        with patch("mem0.llms.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", "1")
+            cache.set("b", "2")
+            cache.get("a")
+            cache.set("c", "3")
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, "1")
+        assert cache.stats()["size"] == 2
+        cache.close()
+
+
+def test_llm_without_cache_is_unchanged(mock_openai_client):
+    llm = OpenAILLM({"model": "gpt-4o-mini", "temperature": 0})
+
+    llm.generate_response(messages=MESSAGES)
+    llm.generate_response(messages=MESSAGES)
+
+    assert mock_openai_client.chat.completions.create.call_count == 2
@@ -0,0 +1,259 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mem0.llms.base import LLMBase
+from mem0.llms.cache import LlmResponseCache
+from mem0.llms.limiter import ConcurrencyLimiter, RateLimiter, get_concurrency_limiter, rate_limiter_stats
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+MESSAGES = [{"role": "user", "content": "I live in Berlin."}]
+
+
+class SlowLLM(LLMBase):
+    """Sync-only provider that records how many calls overlap."""
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto"):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        threading.Event().wait(0.02)
+        with self.lock:
+            self.active -= 1
+        return messages[-1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_provider_limit():
+    llm = SlowLLM()
+    llm.concurrency_limiter = ConcurrencyLimiter(2)
+
+    results = await asyncio.gather(
+        *(llm.agenerate_response([{"role": "user", "content": str(i)}]) for i in range(6))
+    )
+
+    assert results == [str(i) for i in range(6)]
+    assert llm.peak == 2
+    stats = llm.concurrency_limiter.stats()
+    assert stats["in_flight"] == 0
+    assert stats["waited"] == 4
+
+
+@pytest.mark.asyncio
+async def test_threads_and_tasks_draw_from_the_same_slots():
+    limiter = ConcurrencyLimiter(1)
+    limiter.acquire()
+
+    task = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0.01)
+    assert not task.done()
+    assert limiter.stats()["waiting"] == 1
+
+    limiter.release()
+    await asyncio.wait_for(task, 1)
+    assert limiter.stats()["in_flight"] == 1
+    limiter.release()
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = ConcurrencyLimiter(1)
+    await limiter.acquire_async()
+
+    task = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    limiter.release()
+    assert limiter.stats() == {"max_concurrency": 1, "in_flight": 0, "waiting": 0, "waited": 1}
+
+
+@pytest.mark.asyncio
+async def test_default_agenerate_response_uses_the_response_cache_once():
+    llm = SlowLLM()
+    llm.config.temperature = 0
+    llm.response_cache = LlmResponseCache()
+    llm.concurrency_limiter = ConcurrencyLimiter(1)
+
+    await llm.agenerate_response(MESSAGES)
+    await llm.agenerate_response(MESSAGES)
+
+    assert llm.calls == 1
+    assert llm.response_cache.stats()["misses"] == 1
+    assert llm.response_cache.stats()["hits"] == 1
+
+
+def test_factory_shares_one_limiter_per_provider():
+    with patch("mem0.llms.openai.OpenAI"):
+        unlimited = LlmFactory.create("openai", {"model": "gpt-4o-mini"})
+        first = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, max_concurrency=3)
+        second = LlmFactory.create("openai", {"model": "gpt-4o"}, max_concurrency=3)
+
+    assert unlimited.concurrency_limiter is None
+    assert first.concurrency_limiter is second.concurrency_limiter
+    assert first.concurrency_limiter is get_concurrency_limiter("openai", 3)
+    assert first.concurrency_limiter.max_concurrency == 3
+
+
+@pytest.mark.asyncio
+async def test_native_agenerate_response_is_cached_and_limited():
+    with patch("mem0.llms.openai.OpenAI") as mock_openai, patch("mem0.llms.openai.AsyncOpenAI") as mock_async_openai:
+        create = mock_async_openai.return_value.chat.completions.create = AsyncMock(
+            return_value=Mock(choices=[Mock(message=Mock(content="Berlin"))])
+        )
+        llm = LlmFactory.create("openai", {"model": "gpt-4o-mini", "temperature": 0}, cache_config={"enabled": True})
+        llm.concurrency_limiter = ConcurrencyLimiter(1)
+
+        first = await llm.agenerate_response(messages=MESSAGES)
+        second = await llm.agenerate_response(messages=MESSAGES)
+
+    assert first == second == "Berlin"
+    create.assert_awaited_once()
+    mock_openai.return_value.chat.completions.create.assert_not_called()
+    assert llm.concurrency_limiter.stats()["in_flight"] == 0
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"status {status_code}")
+        self.status_code = status_code
+        self.response = Mock(status_code=status_code, headers=headers or {})
+
+
+def test_rate_limited_calls_are_retried_after_the_requested_delay():
+    limiter = RateLimiter(max_retries=2, initial_backoff=0.001)
+    call = Mock(side_effect=[ProviderError(429, {"retry-after-ms": "20"}), ProviderError(503), "ok"])
+
+    with patch("mem0.llms.limiter.time.sleep") as sleep:
+        assert limiter.run(call) == "ok"
+
+    assert call.call_count == 3
+    assert 0.02 <= sleep.call_args_list[0].args[0] <= 0.021
+    stats = limiter.stats()
+    assert stats["throttled"] == 1
+    assert stats["retries"] == 2
+    assert stats["failures"] == 0
+
+
+def test_non_retryable_and_exhausted_errors_are_raised():
+    limiter = RateLimiter(max_retries=1, initial_backoff=0.001)
+
+    with pytest.raises(ProviderError):
+        limiter.run(Mock(side_effect=ProviderError(400)))
+    with patch("mem0.llms.limiter.time.sleep"), pytest.raises(ProviderError):
+        limiter.run(Mock(side_effect=ProviderError(500)))
+
+    stats = limiter.stats()
+    assert stats["retries"] == 1
+    assert stats["failures"] == 1
+
+
+def test_request_and_token_budgets_pace_callers():
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=6000)
+
+    with patch("mem0.llms.limiter.time.sleep") as sleep:
+        limiter.run(lambda: None, tokens=50)
+        limiter.run(lambda: None, tokens=250)
+
+    # The second request waits ~1s for the request budget and ~2s for its tokens
+    assert sleep.call_count == 1
+    assert sleep.call_args.args[0] == pytest.approx(2.0, abs=0.05)
+    assert limiter.stats()["waited"] == 1
+
+
+def test_throttling_lowers_the_rates_and_successes_restore_them():
+    limiter = RateLimiter(requests_per_minute=6000, max_retries=1, initial_backoff=0.001)
+
+    with patch("mem0.llms.limiter.time.sleep"):
+        limiter.run(Mock(side_effect=[ProviderError(429), "ok"]))
+    assert limiter.stats()["requests_per_minute"] == pytest.approx(6000 * 0.55)
+
+    for _ in range(20):
+        limiter.run(lambda: None)
+    assert limiter.stats()["requests_per_minute"] == 6000
+
+
+@pytest.mark.asyncio
+async def test_async_calls_are_retried_without_blocking_the_loop():
+    limiter = RateLimiter(max_retries=1, initial_backoff=0.001)
+    call = AsyncMock(side_effect=[ProviderError(429), "ok"])
+
+    assert await limiter.arun(call) == "ok"
+    assert call.await_count == 2
+    assert limiter.stats()["throttled"] == 1
+
+
+def test_factories_share_one_rate_limiter_per_provider_and_model():
+    rate_limit = {"requests_per_minute": 100, "max_retries": 1, "initial_backoff": 0.001}
+    with patch("mem0.llms.openai.OpenAI") as mock_openai, patch("mem0.embeddings.openai.OpenAI") as mock_embed_client:
+        # The limiter retries, so the SDK clients are copied without their own retries
+        mock_openai.return_value.with_options.return_value = mock_openai.return_value
+        mock_embed_client.return_value.with_options.return_value = mock_embed_client.return_value
+        mock_openai.return_value.chat.completions.create.side_effect = [
+            ProviderError(429),
+            Mock(choices=[Mock(message=Mock(content="Berlin"))]),
+        ]
+        mock_embed_client.return_value.embeddings.create.side_effect = [
+            ProviderError(503),
+            Mock(data=[Mock(embedding=[0.1], index=0), Mock(embedding=[0.2], index=1)]),
+        ]
+        llm = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, rate_limit_config=rate_limit)
+        other = LlmFactory.create("openai", {"model": "gpt-4o-mini"}, rate_limit_config=rate_limit)
+        embedder = EmbedderFactory.create(
+            "openai", {"model": "text-embedding-3-small"}, None, cache_config={"enabled": True}, rate_limit_config=rate_limit
+        )
+
+        with patch("mem0.llms.limiter.time.sleep"):
+            assert llm.generate_response(MESSAGES) == "Berlin"
+            assert embedder.embed_batch(["a", "b"]) == [[0.1], [0.2]]
+
+    mock_openai.return_value.with_options.assert_called_with(max_retries=0)
+    mock_embed_client.return_value.with_options.assert_called_with(max_retries=0)
+    assert llm._client_kwargs["max_retries"] == 0
+    assert llm.rate_limiter is other.rate_limiter
+    assert llm.rate_limiter.stats()["retries"] == 1
+    assert embedder.embedder.rate_limiter.stats()["retries"] == 1
+    assert embedder.rate_limiter is None
+    assert set(rate_limiter_stats()) >= {"openai/gpt-4o-mini", "openai/text-embedding-3-small"}
+
+
+def test_concurrency_slot_is_taken_per_attempt():
+    class ThrottledLLM(LLMBase):
+        def __init__(self):
+            super().__init__()
+            self.responses = [ProviderError(429), "ok"]
+            self.in_flight = []
+
+        def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto"):
+            self.in_flight.append(self.concurrency_limiter.stats()["in_flight"])
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    llm = ThrottledLLM()
+    llm.concurrency_limiter = ConcurrencyLimiter(1)
+    llm.rate_limiter = RateLimiter(max_retries=1, initial_backoff=0.001)
+    backing_off = []
+
+    with patch(
+        "mem0.llms.limiter.time.sleep",
+        side_effect=lambda delay: backing_off.append(llm.concurrency_limiter.stats()["in_flight"]),
+    ):
+        assert llm.generate_response(MESSAGES) == "ok"
+
+    assert llm.in_flight == [1, 1]
+    assert backing_off == [0]
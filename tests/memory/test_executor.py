@@ -0,0 +1,40 @@
+import threading
+
+from mem0.memory.executor import SharedExecutor
+
+
+def test_map_returns_results_in_order_on_named_threads():
+    executor = SharedExecutor(max_workers=4, thread_name_prefix="mem0-test")
+    try:
+        names = executor.map(lambda i: (i, threading.current_thread().name), range(8))
+    finally:
+        executor.shutdown()
+
+    assert [i for i, _ in names] == list(range(8))
+    assert any(name.startswith("mem0-test") for _, name in names)
+
+
+def test_nested_fan_out_does_not_deadlock_a_full_pool():
+    executor = SharedExecutor(max_workers=1)
+
+    def outer(i):
+        return sum(executor.map(lambda j: i * j, range(3)))
+
+    try:
+        future = executor.submit(executor.map, outer, range(4))
+        assert future.result(timeout=5) == [0, 3, 6, 9]
+    finally:
+        executor.shutdown()
+
+
+def test_result_runs_unstarted_work_inline():
+    executor = SharedExecutor(max_workers=1)
+    release = threading.Event()
+    try:
+        executor.submit(release.wait)
+        pending = executor.submit(threading.current_thread)
+        assert executor.result(pending, threading.current_thread) is threading.current_thread()
+        assert pending.cancelled()
+    finally:
+        release.set()
+        executor.shutdown()
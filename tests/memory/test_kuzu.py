@@ -43,6 +43,7 @@ class TestKuzu:
             return self.embeddings[text]
 
         mock_model.embed.side_effect = mock_embed
+        mock_model.embed_batch.side_effect = lambda texts: [self.embeddings[text] for text in texts]
         return mock_model
 
     @pytest.fixture
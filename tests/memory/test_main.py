@@ -1,9 +1,18 @@
+import hashlib
+import json
 import logging
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import MagicMock, call
 
 import pytest
 
+from mem0.configs.base import AddWindowConfig, MemoryConfig
+from mem0.embeddings.base import AsyncEmbeddingBase, EmbeddingBase
+from mem0.llms.base import LLMBase
 from mem0.memory.main import AsyncMemory, Memory
+from mem0.memory.storage import SQLiteManager
+from mem0.vector_stores.base import AsyncVectorStoreBase
 
 
 def _setup_mocks(mocker):
@@ -26,6 +35,9 @@ def _setup_mocks(mocker):
     return mock_llm, mock_vector_store
 
 
+RELATED_MEMORY = MagicMock(id="old-id", payload={"data": "related fact", "hash": "other"}, score=0.9)
+
+
 class TestAddToVectorStoreErrors:
     @pytest.fixture
     def mock_memory(self, mocker):
@@ -36,6 +48,7 @@ class TestAddToVectorStoreErrors:
         memory.config = mocker.MagicMock()
         memory.config.custom_fact_extraction_prompt = None
         memory.config.custom_update_memory_prompt = None
+        memory.config.update_similarity_threshold = None
         memory.api_version = "v1.1"
 
         return memory
@@ -64,6 +77,7 @@ class TestAddToVectorStoreErrors:
         # Setup
         # First call returns valid JSON, second call returns empty string
         mock_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        mock_memory.vector_store.search_batch.return_value = [[RELATED_MEMORY]]
 
         # Execute
         with caplog.at_level(logging.WARNING):
@@ -88,6 +102,7 @@ class TestAsyncAddToVectorStoreErrors:
         memory.config = mocker.MagicMock()
         memory.config.custom_fact_extraction_prompt = None
         memory.config.custom_update_memory_prompt = None
+        memory.config.update_similarity_threshold = None
         memory.api_version = "v1.1"
 
         return memory
@@ -114,6 +129,7 @@ class TestAsyncAddToVectorStoreErrors:
         """Test empty response in AsyncMemory._add_to_vector_store"""
         mocker.patch("mem0.utils.factory.EmbedderFactory.create", return_value=MagicMock())
         mock_async_memory.llm.generate_response.side_effect = ['{"facts": ["test fact"]}', ""]
+        mock_async_memory.vector_store.search.return_value = [RELATED_MEMORY]
         mock_capture_event = mocker.MagicMock()
         mocker.patch("mem0.memory.main.capture_event", mock_capture_event)
 
@@ -125,3 +141,876 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Empty response from LLM, no memories to extract" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestAddToVectorStoreBatching:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.config = mocker.MagicMock()
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.config.update_similarity_threshold = None
+        memory.api_version = "v1.1"
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+
+        return memory
+
+    def test_facts_embedded_and_searched_in_one_batch(self, mock_memory):
+        mock_memory.llm.generate_response.side_effect = ['{"facts": ["fact one", "fact two"]}', '{"memory": []}']
+        mock_memory.embedding_model.embed_batch.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        mock_memory.vector_store.search_batch.return_value = [[], []]
+
+        mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        mock_memory.embedding_model.embed_batch.assert_called_once_with(["fact one", "fact two"], "add")
+        mock_memory.embedding_model.embed.assert_not_called()
+        mock_memory.vector_store.search_batch.assert_called_once_with(
+            queries=["fact one", "fact two"], vectors=[[0.1, 0.2], [0.3, 0.4]], limit=5, filters={"user_id": "u"}
+        )
+        mock_memory.vector_store.search.assert_not_called()
+
+
+class TestUpdateShortCircuit:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        memory.db.find_memory_hashes.return_value = []
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+        return memory
+
+    @staticmethod
+    def _related(data, score, hash="other"):
+        return MagicMock(id=f"id-{data}", payload={"data": data, "hash": hash}, score=score)
+
+    def test_facts_without_related_memories_are_added_without_update_call(self, mock_memory):
+        mock_memory.llm.generate_response.return_value = '{"facts": ["fact one", "fact two"]}'
+        mock_memory.vector_store.search_batch.return_value = [[], []]
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        assert mock_memory.llm.generate_response.call_count == 1
+        assert [(r["memory"], r["event"]) for r in result] == [("fact one", "ADD"), ("fact two", "ADD")]
+        assert mock_memory.vector_store.insert.call_args.kwargs["vectors"] == [[0.1], [0.2]]
+
+    def test_only_ambiguous_facts_reach_the_update_call(self, mock_memory):
+        mock_memory.config = mock_memory.config.model_copy(update={"update_similarity_threshold": 0.5})
+        mock_memory.llm.generate_response.side_effect = [
+            '{"facts": ["fact one", "fact two", "fact three"]}',
+            '{"memory": [{"id": "0", "text": "fact three, updated", "event": "UPDATE"}]}',
+        ]
+        mock_memory.embedding_model.embed_batch.side_effect = [[[0.1], [0.2], [0.3]], [[0.4]]]
+        stored_hash = hashlib.md5(b"fact one").hexdigest()
+        mock_memory.vector_store.search_batch.return_value = [
+            [self._related("fact one", 0.99, hash=stored_hash)],
+            [self._related("unrelated", 0.2)],
+            [self._related("close", 0.8), self._related("unrelated", 0.2)],
+        ]
+        mock_memory.vector_store.bulk_get.return_value = [self._related("close", None)]
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        assert mock_memory.llm.generate_response.call_count == 2
+        update_prompt = mock_memory.llm.generate_response.call_args.kwargs["messages"][0]["content"]
+        assert "fact three" in update_prompt
+        assert "fact one" not in update_prompt and "fact two" not in update_prompt
+        assert [(r["memory"], r["event"]) for r in result] == [("fact two", "ADD"), ("fact three, updated", "UPDATE")]
+        mock_memory.vector_store.bulk_get.assert_called_once_with(["id-close"])
+
+    def test_custom_update_prompt_reconciles_every_fact(self, mock_memory):
+        mock_memory.config = mock_memory.config.model_copy(
+            update={"custom_update_memory_prompt": "Only keep facts about food."}
+        )
+        mock_memory.llm.generate_response.side_effect = ['{"facts": ["fact one"]}', '{"memory": []}']
+        mock_memory.vector_store.search_batch.return_value = [[]]
+
+        result = mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        assert mock_memory.llm.generate_response.call_count == 2
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_async_facts_without_related_memories_are_added_without_update_call(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.db = mocker.MagicMock()
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.llm.generate_response.return_value = '{"facts": ["fact one"]}'
+
+        result = await memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, effective_filters={"user_id": "u"}, infer=True
+        )
+
+        assert memory.llm.generate_response.call_count == 1
+        assert [(r["memory"], r["event"]) for r in result] == [("fact one", "ADD")]
+
+
+class TestDuplicateFacts:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.embedding_model.embed_batch.return_value = [[0.1]]
+        memory.vector_store.search_batch.return_value = [[]]
+        return memory
+
+    def _add(self, memory, facts, user_id="u"):
+        memory.llm.generate_response.side_effect = [json.dumps({"facts": facts})]
+        return memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}],
+            metadata={"user_id": user_id},
+            filters={"user_id": user_id},
+            infer=True,
+        )
+
+    def _stored(self, memory):
+        (payload,) = memory.vector_store.insert.call_args.kwargs["payloads"]
+        (memory_id,) = memory.vector_store.insert.call_args.kwargs["ids"]
+        return MagicMock(id=memory_id, payload=payload)
+
+    def test_repeated_fact_is_answered_from_the_hash_index(self, mock_memory):
+        (added,) = self._add(mock_memory, ["Likes tea"])
+        mock_memory.vector_store.bulk_get.return_value = [self._stored(mock_memory)]
+        mock_memory.embedding_model.embed_batch.reset_mock()
+        mock_memory.vector_store.search_batch.reset_mock()
+
+        assert self._add(mock_memory, ["Likes tea"]) == []
+
+        mock_memory.vector_store.bulk_get.assert_called_once_with([added["id"]])
+        mock_memory.embedding_model.embed_batch.assert_not_called()
+        mock_memory.vector_store.search_batch.assert_not_called()
+        stats = mock_memory.add_stats()
+        assert stats.pop("add_seconds") > 0
+        assert stats == {
+            "inferred_adds": 2,
+            "llm_calls": 2,
+            "duplicate_facts": 1,
+            "embeddings_avoided": 1,
+            "update_calls_avoided": 2,
+        }
+
+    def test_hash_index_is_scoped_and_pruned(self, mock_memory):
+        (added,) = self._add(mock_memory, ["Likes tea"])
+        digest = hashlib.md5(b"Likes tea").hexdigest()
+        assert mock_memory.db.find_memory_hashes([digest], {"user_id": "other"}) == []
+
+        # The memory was deleted outside of this instance: the fact goes through the normal path
+        mock_memory.vector_store.bulk_get.return_value = [None]
+        (readded,) = self._add(mock_memory, ["Likes tea"])
+
+        assert readded["event"] == "ADD"
+        assert mock_memory.db.find_memory_hashes([digest], {"user_id": "u"}) == [
+            {"memory_id": readded["id"], "hash": digest}
+        ]
+        assert mock_memory.add_stats()["duplicate_facts"] == 0
+
+
+    def test_search_hits_are_only_indexed_when_missing(self, mock_memory, mocker):
+        digest = hashlib.md5(b"Likes coffee").hexdigest()
+        hit = MagicMock(id="old", score=0.1, payload={"data": "Likes coffee", "hash": digest, "user_id": "u"})
+        set_hashes = mocker.spy(mock_memory.db, "set_memory_hashes")
+
+        mock_memory._record_hashes([[hit]])
+        assert mock_memory.db.get_memory_hashes(["old"]) == {"old": digest}
+        set_hashes.reset_mock()
+
+        mock_memory._record_hashes([[hit]])
+        # Already indexed: nothing to write, so no history database transaction is opened
+        set_hashes.assert_called_once_with([])
+
+class TestSinglePassPipeline:
+    MESSAGES = [
+        {"role": "system", "content": "ignored"},
+        {"role": "user", "content": "I moved to Paris"},
+        {"role": "assistant", "content": "Nice!"},
+    ]
+    ACTIONS = {
+        "memory": [
+            {"id": "0", "text": "Lives in Paris", "event": "UPDATE", "old_memory": "related fact"},
+            {"id": "1", "text": "Moved recently", "event": "ADD"},
+        ]
+    }
+
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.config = memory.config.model_copy(update={"add_pipeline": "single_pass"})
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+        memory.vector_store.search_batch.return_value = [[RELATED_MEMORY], [RELATED_MEMORY]]
+        memory.vector_store.bulk_get.return_value = [RELATED_MEMORY]
+        memory.llm.generate_response.return_value = json.dumps(self.ACTIONS)
+        return memory
+
+    def test_extracts_and_reconciles_in_one_llm_call(self, mock_memory):
+        result = mock_memory._add_to_vector_store(
+            messages=self.MESSAGES, metadata={"user_id": "u"}, filters={"user_id": "u"}, infer=True
+        )
+
+        mock_memory.llm.generate_response.assert_called_once()
+        mock_memory.embedding_model.embed_batch.assert_any_call(["I moved to Paris", "Nice!"], "search")
+        mock_memory.vector_store.search_batch.assert_called_once()
+        prompt = mock_memory.llm.generate_response.call_args.kwargs["messages"][1]["content"]
+        assert prompt.count("related fact") == 1
+        assert "old-id" not in prompt
+        assert [(memory["event"], memory["memory"]) for memory in result] == [
+            ("UPDATE", "Lives in Paris"),
+            ("ADD", "Moved recently"),
+        ]
+        assert result[0]["id"] == "old-id"
+        assert mock_memory.add_stats()["llm_calls"] == 1
+        assert mock_memory.add_stats()["inferred_adds"] == 1
+
+    def test_invalid_response_adds_nothing(self, mock_memory, caplog):
+        mock_memory.llm.generate_response.return_value = "not json"
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._add_to_vector_store(
+                messages=self.MESSAGES, metadata={}, filters={"user_id": "u"}, infer=True
+            )
+
+        assert result == []
+        assert "Invalid JSON response" in caplog.text
+        mock_memory.vector_store.insert.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_extracts_and_reconciles_in_one_llm_call(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.config = memory.config.model_copy(update={"add_pipeline": "single_pass"})
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.db = SQLiteManager(":memory:")
+        memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+        memory.vector_store.search_batch.return_value = [[RELATED_MEMORY], [RELATED_MEMORY]]
+        memory.vector_store.get.return_value = RELATED_MEMORY
+        memory.llm.generate_response.return_value = json.dumps(self.ACTIONS)
+
+        result = await memory._add_to_vector_store(
+            messages=self.MESSAGES, metadata={"user_id": "u"}, effective_filters={"user_id": "u"}, infer=True
+        )
+
+        memory.llm.generate_response.assert_called_once()
+        memory.vector_store.search_batch.assert_called_once()
+        assert sorted(memory["event"] for memory in result) == ["ADD", "UPDATE"]
+        assert memory.add_stats()["llm_calls"] == 1
+
+
+class TestAddStream:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.db = SQLiteManager(":memory:")
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.llm.generate_response.return_value = json.dumps({"facts": ["Likes tea"]})
+        memory.embedding_model.embed_batch.return_value = [[0.1]]
+        memory.vector_store.search_batch.return_value = [[]]
+        return memory
+
+    def test_yields_stage_events_then_result(self, mock_memory):
+        events = list(mock_memory.add_stream("I like tea", user_id="u"))
+
+        assert [event["event"] for event in events] == [
+            "facts_extracted",
+            "candidates_retrieved",
+            "memory_applied",
+            "done",
+        ]
+        assert events[0]["facts"] == ["Likes tea"]
+        assert events[2]["memory"]["memory"] == "Likes tea"
+        assert events[-1]["result"] == {"results": [events[2]["memory"]]}
+
+    def test_closing_the_stream_skips_remaining_stages(self, mock_memory):
+        searched = threading.Event()
+
+        def search_batch(**kwargs):
+            searched.wait(5)
+            return [[]]
+
+        mock_memory.vector_store.search_batch.side_effect = search_batch
+        stream = mock_memory.add_stream("I like tea", user_id="u")
+        assert next(stream)["event"] == "facts_extracted"
+        stream.close()
+        searched.set()
+        for thread in threading.enumerate():
+            if thread.name == "mem0-add-stream":
+                thread.join(5)
+
+        mock_memory.vector_store.insert.assert_not_called()
+
+    def test_errors_are_raised(self, mock_memory):
+        with pytest.raises(ValueError):
+            list(mock_memory.add_stream("I like tea"))
+
+    @pytest.mark.asyncio
+    async def test_async_yields_stage_events_then_result(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.db = SQLiteManager(":memory:")
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        memory.llm.generate_response.return_value = json.dumps({"facts": ["Likes tea"]})
+        memory.embedding_model.embed.return_value = [0.1]
+        memory.vector_store.search.return_value = []
+
+        events = [event async for event in memory.add_stream("I like tea", user_id="u")]
+
+        assert [event["event"] for event in events] == [
+            "facts_extracted",
+            "candidates_retrieved",
+            "memory_applied",
+            "done",
+        ]
+        assert events[-1]["result"] == {"results": [events[2]["memory"]]}
+
+
+class TestAddWindow:
+    @pytest.fixture
+    def make_memory(self, mocker):
+        def make(memory_class=Memory, **window):
+            _setup_mocks(mocker)
+            memory = memory_class(config=MemoryConfig(add_window=AddWindowConfig(**window)))
+            memory.db = SQLiteManager(":memory:")
+            mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+            memory.llm.generate_response.return_value = json.dumps({"facts": ["Likes tea"]})
+            memory.embedding_model.embed.return_value = [0.1]
+            memory.embedding_model.embed_batch.return_value = [[0.1]]
+            memory.vector_store.search.return_value = []
+            memory.vector_store.search_batch.return_value = [[]]
+            return memory
+
+        return make
+
+    def test_session_messages_are_extracted_once_when_the_window_fills(self, make_memory):
+        memory = make_memory(max_messages=3, max_seconds=60)
+
+        assert memory.add("I like tea", user_id="u") == {"results": []}
+        memory.llm.generate_response.assert_not_called()
+        pending = memory.search("tea", user_id="u")["results"]
+        assert [(item["memory"], item["pending"], item["user_id"]) for item in pending] == [("I like tea", True, "u")]
+        assert memory.search("tea", user_id="other")["results"] == []
+
+        result = memory.add(
+            [{"role": "assistant", "content": "Noted"}, {"role": "user", "content": "Green tea"}], user_id="u"
+        )
+
+        memory.llm.generate_response.assert_called_once()
+        prompt = memory.llm.generate_response.call_args.kwargs["messages"][1]["content"]
+        assert "I like tea" in prompt and "Green tea" in prompt
+        assert [item["memory"] for item in result["results"]] == ["Likes tea"]
+        assert memory.search("tea", user_id="u")["results"] == []
+
+    def test_windows_are_extracted_after_max_seconds_by_one_timer_thread(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=0.2)
+        threads = set(threading.enumerate())
+        for user_id in ("u1", "u2", "u3"):
+            memory.add("I like tea", user_id=user_id)
+        assert [thread.name for thread in set(threading.enumerate()) - threads] == ["mem0-add-window-timer"]
+
+        deadline = time.monotonic() + 5
+        while memory.vector_store.insert.call_count < 3 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert memory.llm.generate_response.call_count == 3
+        assert memory.vector_store.insert.call_count == 3
+        assert memory.flush_adds() == []
+
+    def test_flush_and_metadata_change_extract_buffered_windows(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.add("I like tea", user_id="u", metadata={"source": "chat"})
+        memory.add("I like coffee", user_id="u", metadata={"source": "email"})
+        assert memory.llm.generate_response.call_count == 1
+
+        (result,) = memory.flush_adds()
+
+        assert [item["memory"] for item in result["results"]] == ["Likes tea"]
+        assert memory.llm.generate_response.call_count == 2
+        assert memory.flush_adds() == []
+
+    def test_metadata_change_raises_extraction_errors_and_keeps_the_new_messages(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.add("I like tea", user_id="u", metadata={"source": "chat"})
+        memory.llm.generate_response.side_effect = RuntimeError("LLM down")
+
+        with pytest.raises(RuntimeError, match="LLM down"):
+            memory.add("I like coffee", user_id="u", metadata={"source": "email"})
+
+        assert [item["memory"] for item in memory.search("coffee", user_id="u")["results"]] == ["I like coffee"]
+        memory.llm.generate_response.side_effect = None
+        (result,) = memory.flush_adds()
+        assert [item["memory"] for item in result["results"]] == ["Likes tea"]
+
+    def test_search_overlay_is_kept_when_stored_hits_fill_the_limit(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.vector_store.search.return_value = [
+            MagicMock(id=f"m{i}", score=0.9, payload={"data": "Likes coffee", "user_id": "u"}) for i in range(2)
+        ]
+        memory.add("I like tea", user_id="u")
+
+        results = memory.search("tea", user_id="u", limit=2)["results"]
+
+        assert [(item["id"], item["memory"]) for item in results][0] == ("m0", "Likes coffee")
+        assert results[1]["memory"] == "I like tea" and results[1]["pending"] is True
+        memory.flush_adds()
+
+    def test_search_overlay_applies_filters_threshold_and_limit(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.vector_store.search.return_value = [
+            MagicMock(id="m1", score=0.9, payload={"data": "Likes coffee", "user_id": "u"})
+        ]
+        memory.add(
+            [{"role": "user", "content": "I like tea"}, {"role": "user", "content": "Green"}],
+            user_id="u",
+            metadata={"source": "chat"},
+        )
+
+        pending = memory.search("tea", user_id="u", filters={"source": "chat"})["results"]
+        assert [item["memory"] for item in pending] == ["Likes coffee", "I like tea", "Green"]
+        assert all(item["id"] for item in pending) and len({item["id"] for item in pending}) == 3
+        assert len(memory.search("tea", user_id="u", limit=2)["results"]) == 2
+        assert [item["id"] for item in memory.search("tea", user_id="u", filters={"source": "email"})["results"]] == [
+            "m1"
+        ]
+        assert len(memory.search("tea", user_id="u", filters={"source": {"ne": "email"}})["results"]) == 1
+        assert len(memory.search("tea", user_id="u", threshold=0.5)["results"]) == 1
+        memory.flush_adds()
+
+    def test_buffered_add_result_includes_relations_with_graph(self, make_memory):
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.enable_graph = True
+        memory.graph = MagicMock()
+
+        assert memory.add("I like tea", user_id="u") == {"results": [], "relations": []}
+        memory.flush_adds()
+
+    def test_buffered_windows_are_flushed_at_exit(self, make_memory, mocker):
+        register = mocker.patch("mem0.memory.main.atexit.register")
+        memory = make_memory(max_messages=10, max_seconds=60)
+        memory.add("I like tea", user_id="u")
+
+        flush_at_exit, memory_ref = register.call_args.args
+        assert memory_ref() is memory
+        flush_at_exit(memory_ref)
+
+        memory.llm.generate_response.assert_called_once()
+        memory.vector_store.insert.assert_called_once()
+        assert len(memory._add_windows) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_window_is_flushed(self, make_memory):
+        memory = make_memory(AsyncMemory, max_messages=10, max_seconds=60)
+
+        assert await memory.add("I like tea", user_id="u") == {"results": []}
+        assert (await memory.search("tea", user_id="u"))["results"][0]["pending"] is True
+        assert (await memory.search("tea", user_id="u", threshold=0.5))["results"] == []
+        (result,) = await memory.flush_adds()
+
+        memory.llm.generate_response.assert_called_once()
+        assert [item["memory"] for item in result["results"]] == ["Likes tea"]
+
+
+class TestRawMessageIngestion:
+    MESSAGES = [
+        {"role": "system", "content": "ignored"},
+        {"role": "user", "content": "first", "name": "alice"},
+        {"role": "assistant", "content": "second"},
+        {"role": "user"},
+    ]
+
+    def test_messages_are_written_in_one_batch(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        mock_capture_event = mocker.patch("mem0.memory.main.capture_event")
+        memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+
+        result = memory._add_to_vector_store(self.MESSAGES, {"user_id": "u"}, {"user_id": "u"}, infer=False)
+
+        assert [(r["memory"], r["role"], r["actor_id"]) for r in result] == [
+            ("first", "user", "alice"),
+            ("second", "assistant", None),
+        ]
+        memory.embedding_model.embed_batch.assert_called_once_with(["first", "second"], "add")
+        memory.embedding_model.embed.assert_not_called()
+        insert = memory.vector_store.insert.call_args.kwargs
+        assert insert["ids"] == [r["id"] for r in result]
+        assert insert["vectors"] == [[0.1], [0.2]]
+        assert [p["actor_id"] for p in insert["payloads"] if "actor_id" in p] == ["alice"]
+        (history,) = memory.db.add_history_batch.call_args.args
+        assert [h["new_memory"] for h in history] == ["first", "second"]
+        mock_capture_event.assert_called_once()
+        assert mock_capture_event.call_args.args[2]["memory_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_messages_are_written_in_one_batch(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.db = mocker.MagicMock()
+        mock_capture_event = mocker.patch("mem0.memory.main.capture_event")
+        memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+
+        result = await memory._add_to_vector_store(self.MESSAGES, {"user_id": "u"}, {"user_id": "u"}, infer=False)
+
+        assert [r["memory"] for r in result] == ["first", "second"]
+        memory.vector_store.insert.assert_called_once()
+        memory.db.add_history_batch.assert_called_once()
+        mock_capture_event.assert_called_once()
+
+
+class TestApplyMemoryActions:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        mocker.patch("mem0.memory.main.capture_event", mocker.MagicMock())
+        return memory
+
+    def test_actions_are_written_in_bulk(self, mock_memory):
+        existing = MagicMock(payload={"data": "old", "user_id": "u", "created_at": "t0"})
+        mock_memory.vector_store.bulk_get.return_value = [existing, existing]
+        mock_memory.embedding_model.embed_batch.side_effect = [[[0.5]], [[0.7]]]
+        actions = [
+            {"event": "ADD", "text": "fact one"},
+            {"event": "ADD", "text": "fact two"},
+            {"event": "UPDATE", "id": "0", "text": "updated", "old_memory": "old"},
+            {"event": "DELETE", "id": "1", "text": "gone"},
+            {"event": "NONE", "text": "same"},
+        ]
+
+        result = mock_memory._apply_memory_actions(
+            actions, {"0": "mem-0", "1": "mem-1"}, {"fact one": [0.1]}, {"user_id": "u"}
+        )
+
+        assert [(r["event"], r["memory"]) for r in result] == [
+            ("ADD", "fact one"),
+            ("ADD", "fact two"),
+            ("UPDATE", "updated"),
+            ("DELETE", "gone"),
+        ]
+        mock_memory.vector_store.bulk_get.assert_called_once_with(["mem-0", "mem-1"])
+        assert mock_memory.embedding_model.embed_batch.call_args_list == [
+            call(["fact two"], "add"),
+            call(["updated"], "update"),
+        ]
+        insert = mock_memory.vector_store.insert.call_args.kwargs
+        assert insert["vectors"] == [[0.1], [0.5]]
+        assert [p["data"] for p in insert["payloads"]] == ["fact one", "fact two"]
+        (update,) = mock_memory.vector_store.bulk_update.call_args.args[0]
+        assert update["vector_id"] == "mem-0"
+        assert update["vector"] == [0.7]
+        assert update["payload"]["created_at"] == "t0"
+        mock_memory.vector_store.bulk_delete.assert_called_once_with(["mem-1"])
+        mock_memory.vector_store.get.assert_not_called()
+        mock_memory.vector_store.update.assert_not_called()
+        mock_memory.vector_store.delete.assert_not_called()
+
+        (history,) = mock_memory.db.add_history_batch.call_args.args
+        assert [(h["event"], h["old_memory"], h["new_memory"]) for h in history] == [
+            ("ADD", None, "fact one"),
+            ("ADD", None, "fact two"),
+            ("UPDATE", "old", "updated"),
+            ("DELETE", "old", None),
+        ]
+        mock_memory.db.add_history.assert_not_called()
+
+    def test_missing_targets_and_failed_writes_are_skipped(self, mock_memory, caplog):
+        mock_memory.vector_store.bulk_get.return_value = [None]
+        mock_memory.vector_store.insert.side_effect = RuntimeError("store down")
+        actions = [{"event": "ADD", "text": "fact"}, {"event": "UPDATE", "id": "0", "text": "updated"}]
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._apply_memory_actions(actions, {"0": "mem-0"}, {"fact": [0.1]}, {})
+
+        assert result == []
+        assert "Error getting memory with ID mem-0 during update" in caplog.text
+        assert "Error applying 1 ADD memory actions: store down" in caplog.text
+        mock_memory.vector_store.bulk_update.assert_not_called()
+        mock_memory.db.add_history_batch.assert_called_once_with([])
+
+
+    def test_last_action_for_a_memory_wins_at_its_own_position(self, mock_memory):
+        existing = MagicMock(payload={"data": "old", "user_id": "u", "created_at": "t0"})
+        mock_memory.vector_store.bulk_get.return_value = [existing]
+        actions = [
+            {"event": "UPDATE", "id": "0", "text": "first update"},
+            {"event": "ADD", "text": "new fact"},
+            {"event": "DELETE", "id": "0", "text": "old"},
+        ]
+
+        result = mock_memory._apply_memory_actions(actions, {"0": "mem-0"}, {"new fact": [0.1]}, {"user_id": "u"})
+
+        assert [(r["event"], r["memory"]) for r in result] == [("ADD", "new fact"), ("DELETE", "old")]
+        mock_memory.vector_store.bulk_get.assert_called_once_with(["mem-0"])
+        mock_memory.vector_store.bulk_update.assert_not_called()
+        mock_memory.vector_store.bulk_delete.assert_called_once_with(["mem-0"])
+
+class TestAddMany:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.config.llm.config = {}
+        memory.api_version = "v1.1"
+        mocker.patch.object(memory, "_add_to_graph", return_value=[])
+        return memory
+
+    def test_streams_results_and_resumes_from_checkpoint(self, mock_memory, mocker, tmp_path):
+        def add_to_vector_store(messages, metadata, filters, infer):
+            if messages[0]["content"] == "boom":
+                raise RuntimeError("store down")
+            return [{"id": metadata["user_id"], "memory": messages[0]["content"], "event": "ADD"}]
+
+        mocker.patch.object(mock_memory, "_add_to_vector_store", side_effect=add_to_vector_store)
+        checkpoint = tmp_path / "backfill.jsonl"
+        requests = [
+            {"messages": "hello", "user_id": "alice"},
+            {"messages": "boom", "user_id": "bob", "id": "bob-1"},
+            {"messages": "hi", "user_id": "carol", "infer": False},
+        ]
+
+        results = list(mock_memory.add_many(requests, concurrency=2, checkpoint_path=str(checkpoint)))
+
+        assert sorted(r["id"] for r in results) == ["0", "2", "bob-1"]
+        by_id = {r["id"]: r for r in results}
+        assert by_id["0"]["result"] == {"results": [{"id": "alice", "memory": "hello", "event": "ADD"}]}
+        assert by_id["bob-1"]["error"] == "store down"
+        infer_flags = sorted(call.args[3] for call in mock_memory._add_to_vector_store.call_args_list)
+        assert infer_flags == [False, True, True]
+
+        # A second run only retries the request that failed
+        mock_memory._add_to_vector_store.reset_mock()
+        results = list(mock_memory.add_many(requests, checkpoint_path=str(checkpoint)))
+        assert [r["id"] for r in results] == ["bob-1"]
+        assert mock_memory._add_to_vector_store.call_count == 1
+
+    def test_items_are_added_like_add(self, mock_memory, mocker):
+        add = mocker.patch.object(mock_memory, "add", return_value={"results": []})
+        requests = [{"messages": "hello", "user_id": "alice", "prompt": "Summarize", "id": "a"}]
+
+        (result,) = mock_memory.add_many(requests)
+
+        assert result == {"index": 0, "id": "a", "result": {"results": []}}
+        add.assert_called_once_with(messages="hello", user_id="alice", prompt="Summarize", infer=True)
+
+    def test_unsupported_item_keys_are_reported(self, mock_memory):
+        (result,) = mock_memory.add_many([{"messages": "hello", "user_id": "alice", "filters": {}}])
+
+        assert "filters" in result["error"]
+
+    def test_bounds_requests_in_flight(self, mock_memory, mocker):
+        import threading
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+        consumed = []
+
+        def add_to_vector_store(messages, metadata, filters, infer):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            threading.Event().wait(0.01)
+            with lock:
+                in_flight["now"] -= 1
+            return []
+
+        def requests():
+            for i in range(10):
+                consumed.append(i)
+                yield {"messages": f"message {i}", "user_id": "alice"}
+
+        mocker.patch.object(mock_memory, "_add_to_vector_store", side_effect=add_to_vector_store)
+        stream = mock_memory.add_many(requests(), concurrency=3)
+        next(stream)
+
+        assert len(consumed) <= 4
+        assert len(list(stream)) == 9
+        assert in_flight["max"] <= 3
+
+
+@pytest.mark.asyncio
+async def test_async_add_many_streams_results(mocker, tmp_path):
+    _setup_mocks(mocker)
+    memory = AsyncMemory()
+    memory.config.llm.config = {}
+    memory.api_version = "v1.1"
+
+    async def add_to_vector_store(messages, metadata, filters, infer):
+        return [{"id": metadata["user_id"], "memory": messages[0]["content"], "event": "ADD"}]
+
+    async def add_to_graph(messages, filters):
+        return []
+
+    mocker.patch.object(memory, "_add_to_vector_store", side_effect=add_to_vector_store)
+    mocker.patch.object(memory, "_add_to_graph", side_effect=add_to_graph)
+
+    async def requests():
+        for user_id in ("alice", "bob", "carol"):
+            yield {"messages": f"hello from {user_id}", "user_id": user_id}
+
+    checkpoint = str(tmp_path / "backfill.jsonl")
+    results = [r async for r in memory.add_many(requests(), concurrency=2, checkpoint_path=checkpoint)]
+    assert sorted(r["result"]["results"][0]["id"] for r in results) == ["alice", "bob", "carol"]
+
+    # Requests without an "id" are keyed by position, so position 0 is already recorded
+    resumed = [r async for r in memory.add_many([{"messages": "x", "user_id": "dave"}], checkpoint_path=checkpoint)]
+    assert resumed == []
+
+
+class TestSharedExecutor:
+    def test_configured_executor_is_shared_with_the_vector_store(self, mocker):
+        from mem0.configs.base import MemoryConfig
+
+        _setup_mocks(mocker)
+        memory = Memory(MemoryConfig(executor={"max_workers": 3, "thread_name_prefix": "mem0-test"}))
+
+        assert memory.executor.max_workers == 3
+        assert memory.vector_store.executor is memory.executor
+        memory.close()
+
+    @pytest.mark.parametrize("supports_reset", [True, False])
+    def test_executor_is_reattached_after_reset(self, mocker, supports_reset):
+        _setup_mocks(mocker)
+        memory = Memory()
+        mocker.patch("mem0.memory.main.SQLiteManager")
+        new_store = MagicMock()
+        if supports_reset:
+            memory.vector_store.reset.return_value = new_store
+            mocker.patch("mem0.memory.main.VectorStoreFactory.reset", side_effect=lambda store: store.reset())
+        else:
+            memory.vector_store = MagicMock(spec=["delete_col"])
+            mocker.patch("mem0.memory.main.VectorStoreFactory.create", return_value=new_store)
+
+        memory.reset()
+
+        assert memory.vector_store is new_store
+        assert new_store.executor is memory.executor
+
+    def test_vector_branch_runs_inline_without_graph(self, mocker):
+        _setup_mocks(mocker)
+        memory = Memory()
+        submit = mocker.patch.object(memory.executor, "submit")
+        mocker.patch.object(memory, "_search_vector_store", return_value=[])
+
+        assert memory.search("query", user_id="alice") == {"results": []}
+        submit.assert_not_called()
+
+
+class TestNativeAsyncComponents:
+    class AsyncStore(AsyncVectorStoreBase):
+        def __init__(self, native=True):
+            self.native = native
+            self.search = MagicMock(return_value=[])
+
+        @property
+        def supports_async(self):
+            return self.native
+
+        async def asearch(self, query, vectors, limit=5, filters=None):
+            return [MagicMock(id="m1", score=0.9, payload={"data": "native", "user_id": "u"})]
+
+        async def ainsert(self, vectors, payloads=None, ids=None):
+            pass
+
+        async def adelete(self, vector_id):
+            pass
+
+        async def aupdate(self, vector_id, vector=None, payload=None):
+            pass
+
+        async def aget(self, vector_id):
+            pass
+
+        async def alist(self, filters=None, limit=None):
+            pass
+
+    class AsyncEmbedder(EmbeddingBase, AsyncEmbeddingBase):
+        def embed(self, text, memory_action=None):
+            raise AssertionError("sync embed called")
+
+        async def aembed(self, text, memory_action=None):
+            return [0.5]
+
+    @pytest.mark.asyncio
+    async def test_native_async_methods_are_awaited(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.embedding_model = self.AsyncEmbedder()
+        memory.vector_store = self.AsyncStore()
+        to_thread = mocker.patch("mem0.memory.main.asyncio.to_thread")
+
+        results = await memory._search_vector_store("query", {"user_id": "u"}, limit=5)
+
+        assert [r["memory"] for r in results] == ["native"]
+        to_thread.assert_not_called()
+        memory.vector_store.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_are_awaited(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.llm = mocker.MagicMock(spec=LLMBase)
+        memory.llm.agenerate_response = mocker.AsyncMock(return_value='{"facts": []}')
+
+        assert await memory._add_to_vector_store([{"role": "user", "content": "hi"}], {}, {}, infer=True) == []
+        memory.llm.agenerate_response.assert_awaited_once()
+        memory.llm.generate_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_threads_without_native_support(self, mocker):
+        _setup_mocks(mocker)
+        memory = AsyncMemory()
+        memory.vector_store = self.AsyncStore(native=False)
+
+        assert await memory._search_vector_store("query", {"user_id": "u"}, limit=5) == []
+        memory.embedding_model.embed.assert_called_once_with("query", "search")
+        memory.vector_store.search.assert_called_once()
+
+
+class TestTelemetryVectorStore:
+    def test_not_created_during_init(self, mocker):
+        _setup_mocks(mocker)
+        create_store = mocker.patch("mem0.memory.main._create_telemetry_vector_store")
+
+        memory = Memory()
+
+        create_store.assert_not_called()
+        assert memory._telemetry_vector_store is create_store.return_value
+        assert memory._telemetry_vector_store is create_store.return_value
+        create_store.assert_called_once_with(memory.config, memory.vector_store)
+
+    def test_reuses_main_client_when_supported(self, mocker):
+        from mem0.configs.base import MemoryConfig
+        from mem0.memory.main import _create_telemetry_vector_store
+
+        create = mocker.patch("mem0.memory.main.VectorStoreFactory.create")
+        config = MemoryConfig(vector_store={"provider": "qdrant", "config": {"host": "localhost", "port": 6333}})
+        main_store = mocker.MagicMock()
+
+        _create_telemetry_vector_store(config, main_store)
+
+        telemetry_config = create.call_args.args[1]
+        assert telemetry_config.collection_name == "mem0migrations"
+        assert telemetry_config.client is main_store.client
+        assert config.vector_store.config.collection_name == "mem0"
@@ -242,7 +242,7 @@ class TestNeptuneMemory(unittest.TestCase):
 
         # Mock embedding
         mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
+        self.mock_embedding_model.embed_batch.return_value = [mock_embedding, mock_embedding]
 
         # Mock the _search_graph_db_cypher method
         mock_cypher = "MATCH (n) RETURN n"
@@ -258,7 +258,7 @@ class TestNeptuneMemory(unittest.TestCase):
         result = self.memory_graph._search_graph_db(node_list, self.test_filters, limit=10)
 
         # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
+        self.mock_embedding_model.embed_batch.assert_called_once_with(node_list)
         self.assertEqual(self.memory_graph._search_graph_db_cypher.call_count, 2)
         self.assertEqual(self.mock_graph.query.call_count, 2)
 
@@ -274,7 +274,7 @@ class TestNeptuneMemory(unittest.TestCase):
 
         # Mock embeddings
         mock_embedding = [0.1, 0.2, 0.3]
-        self.mock_embedding_model.embed.return_value = mock_embedding
+        self.mock_embedding_model.embed_batch.return_value = [mock_embedding, mock_embedding]
 
         # Mock search results
         mock_source_search = [{"id(source_candidate)": 123, "cosine_similarity": 0.95}]
@@ -297,7 +297,7 @@ class TestNeptuneMemory(unittest.TestCase):
         result = self.memory_graph._add_entities(to_be_added, self.user_id, entity_type_map)
 
         # Verify the method calls
-        self.assertEqual(self.mock_embedding_model.embed.call_count, 2)
+        self.mock_embedding_model.embed_batch.assert_called_once_with(["alice", "bob"])
         self.memory_graph._search_source_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.9)
         self.memory_graph._search_destination_node.assert_called_once_with(mock_embedding, self.user_id, threshold=0.9)
         self.memory_graph._add_entities_cypher.assert_called_once()
@@ -0,0 +1,174 @@
+import queue
+import sqlite3
+import threading
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from mem0.memory.write_queue import AsyncMemoryWriteQueue, MemoryWriteQueue, WriteJournal
+
+
+def _blocking_memory():
+    """A memory whose first add waits for `release`, so later adds stay queued."""
+    memory = MagicMock()
+    started, release = threading.Event(), threading.Event()
+
+    def add(**kwargs):
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+
+    memory.add.side_effect = add
+    return memory, started, release
+
+
+def test_queued_adds_of_a_conversation_are_coalesced_in_order():
+    memory, started, release = _blocking_memory()
+    with MemoryWriteQueue(memory, max_workers=2) as write_queue:
+        write_queue.submit("first", user_id="alice")
+        assert started.wait(5)
+        write_queue.submit("second", user_id="alice")
+        write_queue.submit([{"role": "user", "content": "third"}], user_id="alice")
+        write_queue.submit("other", user_id="bob")
+        release.set()
+        assert write_queue.flush(timeout=5)
+        metrics = write_queue.metrics()
+
+    assert call(messages="first", user_id="alice") in memory.add.call_args_list
+    assert (
+        call(
+            messages=[{"role": "user", "content": "second"}, {"role": "user", "content": "third"}],
+            user_id="alice",
+        )
+        in memory.add.call_args_list
+    )
+    assert call(messages="other", user_id="bob") in memory.add.call_args_list
+    assert memory.add.call_count == 3
+    assert metrics["submitted"] == 4
+    assert metrics["completed"] == 4
+    assert metrics["coalesced"] == 1
+    assert metrics["pending"] == 0
+
+
+def test_failed_adds_are_retried_then_kept_as_failed(tmp_path):
+    path = str(tmp_path / "adds.db")
+    memory = MagicMock()
+    memory.add.side_effect = [RuntimeError("rate limited"), None, RuntimeError("down"), RuntimeError("down")]
+    with MemoryWriteQueue(memory, max_workers=1, max_retries=1, initial_backoff=0, journal_path=path) as write_queue:
+        write_queue.submit("kept", user_id="alice")
+        assert write_queue.flush(timeout=5)
+        write_queue.submit("lost", user_id="alice")
+        assert write_queue.flush(timeout=5)
+        metrics = write_queue.metrics()
+        assert write_queue.journal.pending() == []
+
+    assert metrics["retried"] == 2
+    assert metrics["completed"] == 1
+    assert metrics["failed"] == 1
+    assert [(request, error) for _, request, error in WriteJournal(path).failed()] == [
+        ({"messages": "lost", "user_id": "alice"}, "down")
+    ]
+
+    memory = MagicMock()
+    with MemoryWriteQueue(memory, journal_path=path) as write_queue:
+        assert write_queue.flush(timeout=5)
+        assert write_queue.metrics()["failed"] == 1
+        memory.add.assert_not_called()
+
+        assert write_queue.retry_failed() == 1
+        assert write_queue.flush(timeout=5)
+        assert write_queue.metrics()["failed"] == 0
+
+    memory.add.assert_called_once_with(messages="lost", user_id="alice")
+    assert WriteJournal(path).failed() == []
+
+
+def test_journal_is_closed_after_the_last_worker_exits():
+    memory, started, release = _blocking_memory()
+    write_queue = MemoryWriteQueue(memory, max_workers=1)
+    write_queue.submit("slow", user_id="alice")
+    assert started.wait(5)
+
+    write_queue.close(timeout=0.01)
+    assert write_queue.journal.connection is not None
+
+    release.set()
+    write_queue._workers[0].join(5)
+    assert write_queue.journal.connection is None
+    assert write_queue.metrics()["completed"] == 1
+
+
+def test_journal_keeps_failed_status_of_old_databases(tmp_path):
+    path = str(tmp_path / "adds.db")
+    connection = sqlite3.connect(path)
+    connection.execute("CREATE TABLE pending_adds (id INTEGER PRIMARY KEY AUTOINCREMENT, request TEXT, created_at REAL)")
+    connection.execute("""INSERT INTO pending_adds (request, created_at) VALUES ('{"messages": "old"}', 0)""")
+    connection.commit()
+    connection.close()
+
+    journal = WriteJournal(path)
+    assert journal.pending() == [(1, {"messages": "old"})]
+    journal.mark_failed([1], "down")
+    assert journal.pending() == []
+    assert journal.failed() == [(1, {"messages": "old"}, "down")]
+
+
+def test_journaled_adds_are_replayed(tmp_path):
+    path = str(tmp_path / "adds.db")
+    journal = WriteJournal(path)
+    journal.append({"messages": "left over", "user_id": "alice"})
+    journal.close()
+
+    memory = MagicMock()
+    with MemoryWriteQueue(memory, journal_path=path) as write_queue:
+        assert write_queue.flush(timeout=5)
+
+    memory.add.assert_called_once_with(messages="left over", user_id="alice")
+    assert WriteJournal(path).pending() == []
+
+
+def test_submit_is_bounded():
+    memory, started, release = _blocking_memory()
+    write_queue = MemoryWriteQueue(memory, max_workers=1, max_pending=1)
+    try:
+        write_queue.submit("first", user_id="alice")
+        assert started.wait(5)
+        with pytest.raises(queue.Full):
+            write_queue.submit("second", user_id="alice", block=False)
+        with pytest.raises(queue.Full):
+            write_queue.submit("second", user_id="alice", timeout=0.01)
+    finally:
+        release.set()
+        write_queue.close()
+
+    with pytest.raises(RuntimeError):
+        write_queue.submit("late", user_id="alice")
+
+
+@pytest.mark.asyncio
+async def test_async_queue_coalesces_and_flushes():
+    calls = []
+
+    class Memory:
+        async def add(self, **kwargs):
+            calls.append(kwargs)
+
+    async with AsyncMemoryWriteQueue(Memory(), max_workers=1) as write_queue:
+        write_queue._start()
+        async with write_queue._condition:
+            # Workers cannot take the adds until the lock is released
+            for content in ("first", "second"):
+                journal_id = write_queue.journal.append({"messages": content, "user_id": "alice"})
+                write_queue._backlog.push(journal_id, {"messages": content, "user_id": "alice"})
+        await write_queue.submit("third", user_id="bob")
+        assert await write_queue.flush(timeout=5)
+        metrics = write_queue.metrics()
+
+    assert calls == [
+        {
+            "messages": [{"role": "user", "content": "first"}, {"role": "user", "content": "second"}],
+            "user_id": "alice",
+        },
+        {"messages": "third", "user_id": "bob"},
+    ]
+    assert metrics["coalesced"] == 1
@@ -28,6 +28,9 @@ def memory_instance():
         mock_embedder.create.return_value = Mock()
         mock_vector_store.create.return_value = Mock()
         mock_vector_store.create.return_value.search.return_value = []
+        mock_vector_store.create.return_value.search_batch.side_effect = lambda queries, **kwargs: [
+            [] for _ in queries
+        ]
         mock_llm.create.return_value = Mock()
         
         # Create a mock instance that won't try to access config attributes
@@ -52,6 +55,9 @@ def memory_custom_instance():
         mock_embedder.create.return_value = Mock()
         mock_vector_store.create.return_value = Mock()
         mock_vector_store.create.return_value.search.return_value = []
+        mock_vector_store.create.return_value.search_batch.side_effect = lambda queries, **kwargs: [
+            [] for _ in queries
+        ]
         mock_llm.create.return_value = Mock()
         
         # Create a mock instance that won't try to access config attributes
@@ -1,11 +1,20 @@
+import threading
+from typing import Optional
 from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import BaseModel
 
 from mem0 import Memory, MemoryClient
 from mem0.proxy.main import Chat, Completions, Mem0
 
 
+@pytest.fixture(autouse=True)
+def proxy_mem0_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("mem0.proxy.main.mem0_dir", str(tmp_path))
+    return tmp_path
+
+
 @pytest.fixture
 def mock_memory_client():
     mock_client = Mock(spec=MemoryClient)
@@ -48,6 +57,10 @@ def test_mem0_initialization_with_config():
         mock_from_config.assert_called_once_with(config)
         assert isinstance(mem0.chat, Chat)
 
+    mem0.close()
+    with pytest.raises(RuntimeError):
+        mem0.chat.completions.write_queue.submit("late", user_id="alice")
+
 
 def test_mem0_initialization_without_params(mock_openai_embedding_client, mock_openai_llm_client):
     mem0 = Mem0()
@@ -69,8 +82,11 @@ def test_completions_create(mock_memory_client, mock_litellm):
     mock_litellm.supports_function_calling.return_value = True
 
     response = completions.create(model="gpt-4o-mini", messages=messages, user_id="test_user", temperature=0.7)
+    assert completions.write_queue.flush(timeout=5)
 
-    mock_memory_client.add.assert_called_once()
+    mock_memory_client.add.assert_called_once_with(
+        messages=messages, user_id="test_user", agent_id=None, run_id=None, metadata=None
+    )
     mock_memory_client.search.assert_called_once()
 
     mock_litellm.completion.assert_called_once()
@@ -82,6 +98,59 @@ def test_completions_create(mock_memory_client, mock_litellm):
     assert response == {"choices": [{"message": {"content": "I'm doing well, thank you!"}}]}
 
 
+def test_completions_create_stores_message_objects_without_coalescing(mock_memory_client, mock_litellm):
+    class Message(BaseModel):
+        role: str
+        content: str
+        tool_calls: Optional[list] = None
+
+    completions = Completions(mock_memory_client)
+    mock_memory_client.search.return_value = []
+    mock_litellm.supports_function_calling.return_value = True
+    # Hold the first add so the later chat calls of the conversation queue up behind it
+    release = threading.Event()
+    mock_memory_client.add.side_effect = lambda **kwargs: release.wait(5)
+    history = [{"role": "user", "content": "Hi"}, Message(role="assistant", content="Hello!")]
+    questions = ["I like tea", "And coffee", "And juice"]
+
+    for question in questions:
+        completions.create(
+            model="gpt-4o-mini", messages=[*history, {"role": "user", "content": question}], user_id="u"
+        )
+    release.set()
+    assert completions.write_queue.flush(timeout=5)
+
+    assert [call.kwargs["messages"] for call in mock_memory_client.add.call_args_list] == [
+        [{"role": "user", "content": "Hi"}, {"role": "assistant", "content": "Hello!"}, {"role": "user", "content": q}]
+        for q in questions
+    ]
+    assert completions.write_queue.metrics()["coalesced"] == 0
+
+
+def test_chat_messages_left_queued_are_replayed_from_the_default_journal(
+    mock_memory_client, mock_litellm, proxy_mem0_dir
+):
+    mock_memory_client.search.return_value = []
+    mock_litellm.supports_function_calling.return_value = True
+    started, release = threading.Event(), threading.Event()
+    mock_memory_client.add.side_effect = lambda **kwargs: started.set() or release.wait(5)
+    completions = Completions(mock_memory_client)
+    messages = [{"role": "user", "content": "I like tea"}]
+
+    completions.create(model="gpt-4o-mini", messages=messages, user_id="u")
+    assert started.wait(5)
+    completions.create(model="gpt-4o-mini", messages=messages, user_id="u")
+    completions.close(wait=False, timeout=0.01)
+    release.set()
+    for worker in completions.write_queue._workers:
+        worker.join(5)
+    assert (proxy_mem0_dir / "proxy_write_queue.db").exists()
+
+    replayed = Mock(spec=MemoryClient)
+    Completions(replayed).close()
+    replayed.add.assert_called_once_with(messages=messages, user_id="u", agent_id=None, run_id=None, metadata=None)
+
+
 def test_completions_create_with_system_message(mock_memory_client, mock_litellm):
     completions = Completions(mock_memory_client)
 
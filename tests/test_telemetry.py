@@ -1,5 +1,6 @@
 import os
-from unittest.mock import patch
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -33,3 +34,107 @@ def test_telemetry_disabled():
 
 def test_telemetry_default_enabled():
     assert use_telemetry() is True
+
+
+@pytest.fixture
+def telemetry_module():
+    from mem0.memory import telemetry
+
+    with (
+        patch.object(telemetry, "MEM0_TELEMETRY", True),
+        patch.object(telemetry, "Posthog") as mock_posthog,
+        patch.object(telemetry, "get_or_create_user_id", return_value="user-123") as mock_get_user_id,
+    ):
+        yield telemetry, mock_posthog.return_value, mock_get_user_id
+
+
+def test_user_id_resolved_once(telemetry_module):
+    telemetry, posthog, get_user_id = telemetry_module
+    client = telemetry.AnonymousTelemetry()
+    vector_store = object()
+
+    assert client.needs_vector_store
+    for _ in range(3):
+        client.capture_event("mem0.add", {"a": 1}, vector_store=vector_store)
+    client.flush()
+
+    get_user_id.assert_called_once_with(vector_store)
+    assert not client.needs_vector_store
+    assert posthog.capture.call_count == 3
+    assert posthog.capture.call_args.kwargs["distinct_id"] == "user-123"
+
+
+def test_memory_events_create_the_vector_store_on_the_caller_thread(telemetry_module):
+    telemetry, posthog, get_user_id = telemetry_module
+    client = telemetry.AnonymousTelemetry()
+    created_on = []
+
+    class FakeMemory(Mock):
+        @property
+        def _telemetry_vector_store(self):
+            created_on.append(threading.current_thread().name)
+            return "telemetry-store"
+
+    memory = FakeMemory()
+    memory.config.graph_store.config = None
+    with patch.object(telemetry, "client_telemetry", client):
+        telemetry.capture_event("mem0.add", memory)
+        client.flush()
+        telemetry.capture_event("mem0.search", memory)
+        client.flush()
+
+    assert created_on == [threading.current_thread().name]
+    get_user_id.assert_called_once_with("telemetry-store")
+    assert posthog.capture.call_count == 2
+
+
+def test_batch_mode_coalesces_events(telemetry_module):
+    telemetry, posthog, _ = telemetry_module
+    client = telemetry.AnonymousTelemetry(batch=True)
+
+    with patch.object(client, "_start_worker"):
+        for _ in range(3):
+            client.capture_event("mem0._create_memory")
+        client.capture_event("mem0.add")
+    client._start_worker()
+    client.flush()
+
+    sent = {c.kwargs["event"]: c.kwargs["properties"]["event_count"] for c in posthog.capture.call_args_list}
+    assert sent == {"mem0._create_memory": 3, "mem0.add": 1}
+
+
+def test_full_queue_drops_events(telemetry_module):
+    telemetry, _, _ = telemetry_module
+    client = telemetry.AnonymousTelemetry(max_queue_size=1)
+
+    with patch.object(client, "_start_worker"):
+        client.capture_event("mem0.add")
+        client.capture_event("mem0.add")
+
+    assert client.dropped == 1
+
+
+def test_sampling_skips_events(telemetry_module):
+    telemetry, _, _ = telemetry_module
+    client = telemetry.AnonymousTelemetry(sample_rate=0.0)
+
+    client.capture_event("mem0.add")
+
+    assert client._queue.empty()
+
+
+def test_disabled_telemetry_is_noop():
+    from mem0.memory import telemetry
+
+    with (
+        patch.object(telemetry, "MEM0_TELEMETRY", False),
+        patch.object(telemetry, "Posthog") as mock_posthog,
+        patch.object(telemetry, "get_or_create_user_id") as mock_get_user_id,
+    ):
+        client = telemetry.AnonymousTelemetry()
+        client.capture_event("mem0.add", vector_store=Mock())
+
+    assert not client.needs_vector_store
+    mock_posthog.assert_not_called()
+    mock_get_user_id.assert_not_called()
+    assert client._worker is None
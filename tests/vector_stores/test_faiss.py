@@ -1,27 +1,37 @@
 import os
+import pickle
+import sqlite3
 import tempfile
+import threading
 from unittest.mock import Mock, patch
 
 import faiss
 import numpy as np
 import pytest
 
-from mem0.vector_stores.faiss import FAISS, OutputData
+from mem0.vector_stores.faiss import FAISS, OutputData, PayloadStore, ShardedFAISS
 
 
 @pytest.fixture
 def mock_faiss_index():
-    index = Mock(spec=faiss.IndexFlatL2)
+    index = Mock(spec=faiss.IndexIDMap2)
     index.d = 128  # Dimension of the vectors
     index.ntotal = 0  # Number of vectors in the index
     return index
 
 
+def seed_payloads(faiss_store, rows):
+    """Store `{vector_id: payload}` rows under consecutive index ids."""
+    faiss_store.payloads.put_many([(vector_id, i, payload) for i, (vector_id, payload) in enumerate(rows.items())])
+
+
 @pytest.fixture
 def faiss_instance(mock_faiss_index):
     with tempfile.TemporaryDirectory() as temp_dir:
         # Mock the faiss index creation
-        with patch("faiss.IndexFlatL2", return_value=mock_faiss_index):
+        with patch("faiss.IndexFlatL2", return_value=mock_faiss_index), patch(
+            "faiss.IndexIDMap2", return_value=mock_faiss_index
+        ):
             # Mock the faiss.write_index function
             with patch("faiss.write_index"):
                 # Create a FAISS instance with a temporary directory
@@ -38,15 +48,18 @@ def faiss_instance(mock_faiss_index):
 def test_create_col(faiss_instance, mock_faiss_index):
     # Test creating a collection with euclidean distance
     with patch("faiss.IndexFlatL2", return_value=mock_faiss_index) as mock_index_flat_l2:
-        with patch("faiss.write_index"):
-            faiss_instance.create_col(name="new_collection")
-            mock_index_flat_l2.assert_called_once_with(faiss_instance.embedding_model_dims)
+        with patch("faiss.IndexIDMap2", return_value=mock_faiss_index) as mock_id_map:
+            with patch("faiss.write_index"):
+                faiss_instance.create_col(name="new_collection")
+                mock_index_flat_l2.assert_called_once_with(faiss_instance.embedding_model_dims)
+                mock_id_map.assert_called_once_with(mock_faiss_index)
 
     # Test creating a collection with inner product distance
     with patch("faiss.IndexFlatIP", return_value=mock_faiss_index) as mock_index_flat_ip:
-        with patch("faiss.write_index"):
-            faiss_instance.create_col(name="new_collection", distance="inner_product")
-            mock_index_flat_ip.assert_called_once_with(faiss_instance.embedding_model_dims)
+        with patch("faiss.IndexIDMap2", return_value=mock_faiss_index):
+            with patch("faiss.write_index"):
+                faiss_instance.create_col(name="new_collection", distance="inner_product")
+                mock_index_flat_ip.assert_called_once_with(faiss_instance.embedding_model_dims)
 
 
 def test_insert(faiss_instance, mock_faiss_index):
@@ -57,8 +70,8 @@ def test_insert(faiss_instance, mock_faiss_index):
 
     # Mock the numpy array conversion
     with patch("numpy.array", return_value=np.array(vectors, dtype=np.float32)) as mock_np_array:
-        # Mock index.add
-        mock_faiss_index.add.return_value = None
+        # Mock index.add_with_ids
+        mock_faiss_index.add_with_ids.return_value = None
 
         # Call insert
         faiss_instance.insert(vectors=vectors, payloads=payloads, ids=ids)
@@ -66,23 +79,22 @@ def test_insert(faiss_instance, mock_faiss_index):
         # Verify numpy.array was called
         mock_np_array.assert_called_once_with(vectors, dtype=np.float32)
 
-        # Verify index.add was called
-        mock_faiss_index.add.assert_called_once()
+        # Verify index.add_with_ids was called with int64 ids
+        mock_faiss_index.add_with_ids.assert_called_once()
+        assert mock_faiss_index.add_with_ids.call_args.args[1].tolist() == [0, 1]
 
-        # Verify docstore and index_to_id were updated
-        assert faiss_instance.docstore["id1"] == {"name": "vector1"}
-        assert faiss_instance.docstore["id2"] == {"name": "vector2"}
-        assert faiss_instance.index_to_id[0] == "id1"
-        assert faiss_instance.index_to_id[1] == "id2"
+        # Verify the payloads were stored under the new index ids
+        assert faiss_instance.payloads.get("id1") == {"name": "vector1"}
+        assert faiss_instance.payloads.get("id2") == {"name": "vector2"}
+        assert faiss_instance.payloads.index_ids_for(["id1", "id2"]) == {"id1": 0, "id2": 1}
 
 
 def test_search(faiss_instance, mock_faiss_index):
     # Prepare test data
     query_vector = [0.1, 0.2, 0.3]
 
-    # Setup the docstore and index_to_id mapping
-    faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
-    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    # Setup the payloads
+    seed_payloads(faiss_instance, {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}})
 
     # First, create the mock for the search return values
     search_scores = np.array([[0.9, 0.8]])
@@ -123,9 +135,10 @@ def test_search_with_filters(faiss_instance, mock_faiss_index):
     # Prepare test data
     query_vector = [0.1, 0.2, 0.3]
 
-    # Setup the docstore and index_to_id mapping
-    faiss_instance.docstore = {"id1": {"name": "vector1", "category": "A"}, "id2": {"name": "vector2", "category": "B"}}
-    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    # Setup the payloads
+    seed_payloads(
+        faiss_instance, {"id1": {"name": "vector1", "category": "A"}, "id2": {"name": "vector2", "category": "B"}}
+    )
 
     # First set up the search return values
     search_scores = np.array([[0.9, 0.8]])
@@ -166,45 +179,46 @@ def test_search_with_filters(faiss_instance, mock_faiss_index):
 
 
 def test_delete(faiss_instance):
-    # Setup the docstore and index_to_id mapping
-    faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
-    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    # Setup the payloads
+    seed_payloads(faiss_instance, {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}})
+    mock_faiss_index = faiss_instance.index
+    mock_faiss_index.ntotal = 2
+    mock_faiss_index.remove_ids.return_value = 1
 
     # Call delete
     faiss_instance.delete(vector_id="id1")
 
-    # Verify the vector was removed from docstore and index_to_id
-    assert "id1" not in faiss_instance.docstore
-    assert 0 not in faiss_instance.index_to_id
-    assert "id2" in faiss_instance.docstore
-    assert 1 in faiss_instance.index_to_id
+    # Half of the index is tombstoned, so the row is compacted away straight away
+    assert mock_faiss_index.remove_ids.call_args.args[0].tolist() == [0]
+
+    # Verify the row was removed from the payload store
+    assert faiss_instance.payloads.get("id1") is None
+    assert faiss_instance.payloads.index_ids() == [1]
+    assert faiss_instance.payloads.get("id2") == {"name": "vector2"}
+    assert faiss_instance.payloads.tombstone_count() == 0
 
 
 def test_update(faiss_instance, mock_faiss_index):
-    # Setup the docstore and index_to_id mapping
-    faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
-    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    # Setup the payloads
+    seed_payloads(faiss_instance, {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}})
 
     # Test updating payload only
     faiss_instance.update(vector_id="id1", payload={"name": "updated_vector1"})
-    assert faiss_instance.docstore["id1"] == {"name": "updated_vector1"}
+    assert faiss_instance.payloads.get("id1") == {"name": "updated_vector1"}
 
-    # Test updating vector
-    # This requires mocking the delete and insert methods
+    # Test updating vector: insert replaces the existing row, so delete is not needed
     with patch.object(faiss_instance, "delete") as mock_delete:
         with patch.object(faiss_instance, "insert") as mock_insert:
             new_vector = [0.7, 0.8, 0.9]
             faiss_instance.update(vector_id="id2", vector=new_vector)
 
-            # Verify delete and insert were called
-            # Match the actual call signature (positional arg instead of keyword)
-            mock_delete.assert_called_once_with("id2")
-            mock_insert.assert_called_once()
+            mock_delete.assert_not_called()
+            mock_insert.assert_called_once_with([new_vector], [{"name": "vector2"}], ["id2"])
 
 
 def test_get(faiss_instance):
-    # Setup the docstore
-    faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
+    # Setup the payloads
+    seed_payloads(faiss_instance, {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}})
 
     # Test getting an existing vector
     result = faiss_instance.get(vector_id="id1")
@@ -218,12 +232,15 @@ def test_get(faiss_instance):
 
 
 def test_list(faiss_instance):
-    # Setup the docstore
-    faiss_instance.docstore = {
-        "id1": {"name": "vector1", "category": "A"},
-        "id2": {"name": "vector2", "category": "B"},
-        "id3": {"name": "vector3", "category": "A"},
-    }
+    # Setup the payloads
+    seed_payloads(
+        faiss_instance,
+        {
+            "id1": {"name": "vector1", "category": "A"},
+            "id2": {"name": "vector2", "category": "B"},
+            "id3": {"name": "vector3", "category": "A"},
+        },
+    )
 
     # Test listing all vectors
     results = faiss_instance.list()
@@ -263,13 +280,12 @@ def test_delete_col(faiss_instance):
             # Call delete_col
             faiss_instance.delete_col()
 
-            # Verify os.remove was called twice (for index and docstore files)
-            assert mock_remove.call_count == 2
+            # Verify os.remove was called for the index, payload store and mutation log files
+            assert mock_remove.call_count == 3
 
             # Verify the internal state was reset
             assert faiss_instance.index is None
-            assert faiss_instance.docstore == {}
-            assert faiss_instance.index_to_id == {}
+            assert faiss_instance.payloads is None
 
 
 def test_normalize_L2(faiss_instance, mock_faiss_index):
@@ -289,3 +305,553 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+def test_search_batch(faiss_instance, mock_faiss_index):
+    seed_payloads(
+        faiss_instance,
+        {
+            "id1": {"name": "vector1", "category": "A"},
+            "id2": {"name": "vector2", "category": "B"},
+        },
+    )
+
+    search_scores = np.array([[0.9, 0.8], [0.7, 0.6]], dtype=np.float32)
+    search_indices = np.array([[0, 1], [1, 0]])
+    mock_faiss_index.search.return_value = (search_scores, search_indices)
+
+    results = faiss_instance.search_batch(
+        queries=["q1", "q2"], vectors=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], limit=2, filters={"category": "A"}
+    )
+
+    mock_faiss_index.search.assert_called_once()
+    assert len(results) == 2
+    assert [r.id for r in results[0]] == ["id1"]
+    assert [r.id for r in results[1]] == ["id1"]
+
+
+@pytest.fixture
+def real_faiss_store():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield FAISS(collection_name="test_collection", path=os.path.join(temp_dir, "faiss"), embedding_model_dims=2)
+
+
+def test_delete_and_update_do_not_grow_index(real_faiss_store):
+    store = real_faiss_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"n": 1}, {"n": 2}], ids=["a", "b"])
+
+    for i in range(10):
+        store.update("a", vector=[1.0, float(i)])
+
+    assert store.index.ntotal <= 3
+    assert store.col_info()["count"] == 2
+    assert [r.id for r in store.search(query="", vectors=[0.0, 1.0], limit=2)] == ["b", "a"]
+
+    store.delete("b")
+    store.compact()
+    assert store.index.ntotal == 1
+    assert [r.id for r in store.search(query="", vectors=[0.0, 1.0], limit=2)] == ["a"]
+
+
+def test_tombstoned_rows_do_not_take_top_k_slots(real_faiss_store):
+    store = real_faiss_store
+    store.compaction_ratio = 1.0  # keep tombstones around
+    store.insert(vectors=[[0.0, 1.0], [0.0, 0.9], [1.0, 0.0]], ids=["a", "b", "c"])
+    store.delete("a")
+    store.delete("b")
+
+    assert store.payloads.tombstone_count() == 2
+    assert [r.id for r in store.search(query="", vectors=[0.0, 1.0], limit=1)] == ["c"]
+
+
+def test_reload_keeps_ids_and_migrates_legacy_index(real_faiss_store):
+    store = real_faiss_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], ids=["a", "b"])
+
+    reloaded = FAISS(collection_name="test_collection", path=store.path, embedding_model_dims=2)
+    assert reloaded.payloads.index_ids_for(["a", "b"]) == {"a": 0, "b": 1}
+    assert reloaded._next_id == 2
+
+    # Indexes written before IndexIDMap2 used row positions as ids, next to a pickled docstore
+    store.delete_col()
+    legacy_index = faiss.IndexFlatL2(2)
+    legacy_index.add(np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], dtype=np.float32))
+    faiss.write_index(legacy_index, f"{store.path}/test_collection.faiss")
+    with open(f"{store.path}/test_collection.pkl", "wb") as f:
+        pickle.dump(({"a": {}, "c": {"user_id": "u1"}}, {0: "a", 2: "c"}), f)
+
+    migrated = FAISS(collection_name="test_collection", path=store.path, embedding_model_dims=2)
+    assert isinstance(migrated.index, faiss.IndexIDMap2)
+    assert migrated.index.ntotal == 2
+    assert [r.id for r in migrated.search(query="", vectors=[1.0, 1.0], limit=1)] == ["c"]
+    assert migrated.get("c").payload == {"user_id": "u1"}
+    assert not os.path.exists(f"{store.path}/test_collection.pkl")
+
+
+def test_debounced_persistence_logs_instead_of_rewriting():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(
+            collection_name="test_collection",
+            path=path,
+            embedding_model_dims=2,
+            persistence="debounced",
+            flush_every_n_ops=3,
+            flush_interval_ms=60_000,
+        )
+
+        with patch.object(store, "_save", wraps=store._save) as mock_save:
+            store.insert(vectors=[[1.0, 0.0]], payloads=[{"n": 1}], ids=["a"])
+            store.update("a", payload={"n": 2})
+            assert mock_save.call_count == 0
+            assert os.path.exists(store._log_path)
+
+            store.delete("a")
+            assert mock_save.call_count == 1
+            assert not os.path.exists(store._log_path)
+
+
+def test_manual_persistence_replays_log_after_crash():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2, persistence="manual")
+        store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"n": 1}, {"n": 2}], ids=["a", "b"])
+        store.update("a", payload={"n": 3})
+        store.delete("b")
+        with open(store._log_path, "a") as f:
+            f.write('{"op": "insert", "vec')  # torn write
+
+        # No flush() before "crashing": the snapshot on disk is still empty, only the payloads were committed
+        store.payloads.close()
+        recovered = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2)
+
+        assert recovered.get("a").payload == {"n": 3}
+        assert recovered.get("b") is None
+        assert [r.id for r in recovered.search(query="", vectors=[1.0, 0.0], limit=5)] == ["a"]
+        assert not os.path.exists(recovered._log_path)
+
+
+def test_logged_mutations_do_not_hold_the_payload_write_lock():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2, persistence="manual")
+        store.insert(vectors=[[1.0, 0.0]], payloads=[{"n": 1}], ids=["a"])
+
+        other = sqlite3.connect(store._payloads_path, timeout=0)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            assert other.execute("SELECT COUNT(*) FROM payloads").fetchone()[0] == 1
+            other.rollback()
+        finally:
+            other.close()
+
+
+def test_debounced_persistence_flushes_after_the_interval():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(
+            collection_name="test_collection",
+            path=path,
+            embedding_model_dims=2,
+            persistence="debounced",
+            flush_interval_ms=50,
+        )
+        store.insert(vectors=[[1.0, 0.0]], payloads=[{"n": 1}], ids=["a"])
+        assert os.path.exists(store._log_path)
+
+        store._flush_timer.join(timeout=5)
+        assert not os.path.exists(store._log_path)
+        assert store._pending_ops == 0
+
+
+def test_replay_drops_committed_payloads_missing_from_the_log():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2, persistence="manual")
+        store.insert(vectors=[[1.0, 0.0]], payloads=[{"n": 1}], ids=["a"])
+        store.flush()
+        store.insert(vectors=[[0.0, 1.0]], payloads=[{"n": 2}], ids=["b"])
+        # Simulate a crash after the payload of "b" was committed but before its mutation was logged
+        os.remove(store._log_path)
+        store.update("a", payload={"n": 3})
+        store.payloads.close()
+
+        recovered = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2)
+        assert recovered.get("a").payload == {"n": 3}
+        assert recovered.get("b") is None
+        assert [r.id for r in recovered.list()[0]] == ["a"]
+
+
+def test_search_prefilters_on_indexed_payload_keys(real_faiss_store):
+    store = real_faiss_store
+    # "alice" owns one row that is far from the query; everything close belongs to "bob"
+    vectors = [[0.0, 1.0 + i * 0.01] for i in range(20)] + [[10.0, 0.0]]
+    payloads = [{"user_id": "bob"} for _ in range(20)] + [{"user_id": "alice", "kind": "note"}]
+    ids = [f"bob-{i}" for i in range(20)] + ["alice-0"]
+    store.insert(vectors=vectors, payloads=payloads, ids=ids)
+
+    results = store.search(query="", vectors=[0.0, 1.0], limit=5, filters={"user_id": "alice"})
+    assert [r.id for r in results] == ["alice-0"]
+
+    results = store.search(query="", vectors=[0.0, 1.0], limit=5, filters={"user_id": "alice", "kind": "other"})
+    assert results == []
+
+    assert store.search(query="", vectors=[0.0, 1.0], limit=5, filters={"user_id": "carol"}) == []
+    batch = store.search_batch(queries=["q"], vectors=[[0.0, 1.0]], limit=5, filters={"user_id": "alice"})
+    assert [r.id for r in batch[0]] == ["alice-0"]
+
+
+def test_payload_index_tracks_updates_and_deletes(real_faiss_store):
+    store = real_faiss_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"user_id": "a"}, {"user_id": "a"}], ids=["m1", "m2"])
+
+    store.update("m1", payload={"user_id": "b"})
+    store.delete("m2")
+
+    assert store.list(filters={"user_id": "a"}) == [[]]
+    assert [r.id for r in store.list(filters={"user_id": "b"})[0]] == ["m1"]
+    assert [r.id for r in store.list(filters={"user_id": ["a", "b"]})[0]] == ["m1"]
+
+    with patch.object(store, "_apply_filters", wraps=store._apply_filters) as mock_apply:
+        store.list(filters={"user_id": "b"})
+        mock_apply.assert_not_called()
+
+
+def test_bulk_operations_persist_once(real_faiss_store):
+    store = real_faiss_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]], payloads=[{"n": 1}, {"n": 2}, {"n": 3}], ids=["a", "b", "c"])
+
+    assert [r.payload["n"] if r else None for r in store.bulk_get(["c", "missing", "a"])] == [3, None, 1]
+
+    with patch.object(store, "_save", wraps=store._save) as mock_save:
+        store.bulk_update([{"vector_id": "a", "vector": [0.0, 1.0]}, {"vector_id": "b", "payload": {"n": 20}}])
+        assert mock_save.call_count == 2  # one payload-only write, one insert
+        store.bulk_delete(["c", "missing"])
+        assert mock_save.call_count == 3
+
+    assert store.get("a").payload == {"n": 1}
+    assert store.get("b").payload == {"n": 20}
+    assert store.get("c") is None
+    assert [r.id for r in store.search(query="", vectors=[0.0, 1.0], limit=1)] in (["a"], ["b"])
+    with pytest.raises(ValueError):
+        store.bulk_update([{"vector_id": "missing", "payload": {}}])
+
+
+def test_bulk_operations_replay_from_log():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2, persistence="manual")
+        store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"n": 1}, {"n": 2}], ids=["a", "b"])
+        store.bulk_update([{"vector_id": "a", "payload": {"n": 3}}])
+        store.bulk_delete(["b"])
+        store.payloads.close()
+
+        recovered = FAISS(collection_name="test_collection", path=path, embedding_model_dims=2)
+        assert recovered.get("a").payload == {"n": 3}
+        assert recovered.get("b") is None
+
+
+def _random_vectors(n, d=8, seed=0):
+    return np.random.default_rng(seed).random((n, d), dtype=np.float32).tolist()
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"index_type": "hnsw"},
+        {"index_type": "hnsw", "compression": "sq8", "train_min_vectors": 50},
+        {"index_type": "ivf", "ivf_nlist": 4, "train_min_vectors": 50},
+        {"index_type": "ivf", "compression": "pq", "ivf_nlist": 4, "pq_m": 4, "train_min_vectors": 50},
+    ],
+)
+def test_approximate_index_specs(spec):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=8, **spec)
+        vectors = _random_vectors(300)
+        payloads = [{"user_id": "a" if i % 2 else "b"} for i in range(300)]
+        store.insert(vectors=vectors, payloads=payloads, ids=[f"m{i}" for i in range(300)])
+        if store._rebuild_thread is not None:
+            store._rebuild_thread.join()
+        assert store.col_info()["index_type"] == spec["index_type"]
+
+        store.delete("m10")
+        results = store.search(query="", vectors=vectors[10], limit=3, filters={"user_id": "b"})
+        assert results and all(r.payload["user_id"] == "b" for r in results)
+        assert "m10" not in [r.id for r in results]
+
+        reloaded = FAISS(collection_name="test_collection", path=path, embedding_model_dims=8, **spec)
+        assert reloaded.col_info()["count"] == 299
+        assert reloaded.get("m20").payload == {"user_id": "b"}
+        assert reloaded.search(query="", vectors=vectors[20], limit=1)[0].id == "m20"
+
+
+def test_index_needing_training_stays_flat_until_enough_vectors():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(
+            collection_name="test_collection",
+            path=path,
+            embedding_model_dims=8,
+            index_type="ivf",
+            ivf_nlist=2,
+            train_min_vectors=20,
+        )
+        vectors = _random_vectors(30)
+        with patch.object(store, "rebuild") as mock_rebuild:
+            store.insert(vectors=vectors[:10], ids=[f"m{i}" for i in range(10)])
+            assert store.col_info()["index_type"] == "flat"
+            mock_rebuild.assert_not_called()
+
+            store.insert(vectors=vectors[10:], ids=[f"m{i}" for i in range(10, 30)])
+            mock_rebuild.assert_called_once_with(background=True)
+
+        store.rebuild(background=False)
+        assert isinstance(store.index, faiss.IndexIVFFlat)
+        assert store.search(query="", vectors=vectors[25], limit=1)[0].id == "m25"
+
+
+def test_spec_change_rebuilds_existing_index():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=8)
+        vectors = _random_vectors(20)
+        store.insert(vectors=vectors, ids=[f"m{i}" for i in range(20)])
+
+        reloaded = FAISS(collection_name="test_collection", path=path, embedding_model_dims=8, index_type="hnsw")
+        reloaded._rebuild_thread.join()
+        assert reloaded.col_info() == {
+            "name": "test_collection",
+            "count": 20,
+            "dimension": 8,
+            "distance": "euclidean",
+            "index_type": "hnsw",
+        }
+        assert reloaded.search(query="", vectors=vectors[5], limit=1)[0].id == "m5"
+
+
+@pytest.mark.parametrize("exact_search_max_ids", [2048, 0])
+def test_selective_hnsw_search_returns_every_match(exact_search_max_ids):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(
+            collection_name="test_collection", path=path, embedding_model_dims=8, index_type="hnsw", hnsw_m=4
+        )
+        store.hnsw_exact_search_max_ids = exact_search_max_ids
+        vectors = np.random.default_rng(0).normal(size=(3000, 8)).astype("float32")
+        # One row in 300 belongs to "alice"; the default efSearch of 16 stops short of most of them
+        payloads = [{"user_id": "alice" if i % 300 == 0 else "bob"} for i in range(3000)]
+        store.insert(vectors=vectors.tolist(), payloads=payloads, ids=[f"m{i}" for i in range(3000)])
+
+        alice = [i for i in range(3000) if i % 300 == 0]
+        distances = ((vectors[alice] - vectors[5]) ** 2).sum(axis=1)
+        expected = [f"m{alice[i]}" for i in np.argsort(distances)[:5]]
+        results = store.search(query="", vectors=vectors[5].tolist(), limit=5, filters={"user_id": "alice"})
+        assert [r.id for r in results] == expected
+        (batch,) = store.search_batch(["q"], [vectors[5].tolist()], limit=5, filters={"user_id": "alice"})
+        assert [r.id for r in batch] == expected
+
+
+def test_hnsw_compaction_rebuilds_without_tombstones():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "faiss")
+        store = FAISS(collection_name="test_collection", path=path, embedding_model_dims=8, index_type="hnsw")
+        store.insert(vectors=_random_vectors(10), ids=[f"m{i}" for i in range(10)])
+
+        with patch.object(store, "_maybe_compact"):
+            store.delete("m0")
+            store.delete("m1")
+        assert store.compact() == 2
+        assert store.index.ntotal == 8
+        assert store.payloads.tombstone_count() == 0
+
+
+def test_payload_store_columns_and_blob():
+    store = PayloadStore()
+    store.batch_size = 2  # exercise chunked reads
+    payloads = {
+        "m1": {"data": "likes tea", "user_id": "alice", "hash": "h1", "metadata": {"tags": ["a"]}},
+        "m2": {"data": "likes coffee", "user_id": 7},
+        "m3": {"data": "has a cat", "user_id": "alice", "agent_id": "bot", "created_at": None},
+    }
+    store.put_many([(vector_id, i, payload) for i, (vector_id, payload) in enumerate(payloads.items())])
+
+    # Only string values are lifted into columns; everything else round-trips through the JSON blob
+    assert {vector_id: store.get(vector_id) for vector_id in payloads} == payloads
+    assert store.index_ids({"user_id": ["alice"]}) == [0, 2]
+    assert store.index_ids({"user_id": ["alice"], "agent_id": ["bot"]}) == [2]
+    assert [vector_id for vector_id, _ in store.iter_rows()] == ["m1", "m2", "m3"]
+    assert store.get_by_index_ids([2, 5]) == {2: ("m3", payloads["m3"])}
+
+    store.set_payload("m1", {"data": "likes green tea", "user_id": "bob"})
+    assert store.index_ids({"user_id": ["alice"]}) == [2]
+    assert store.index_ids_for(["m1", "missing"]) == {"m1": 0}
+    assert store.remove("m1") == 0
+    assert store.remove("m1") is None
+
+
+def test_payloads_survive_reopen_without_loading(real_faiss_store):
+    store = real_faiss_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"user_id": "a"}, {"user_id": "b"}], ids=["m1", "m2"])
+
+    with patch.object(PayloadStore, "iter_rows") as mock_iter, patch.object(PayloadStore, "index_ids") as mock_ids:
+        reloaded = FAISS(collection_name="test_collection", path=store.path, embedding_model_dims=2)
+        mock_iter.assert_not_called()
+        mock_ids.assert_not_called()
+
+    assert reloaded.get("m2").payload == {"user_id": "b"}
+    assert [r.id for r in reloaded.search(query="", vectors=[0.0, 1.0], limit=1)] == ["m2"]
+    assert os.path.exists(f"{store.path}/test_collection.db")
+
+
+@pytest.fixture
+def sharded_store():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ShardedFAISS(
+            collection_name="test_collection",
+            path=os.path.join(temp_dir, "faiss"),
+            embedding_model_dims=2,
+            shard_by="user_id",
+            max_resident_shards=2,
+        )
+        yield store
+        store.delete_col()
+
+
+def test_sharded_store_routes_rows_by_user(sharded_store):
+    store = sharded_store
+    assert isinstance(store, ShardedFAISS)
+    store.insert(
+        vectors=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0], [0.5, 0.5]],
+        payloads=[{"user_id": "alice"}, {"user_id": "bob"}, {"user_id": "carol"}, {"agent_id": "bot"}],
+        ids=["a1", "b1", "c1", "n1"],
+    )
+
+    assert store.col_info()["count"] == 4
+    assert store.col_info()["shards"] == 4
+    assert len(store._resident) == 2  # older shards were flushed and unloaded
+
+    with patch.object(FAISS, "search", autospec=True, side_effect=FAISS.search) as mock_search:
+        results = store.search(query="", vectors=[1.0, 0.0], limit=5, filters={"user_id": "bob"})
+    assert [r.id for r in results] == ["b1"]
+    assert mock_search.call_count == 1
+
+    # Unscoped searches visit every shard and merge by score
+    assert [r.id for r in store.search(query="", vectors=[1.0, 0.0], limit=2)] == ["a1", "b1"]
+    assert store.get("c1").payload == {"user_id": "carol"}
+    assert {r.id for r in store.list(filters={"user_id": ["alice", "carol"]})[0]} == {"a1", "c1"}
+
+
+def test_sharded_store_moves_updated_rows_and_deletes(sharded_store):
+    store = sharded_store
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"user_id": "alice"}, {"user_id": "bob"}], ids=["m1", "m2"])
+
+    store.update("m1", payload={"user_id": "bob", "data": "moved"})
+    assert store.search(query="", vectors=[1.0, 0.0], limit=5, filters={"user_id": "alice"}) == []
+    moved = store.search(query="", vectors=[1.0, 0.0], limit=1, filters={"user_id": "bob"})
+    assert [(r.id, r.payload["data"]) for r in moved] == [("m1", "moved")]
+
+    store.delete("m2")
+    assert store.get("m2") is None
+    assert store.col_info()["count"] == 1
+
+    reopened = ShardedFAISS(collection_name="test_collection", path=store.path, embedding_model_dims=2)
+    assert reopened.get("m1").payload == {"user_id": "bob", "data": "moved"}
+
+
+def test_sharded_store_hash_buckets():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ShardedFAISS(
+            collection_name="test_collection",
+            path=os.path.join(temp_dir, "faiss"),
+            embedding_model_dims=2,
+            shard_by="user_id",
+            shard_buckets=2,
+        )
+        store.insert(
+            vectors=[[float(i), 1.0] for i in range(10)],
+            payloads=[{"user_id": f"user-{i}"} for i in range(10)],
+            ids=[f"m{i}" for i in range(10)],
+        )
+        assert store.col_info()["shards"] <= 2
+        results = store.search(query="", vectors=[3.0, 1.0], limit=5, filters={"user_id": "user-3"})
+        assert [r.id for r in results] == ["m3"]
+
+
+def test_factory_creates_sharded_store_for_shard_by():
+    from mem0.configs.vector_stores.faiss import FAISSConfig
+    from mem0.utils.factory import VectorStoreFactory
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = FAISSConfig(
+            collection_name="test_collection", path=os.path.join(temp_dir, "faiss"), embedding_model_dims=2
+        )
+        assert type(VectorStoreFactory.create("faiss", config)) is FAISS
+        sharded = VectorStoreFactory.create("faiss", config.model_copy(update={"shard_by": "user_id"}))
+        assert isinstance(sharded, ShardedFAISS)
+
+    with pytest.raises(ValueError):
+        FAISS(collection_name="test_collection", embedding_model_dims=2, shard_by="user_id")
+
+
+def test_sharded_store_does_not_wait_for_rebuilding_shards(sharded_store):
+    store = sharded_store
+    store.insert(vectors=[[1.0, 0.0]], payloads=[{"user_id": "alice"}], ids=["a1"])
+    rebuilding = next(iter(store._resident.values()))
+    rebuilding._rebuild_thread = Mock(is_alive=Mock(return_value=True))
+
+    store.insert(
+        vectors=[[0.0, 1.0], [0.5, 0.5]], payloads=[{"user_id": "bob"}, {"user_id": "carol"}], ids=["b1", "c1"]
+    )
+    assert rebuilding in store._resident.values()
+    rebuilding._rebuild_thread.join.assert_not_called()
+    assert len(store._resident) == 2
+
+    rebuilding._rebuild_thread = None
+    assert store.get("a1").payload == {"user_id": "alice"}
+
+
+def test_sharded_store_calls_do_not_wait_for_other_shards(sharded_store):
+    store = sharded_store
+    assert not isinstance(store, FAISS)
+    store.insert(vectors=[[1.0, 0.0], [0.0, 1.0]], payloads=[{"user_id": "alice"}, {"user_id": "bob"}], ids=["a1", "b1"])
+
+    with store._leased(store._shard_name("alice")) as alice:
+        with alice._lock:
+            # Another thread can search and write bob's shard while alice's is busy
+            worker = threading.Thread(
+                target=lambda: (
+                    store.search(query="", vectors=[0.0, 1.0], limit=1, filters={"user_id": "bob"}),
+                    store.insert(vectors=[[0.5, 0.5]], payloads=[{"user_id": "carol"}], ids=["c1"]),
+                )
+            )
+            worker.start()
+            worker.join(5)
+            assert not worker.is_alive()
+        # The leased shard stays loaded past max_resident_shards
+        assert alice in store._resident.values()
+
+    store.insert(vectors=[[0.2, 0.8]], payloads=[{"user_id": "dave"}], ids=["d1"])
+    assert len(store._resident) == 2
+    assert store.get("a1").payload == {"user_id": "alice"}
+
+
+def test_sharded_store_bulk_operations(sharded_store):
+    store = sharded_store
+    store.insert(
+        vectors=[[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]],
+        payloads=[{"user_id": "alice"}, {"user_id": "bob"}, {"user_id": "carol"}],
+        ids=["m1", "m2", "m3"],
+    )
+
+    assert [r.id if r else None for r in store.bulk_get(["m3", "nope", "m1"])] == ["m3", None, "m1"]
+
+    store.bulk_update(
+        [{"vector_id": "m1", "payload": {"user_id": "alice", "n": 1}}, {"vector_id": "m2", "payload": {"user_id": "carol"}}]
+    )
+    assert store.get("m1").payload == {"user_id": "alice", "n": 1}
+    assert [r.id for r in store.list(filters={"user_id": "carol"})[0]] == ["m3", "m2"]
+
+    store.bulk_delete(["m1", "m3"])
+    assert store.bulk_get(["m1", "m2", "m3"])[0] is None
+    assert store.col_info()["count"] == 1
@@ -1,8 +1,8 @@
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
     Distance,
     Filter,
@@ -298,3 +298,31 @@ class TestQdrant(unittest.TestCase):
 
     def tearDown(self):
         del self.qdrant
+
+
+class TestAsyncQdrant(unittest.IsolatedAsyncioTestCase):
+    def test_user_client_has_no_native_async(self):
+        qdrant = Qdrant(collection_name="c", embedding_model_dims=2, client=MagicMock(spec=QdrantClient))
+        self.assertFalse(qdrant.supports_async)
+
+    async def test_remote_store_uses_async_client(self):
+        with patch("mem0.vector_stores.qdrant.QdrantClient") as client_cls, patch(
+            "mem0.vector_stores.qdrant.AsyncQdrantClient"
+        ) as async_client_cls:
+            client_cls.return_value.get_collections.return_value = MagicMock(collections=[])
+            async_client = MagicMock(spec=AsyncQdrantClient)
+            async_client.query_points = AsyncMock(return_value=MagicMock(points=["hit"]))
+            async_client.upsert = AsyncMock()
+            async_client_cls.return_value = async_client
+
+            qdrant = Qdrant(collection_name="c", embedding_model_dims=2, url="http://qdrant:6333", api_key="key")
+            self.assertTrue(qdrant.supports_async)
+
+            await qdrant.ainsert(vectors=[[0.1, 0.2]], payloads=[{"user_id": "u"}], ids=["id1"])
+            results = await qdrant.asearch(query="", vectors=[0.1, 0.2], limit=1, filters={"user_id": "u"})
+
+        async_client_cls.assert_called_once_with(api_key="key", url="http://qdrant:6333")
+        self.assertEqual(results, ["hit"])
+        self.assertEqual(async_client.upsert.await_args.kwargs["points"][0].id, "id1")
+        self.assertIsInstance(async_client.query_points.await_args.kwargs["query_filter"], Filter)
+        client_cls.return_value.upsert.assert_not_called()